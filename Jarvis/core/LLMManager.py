@@ -1,8 +1,14 @@
 # Jarvis/core/LLMManager.py
 
-from typing import Optional
+import asyncio
+import concurrent.futures
+import threading
+import time
+import weakref
+from typing import Dict, Iterator, List, Optional
 from Jarvis.core.errors import LLMUnavailable, LLMExecutionError
-from Jarvis.core.llm_contract import LLMVerbosity
+from Jarvis.core.llm_contract import DEFAULT_TEMPERATURE, LLMRequest, LLMVerbosity, as_llm, as_response
+from Jarvis.core.llm_hedging import HedgeFailed, ahedged_call, hedged_stream
 
 SYSTEM_PROMPT = (
     "Você é o JARVIS, um sistema de assistência arquitetural avançado. "
@@ -18,18 +24,95 @@ SYSTEM_PROMPT = (
     "Responda à pergunta do usuário agindo conforme essa identidade."
 )
 
+# Chamadas simultâneas por provider (semáforo do LLMManager)
+MAX_CONCURRENCY = 4
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Event loop compartilhado, numa thread própria, onde a API síncrona
+    executa as corrotinas. Um único loop permite que chamadas vindas
+    de várias threads (ex.: resumos em paralelo) dividam os mesmos
+    clientes async e semáforos.
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="llm-loop", daemon=True).start()
+        return _loop
+
+
+def run_sync(coro):
+    """Executa a corrotina no loop de fundo e espera o resultado."""
+    loop = _background_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("API síncrona do LLMManager chamada de dentro do próprio loop; use agenerate().")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
 class LLMManager:
     """
     Orquestra provedor(es) de linguagem.
     Insere um prompt de sistema institucional forte,
     aplica fallback quando necessário,
     e retorna apenas texto pronto para a camada superior.
+
+    Com `cache` (LLMResponseCache), respostas de modos determinísticos
+    são reaproveitadas sem chamar o provider; no modo dev o cabeçalho
+    indica os acertos.
+
+    Com `health` (LLMHealth), cada chamada alimenta a janela de latência
+    e erros do provider; um provider com o circuito aberto é pulado
+    direto (sem pagar o timeout dele) até a chamada de teste do
+    half-open.
+
+    Com `hedge` (HedgePolicy) ligado, nos modos da política, se o
+    primário não responder dentro do p95 recente dele, a mesma chamada
+    também vai para o fallback e vale a primeira resposta.
+
+    A geração é assíncrona (agenerate): providers com cliente async
+    são chamados direto, os demais numa thread, e cada provider tem um
+    semáforo de `max_concurrency` chamadas simultâneas. generate() é
+    um invólucro síncrono sobre agenerate().
+
+    Todo provider fala o contrato LLMRequest / LLMResponse; os do
+    formato antigo (`generate(prompt, mode=...)`) são embrulhados no
+    PromptLLMAdapter uma vez, no registro.
     """
 
-    def __init__(self, primary_llm=None, fallback_llm=None, context=None):
-        self.primary_llm = primary_llm
-        self.fallback_llm = fallback_llm
+    def __init__(
+        self,
+        primary_llm=None,
+        fallback_llm=None,
+        context=None,
+        cache=None,
+        health=None,
+        hedge=None,
+        max_concurrency: int = MAX_CONCURRENCY,
+    ):
+        self.primary_llm = as_llm(primary_llm) if primary_llm is not None else None
+        self.fallback_llm = as_llm(fallback_llm) if fallback_llm is not None else None
         self.context = context
+        self.cache = cache
+        self.health = health
+        self.hedge = hedge
+        self.max_concurrency = max_concurrency
+        # Semáforos por event loop e por provider
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        # Tempo até o primeiro token do último stream (segundos)
+        self.last_ttft: Optional[float] = None
 
     def available(self) -> bool:
         """
@@ -37,90 +120,363 @@ class LLMManager:
         """
         return self.primary_llm is not None or self.fallback_llm is not None
 
+    def healthy(self) -> bool:
+        """
+        Se algum LLM configurado pode atender agora (circuito fechado,
+        ou aberto mas já pronto para a chamada de teste).
+        """
+        if not self.available():
+            return False
+        if self.health is None:
+            return True
+        return self.health.any_available(self._name(llm) for llm in self._configured())
+
     def generate(self, prompt: str, mode: str = "default") -> str:
         """
         Gera resposta usando o LLM primário, com fallback automático.
         O prompt da aplicação já deve incluir instruções contextuais.
         """
+        return run_sync(self.agenerate(prompt, mode))
+
+    def generate_many(self, prompts: List[str], mode: str = "default", return_exceptions: bool = False) -> list:
+        """
+        Várias gerações em paralelo (limitadas pelo semáforo de cada
+        provider). Com `return_exceptions`, a falha de um prompt vem no
+        lugar da resposta dele em vez de derrubar o lote.
+        """
+        return run_sync(self.agenerate_many(prompts, mode, return_exceptions))
+
+    def submit(self, prompt: str, mode: str = "default") -> concurrent.futures.Future:
+        """
+        Como generate(), sem bloquear: agenda a geração no loop de fundo
+        e devolve o Future da resposta. Quantas rodam de fato é limitado
+        pelo semáforo de cada provider.
+        """
+        return asyncio.run_coroutine_threadsafe(self.agenerate(prompt, mode), _background_loop())
+
+    async def agenerate(self, prompt: str, mode: str = "default") -> str:
+        """Versão assíncrona de generate()."""
         if not self.available():
             raise LLMUnavailable("Nenhum LLM disponível para execução.")
 
+        cached = self._cache_lookup(prompt, mode)
+        if cached is not None:
+            return cached
+
+        if self._should_hedge(mode):
+            llm, text = await self._agenerate_hedged(prompt, mode)
+        else:
+            llm, text = await self._agenerate_any(prompt, mode)
+        self._cache_store(llm, prompt, mode, text)
+        return text
+
+    async def agenerate_many(self, prompts: List[str], mode: str = "default", return_exceptions: bool = False) -> list:
+        return list(await asyncio.gather(
+            *(self.agenerate(p, mode) for p in prompts), return_exceptions=return_exceptions
+        ))
+
+    async def _agenerate_any(self, prompt: str, mode: str):
+        """
+        Primário com fallback automático, pulando providers com o
+        circuito aberto. Retorna (provider que respondeu, texto).
+        """
+        errors = []
+        for llm in self._candidates():
+            try:
+                return llm, await self._acall(llm, prompt, mode)
+            except Exception as e:
+                errors.append(e)
+
+        raise self._all_failed(errors)
+
+    async def _acall(self, llm, prompt: str, mode: str, check_health: bool = False) -> str:
+        """Uma chamada a um provider: semáforo, latência e saúde."""
+        self._check_allowed(llm, check_health)
+        async with self._semaphore(llm):
+            start = time.perf_counter()
+            try:
+                text = await self._agenerate_with(llm, prompt, mode)
+            except asyncio.CancelledError:
+                # Perdeu a corrida do hedging: não é falha do provider
+                raise
+            except Exception:
+                self._record_health(llm, start, ok=False)
+                raise
+            self._record_health(llm, start, ok=True)
+            return text
+
+    async def _agenerate_with(self, llm, prompt: str, mode: str) -> str:
+        """
+        Realiza a chamada ao provider. Providers sem cliente async usam
+        o agenerate() padrão do contrato (generate() numa thread).
+        """
+        # Erros do provider (inclusive TypeError) sobem como vieram
+        response = await llm.agenerate(self._request(llm, prompt, mode))
         try:
-            return self._generate_with(self.primary_llm, prompt, mode)
-        except Exception as e:
-            # Log ou print opcional aqui
-            # print(f"[LLMManager] Primário falhou: {e}")
-            
-            if not self.fallback_llm:
-                # Sem fallback → erro definitivo
-                raise LLMExecutionError(
-                    f"Falha no LLM primário e fallback indisponível: {e}"
-                )
-            # Tenta fallback
+            return as_response(response).text
+        except TypeError as e:
+            raise LLMExecutionError(f"LLM retornou formato inesperado: {e}")
+
+    def _request(self, llm, prompt: str, mode: str) -> LLMRequest:
+        """Requisição com o system prompt institucional separado do prompt."""
+        temperature = self._temperature(llm)
+        return LLMRequest(
+            prompt=prompt,
+            mode=mode,
+            system=SYSTEM_PROMPT,
+            temperature=DEFAULT_TEMPERATURE if temperature is None else temperature,
+            verbosity=LLMVerbosity.for_mode(mode),
+        )
+
+    @staticmethod
+    def _temperature(llm) -> Optional[float]:
+        """Temperatura configurada no provider; None se ele não informa."""
+        return getattr(llm, "temperature", None)
+
+    def _semaphore(self, llm) -> asyncio.Semaphore:
+        per_loop = self._semaphores.setdefault(asyncio.get_running_loop(), {})
+        name = self._name(llm)
+        if name not in per_loop:
+            per_loop[name] = asyncio.Semaphore(self.max_concurrency)
+        return per_loop[name]
+
+    def _all_failed(self, errors: list) -> Exception:
+        if not errors:
+            return LLMUnavailable(
+                "LLMs em pausa após falhas recentes (circuit breaker); tente novamente em instantes."
+            )
+        if len(errors) == 1:
+            # Sem fallback (ou fallback em pausa) → erro definitivo
+            return LLMExecutionError(
+                f"Falha no LLM primário e fallback indisponível: {errors[0]}"
+            )
+        return LLMExecutionError(
+            f"Falha no fallback LLM: {errors[-1]}. Erro original: {errors[0]}"
+        )
+
+    def stream(self, prompt: str, mode: str = "default") -> Iterator[str]:
+        """
+        Como generate(), mas entrega a resposta em pedaços conforme o
+        provider os produz. O fallback só é acionado se o primário
+        falhar antes do primeiro token; depois disso o texto já foi
+        exibido e a falha sobe como LLMExecutionError.
+
+        O tempo até o primeiro token fica em last_ttft e, quando há
+        contexto, em execution_memory["llm_ttft_ms"]. Um acerto de cache
+        é entregue num único pedaço.
+        """
+        if not self.available():
+            raise LLMUnavailable("Nenhum LLM disponível para execução.")
+
+        # Consulta o cache já na chamada (não na primeira iteração),
+        # para que o cabeçalho renderizado antes do corpo saiba do acerto
+        cached = self._cache_lookup(prompt, mode)
+        if cached is not None:
+            return iter([cached])
+        if self._should_hedge(mode):
+            return self._stream_hedged(prompt, mode)
+        return self._stream_live(prompt, mode)
+
+    def _stream_live(self, prompt: str, mode: str) -> Iterator[str]:
+        start = time.perf_counter()
+        self.last_ttft = None
+
+        errors = []
+        for llm in self._candidates():
+            started = False
+            failed = False
+            parts = []
+            call_start = time.perf_counter()
             try:
-                # Fallback pode ser Ollama ou outro local
-                return self._generate_with(self.fallback_llm, prompt, mode)
-            except Exception as e2:
-                raise LLMExecutionError(
-                    f"Falha no fallback LLM: {e2}. Erro original: {e}"
-                )
+                for token in self._stream_with(llm, prompt, mode):
+                    if not started:
+                        started = True
+                        self._record_ttft(time.perf_counter() - start)
+                    parts.append(token)
+                    yield token
+            except Exception as e:
+                failed = True
+                if started:
+                    raise LLMExecutionError(f"Falha no LLM durante o streaming: {e}")
+                errors.append(e)
+                continue
+            finally:
+                # Também roda se o consumidor abandonar o stream no meio
+                # (GeneratorExit), o que não conta como falha do provider
+                self._record_health(llm, call_start, ok=not failed)
 
-    def _generate_with(self, llm, prompt: str, mode: str) -> str:
+            self._cache_store(llm, prompt, mode, "".join(parts))
+            return
+
+        raise self._all_failed(errors)
+
+    def _stream_with(self, llm, prompt: str, mode: str) -> Iterator[str]:
         """
-        Realiza a chamada ao provider real de LLM.
-        Adaptamos para dois cenários:
-          - providers que usam mensagens (chat)
-          - providers que usam string (prompt puro)
+        Stream de um provider. Providers sem streaming usam o stream()
+        padrão do contrato: a resposta inteira num único pedaço.
         """
+        return llm.stream(self._request(llm, prompt, mode))
+
+    # -------------------------
+    # Hedging (primário lento → fallback em paralelo)
+    # -------------------------
+    def _should_hedge(self, mode: str) -> bool:
+        return (
+            self.hedge is not None
+            and self.hedge.applies(mode)
+            and self.primary_llm is not None
+            and self.fallback_llm is not None
+        )
 
-        # Monta as instruções completas:
-        # Primeiro o system prompt, depois a query do usuário
-        final_prompt = f"{SYSTEM_PROMPT}\n\n{prompt}"
+    def _hedge_delay(self) -> float:
+        health = self.health.provider(self._name(self.primary_llm)) if self.health else None
+        return self.hedge.delay(health)
 
-        if not hasattr(llm, "generate"):
-            raise LLMExecutionError("LLM não implementa método generate().")
+    async def _agenerate_hedged(self, prompt: str, mode: str):
+        primary, fallback = self.primary_llm, self.fallback_llm
+        if self.health is not None and not self.health.allow(self._name(primary)):
+            # Primário em pausa: não há o que duplicar
+            return await self._agenerate_any(prompt, mode)
 
-        # Detecta se o provider espera um objeto ou listas de mensagens
         try:
-            response = llm.generate(final_prompt, mode=mode)
-        except TypeError:
-            # Alguns providers (como Groq) usam LLMRequest/LLMResponse
+            index, text = await ahedged_call(
+                lambda: self._acall(primary, prompt, mode),
+                lambda: self._acall(fallback, prompt, mode, check_health=True),
+                self._hedge_delay(),
+            )
+        except HedgeFailed as e:
+            raise self._all_failed(e.errors)
+        return (primary, fallback)[index], text
+
+    def _stream_hedged(self, prompt: str, mode: str) -> Iterator[str]:
+        primary, fallback = self.primary_llm, self.fallback_llm
+        if self.health is not None and not self.health.allow(self._name(primary)):
+            yield from self._stream_live(prompt, mode)
+            return
+
+        def source(llm, check_health: bool) -> Iterator[str]:
+            self._check_allowed(llm, check_health)
+            start = time.perf_counter()
+            failed = abandoned = False
             try:
-                from Jarvis.core.llm_contract import LLMRequest, LLMResponse
-            except ImportError:
-                raise LLMExecutionError("Interface de contrato de LLM não encontrada.")
+                yield from self._stream_with(llm, prompt, mode)
+            except GeneratorExit:
+                # Perdeu a corrida: latência parcial não entra na janela
+                abandoned = True
+                raise
+            except Exception:
+                failed = True
+                raise
+            finally:
+                if not abandoned:
+                    self._record_health(llm, start, ok=not failed)
+
+        start = time.perf_counter()
+        self.last_ttft = None
+        parts = []
+        winner = None
+        try:
+            for index, token in hedged_stream(
+                lambda: source(primary, False),
+                lambda: source(fallback, True),
+                self._hedge_delay(),
+            ):
+                if winner is None:
+                    winner = index
+                    self._record_ttft(time.perf_counter() - start)
+                parts.append(token)
+                yield token
+        except HedgeFailed as e:
+            raise self._all_failed(e.errors)
+        except LLMExecutionError:
+            raise
+        except Exception as e:
+            raise LLMExecutionError(f"Falha no LLM durante o streaming: {e}")
+
+        if winner is not None:
+            self._cache_store((primary, fallback)[winner], prompt, mode, "".join(parts))
+
+    def _check_allowed(self, llm, check_health: bool) -> None:
+        if check_health and self.health is not None and not self.health.allow(self._name(llm)):
+            raise LLMUnavailable(f"{self._name(llm)} em pausa após falhas recentes (circuit breaker).")
+
+    # -------------------------
+    # Saúde dos providers
+    # -------------------------
+    def _configured(self) -> list:
+        return [llm for llm in (self.primary_llm, self.fallback_llm) if llm is not None]
+
+    def _candidates(self) -> Iterator:
+        """
+        Providers na ordem de preferência, pulando os de circuito
+        aberto. Avaliado sob demanda: o fallback só é consultado (e só
+        reserva a chamada de teste) se o primário falhar.
+        """
+        for llm in self._configured():
+            if self.health is None or self.health.allow(self._name(llm)):
+                yield llm
+
+    @staticmethod
+    def _name(llm) -> str:
+        # Adaptadores levam o nome do provider embrulhado
+        return getattr(llm, "name", None) or type(llm).__name__
+
+    def _record_health(self, llm, start: float, ok: bool) -> None:
+        if self.health is not None:
+            self.health.record(self._name(llm), time.perf_counter() - start, ok)
 
-            # Mapear 'mode' para 'verbosity' do contrato quando possível
-            verbosity = LLMVerbosity.NORMAL
+    # -------------------------
+    # Cache de respostas
+    # -------------------------
+    def _cache_keys(self, llm, prompt: str, mode: str):
+        """(escopo, chave) do prompt neste provider, ou None se não cacheável."""
+        if self.cache is None or llm is None:
+            return None
+        # A temperatura real do provider: com 0, qualquer modo é cacheável
+        temperature = self._temperature(llm)
+        if not self.cache.cacheable(mode, temperature):
+            return None
+        scope = self.cache.scope_for(
+            self._name(llm), getattr(llm, "model", ""), temperature, SYSTEM_PROMPT
+        )
+        return scope, self.cache.key_for(scope, f"{mode}\n{prompt}")
+
+    def _cache_lookup(self, prompt: str, mode: str) -> Optional[str]:
+        """
+        Procura a resposta de qualquer provider configurado (primário
+        primeiro). Marca execution_memory["llm_cache"] com hit/miss.
+        """
+        looked_up = False
+        for llm in (self.primary_llm, self.fallback_llm):
+            keys = self._cache_keys(llm, prompt, mode)
+            if keys is None:
+                continue
+            looked_up = True
             try:
-                if isinstance(mode, str):
-                    mode_l = mode.lower()
-                    if mode_l in LLMVerbosity._value2member_map_:
-                        verbosity = LLMVerbosity(mode_l)
+                text = self.cache.get(keys[1])
             except Exception:
-                verbosity = LLMVerbosity.NORMAL
+                return None  # cache com problema não impede a geração
+            if text is not None:
+                self._remember("llm_cache", "hit")
+                return text
+        if looked_up:
+            self._remember("llm_cache", "miss")
+        return None
 
-            # Recria o request com texto e regras (sem passar 'mode' inválido)
-            request = LLMRequest(
-                system_rules=SYSTEM_PROMPT,
-                prompt=prompt,
-                verbosity=verbosity
-            )
-            resp = llm.generate(request)
-            # pode retornar LLMResponse ou string
-            if isinstance(resp, LLMResponse):
-                return resp.text
-            if isinstance(resp, str):
-                return resp
-            raise LLMExecutionError("LLM retornou formato inesperado.")
-
-        # Se chegou aqui, response pode ser string ou LLMResponse (dependendo se caiu no except TypeError ou não)
-        # Duck typing: se tem atributo .text e não é string, assumimos que é um wrapper de resposta
-        if hasattr(response, "text") and not isinstance(response, str):
-            val = response.text
-            # Se .text for callable, chama (im improvável, mas defensivo)
-            if callable(val):
-                return str(val())
-            return str(val)
-
-        return response
+    def _cache_store(self, llm, prompt: str, mode: str, text) -> None:
+        keys = self._cache_keys(llm, prompt, mode)
+        if keys is None or not isinstance(text, str):
+            return
+        try:
+            self.cache.put(keys[1], keys[0], text)
+        except Exception:
+            pass
+
+    def _remember(self, key: str, value) -> None:
+        memory = getattr(self.context, "execution_memory", None)
+        if memory is not None:
+            memory.set(key, value)
+
+    def _record_ttft(self, elapsed: float) -> None:
+        self.last_ttft = elapsed
+        self._remember("llm_ttft_ms", round(elapsed * 1000))
@@ -1,6 +1,6 @@
 # Jarvis/core/answer_pipeline.py
 
-from typing import Optional, List
+from typing import Iterable, Iterator, Optional, List
 from Jarvis.core.errors import (
     InvalidAnswerOrigin,
 )
@@ -34,6 +34,42 @@ class AnswerPipeline:
 
         return "\n\n".join(part for part in (header, body, footer) if part)
 
+    def stream(
+        self,
+        chunks: Iterable[str],
+        origin: str,
+        confidence: float,
+        explainable: bool = False,
+        sources: Optional[List[str]] = None,
+    ) -> Iterator[str]:
+        """
+        Versão incremental de build(): emite o cabeçalho, repassa os
+        pedaços do corpo conforme chegam e fecha com o rodapé (fontes,
+        nota de explicabilidade e, no modo dev, o tempo até o primeiro
+        token).
+        """
+        self._validate_origin(origin)
+
+        header = self._render_header(origin, confidence)
+        if header:
+            yield header + "\n\n"
+
+        started = False
+        for chunk in chunks:
+            if not started:
+                # equivalente ao strip() de build() no início do corpo
+                chunk = chunk.lstrip()
+                if not chunk:
+                    continue
+                started = True
+            yield chunk
+
+        footer = self._render_footer(origin, sources, explainable)
+        ttft = self._render_ttft()
+        tail = "\n".join(part for part in (footer, ttft) if part)
+        if tail:
+            yield "\n\n" + tail
+
     def build_from_result(self, result) -> str:
         """
         Compat layer para ActionResult/objetos similares.
@@ -92,9 +128,21 @@ class AnswerPipeline:
         Cabeçalho institucional. No modo dev exibe origem e confiança.
         """
         if getattr(self.context, "dev_mode", False):
-            return f"[Jarvis • origem={origin} • confiança={confidence:.2f}]"
+            memory = getattr(self.context, "execution_memory", None)
+            cache = memory.get("llm_cache") if memory is not None else None
+            suffix = f" • cache={cache}" if cache else ""
+            return f"[Jarvis • origem={origin} • confiança={confidence:.2f}{suffix}]"
         return "🤖 Jarvis"
 
+    def _render_ttft(self) -> Optional[str]:
+        if not getattr(self.context, "dev_mode", False):
+            return None
+        memory = getattr(self.context, "execution_memory", None)
+        ttft = memory.get("llm_ttft_ms") if memory is not None else None
+        if ttft is None:
+            return None
+        return f"[primeiro token em {ttft} ms]"
+
     def _render_footer(self, origin: str, sources: Optional[List[str]], explainable: bool) -> Optional[str]:
         lines: List[str] = []
 
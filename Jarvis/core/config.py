@@ -22,6 +22,9 @@ class Config:
 
         self.OLLAMA_MODEL: str = os.getenv("OLLAMA_MODEL", "phi3:mini")
 
+        # Temperatura dos providers (0 = determinístico, sempre cacheável)
+        self.LLM_TEMPERATURE: float = float(os.getenv("JARVIS_LLM_TEMPERATURE", "0.7"))
+
         # Flags gerais
         self.allow_web: bool = self._get_bool("JARVIS_ALLOW_WEB", default=True)
         self.allow_llm: bool = self._get_bool("JARVIS_ALLOW_LLM", default=True)
@@ -29,6 +32,34 @@ class Config:
         # Outros parâmetros (padrões sensatos)
         self.WEB_TIMEOUT_SECONDS: int = int(os.getenv("JARVIS_WEB_TIMEOUT", "10"))
         self.WEB_CACHE_TTL_SECONDS: int = int(os.getenv("JARVIS_WEB_CACHE_TTL", "3600"))
+        self.WEB_POOL_MAXSIZE: int = int(os.getenv("JARVIS_WEB_POOL_MAXSIZE", "4"))
+
+        # Deep fetch: baixa as páginas dos melhores resultados para o RAG
+        self.WEB_DEEP_FETCH: bool = self._get_bool("JARVIS_WEB_DEEP_FETCH", default=False)
+        self.WEB_DEEP_FETCH_PAGES: int = int(os.getenv("JARVIS_WEB_DEEP_FETCH_PAGES", "3"))
+        self.WEB_PAGE_MAX_BYTES: int = int(os.getenv("JARVIS_WEB_PAGE_MAX_BYTES", str(512 * 1024)))
+
+        # Cache persistente de respostas do LLM (modos determinísticos)
+        self.LLM_CACHE: bool = self._get_bool("JARVIS_LLM_CACHE", default=True)
+        self.LLM_CACHE_TTL_SECONDS: int = int(os.getenv("JARVIS_LLM_CACHE_TTL", str(24 * 3600)))
+        self.LLM_CACHE_MODES: str = os.getenv("JARVIS_LLM_CACHE_MODES", "rag,summary")
+
+        # Circuit breaker dos providers: pausa após falhas seguidas
+        self.LLM_BREAKER_COOLDOWN_SECONDS: float = float(os.getenv("JARVIS_LLM_BREAKER_COOLDOWN", "30"))
+
+        # Chamadas simultâneas por provider de LLM
+        self.LLM_MAX_CONCURRENCY: int = int(os.getenv("JARVIS_LLM_MAX_CONCURRENCY", "4"))
+
+        # Hedging: se o primário passar do p95 dele, duplica no fallback
+        self.LLM_HEDGING: bool = self._get_bool("JARVIS_LLM_HEDGING", default=False)
+        self.LLM_HEDGE_MODES: str = os.getenv("JARVIS_LLM_HEDGE_MODES", "default")
+        self.LLM_HEDGE_DELAY_SECONDS: float = float(os.getenv("JARVIS_LLM_HEDGE_DELAY", "2.0"))
+
+        # Exibe a resposta do LLM token a token no CLI
+        self.STREAM_OUTPUT: bool = self._get_bool("JARVIS_STREAM_OUTPUT", default=True)
+
+        # Chamadas simultâneas ao LLM ao resumir documentos longos
+        self.SUMMARY_CONCURRENCY: int = int(os.getenv("JARVIS_SUMMARY_CONCURRENCY", "4"))
 
         # Senha para entrar no Dev Mode (pode ser definida via env)
         # Valor padrão 'changeme' é intencionalmente inseguro para alertar o usuário.
@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from Jarvis.core.memory.execution_memory import ExecutionMemory
 
 
@@ -20,12 +20,17 @@ class ExecutionContext:
         # Flags simples de runtime
         self.dev_mode: bool = False
         self.offline: bool = False
-        self.llm_available: bool = True
+        # None = segue a saúde do LLM (ver llm_available)
+        self._llm_available: Optional[bool] = None
 
         # Memórias baseadas na implementação oficial
         self.execution_memory: ExecutionMemory = ExecutionMemory()
         self.temp_memory: TempMemory = TempMemory()
 
+        # Serviços compartilhados (definidos no bootstrap)
+        self.llm: Optional[Any] = None
+        self.config: Optional[Any] = None
+
         # Extras (logs, dados transientes)
         self.extra: Dict[str, Any] = {}
 
@@ -35,6 +40,22 @@ class ExecutionContext:
             f"llm_available={self.llm_available}>"
         )
 
+    @property
+    def llm_available(self) -> bool:
+        """
+        Disponibilidade do LLM. Se definida explicitamente, vale o
+        valor fixo; senão reflete a saúde ao vivo do LLMManager
+        (providers com circuito aberto contam como indisponíveis).
+        """
+        if self._llm_available is not None:
+            return self._llm_available
+        healthy = getattr(self.llm, "healthy", None)
+        return healthy() if callable(healthy) else True
+
+    @llm_available.setter
+    def llm_available(self, value: Optional[bool]) -> None:
+        self._llm_available = None if value is None else bool(value)
+
     def enable_dev(self) -> None:
         self.dev_mode = True
 
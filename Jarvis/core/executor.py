@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from Jarvis.core.decision import DecisionOutcome, DecisionPath
 from Jarvis.core.action_request import ActionRequest
 from Jarvis.core.action_result import ActionResult
@@ -43,13 +45,7 @@ class Executor:
         Executa uma Decision e retorna a resposta formatada pelo AnswerPipeline.
         """
 
-        # Limpamos a memória de execução se ela existir (injeção pelo Context).
-        if self.execution_memory:
-            try:
-                self.execution_memory.clear()
-            except Exception:
-                # Não deixamos falhas de limpeza interromperem o fluxo principal.
-                pass
+        self._clear_execution_memory()
 
         # ----- decisões finais / curta-circuito -----
         if decision.path is None:
@@ -82,6 +78,80 @@ class Executor:
         # Se chegou aqui, caminho inválido
         raise InvalidAnswerOrigin(f"Caminho de execução inválido: {decision.path}")
 
+    def execute_stream(self, decision, user_input: str) -> Iterator[str]:
+        """
+        Como execute(), mas entrega a resposta formatada em pedaços.
+        Rotas que chamam o LLM (chat e RAG) são transmitidas token a
+        token; as demais chegam inteiras, num único pedaço. O contrato
+        do ActionResult é validado como em execute(), com o conteúdo
+        montado ao fim do stream (antes do rodapé).
+        """
+        streamable = decision.path in (DecisionPath.LLM, DecisionPath.PLUGIN)
+        if not streamable or not hasattr(self.llm, "stream"):
+            yield self.execute(decision, user_input)
+            return
+
+        self._clear_execution_memory()
+
+        if decision.path == DecisionPath.LLM:
+            if self.execution_memory:
+                self.execution_memory.set("origin", "llm")
+            result = ActionResult(content="", origin="llm", confidence=0.65)
+            self._validate_action_result(result, expected_origin="llm")
+            chunks = self.llm.stream(prompt=user_input, mode=decision.payload.get("mode", "default"))
+            yield from self.answer_pipeline.stream(
+                self._validated_stream(chunks, result),
+                origin="llm",
+                confidence=result.confidence,
+                explainable=True,
+            )
+            return
+
+        raw_result = self._run_plugin(decision)
+        if not decision.payload.get("temporal"):
+            yield self._plugin_answer(raw_result)
+            return
+
+        rag_prompt, sources_list = self._build_rag_prompt(user_input, raw_result)
+        if self.execution_memory:
+            self.execution_memory.set("origin", "llm")
+        result = ActionResult(
+            content="", origin="llm", confidence=getattr(raw_result, "confidence", 0.6) or 0.6
+        )
+        result.data = {"sources": sources_list or []}
+        self._validate_action_result(result, expected_origin="llm")
+        chunks = self.llm.stream(prompt=rag_prompt, mode="rag")
+        yield from self.answer_pipeline.stream(
+            self._validated_stream(chunks, result),
+            origin="llm",
+            confidence=result.confidence,
+            explainable=True,
+            sources=result.data["sources"],
+        )
+
+    def _validated_stream(self, chunks: Iterator[str], result: ActionResult) -> Iterator[str]:
+        """
+        Repassa os pedaços e, ao fim, valida o ActionResult com o texto
+        completo. Quem chama já validou origem e confiança antes de
+        exibir o cabeçalho.
+        """
+        parts = []
+        for chunk in chunks:
+            parts.append(chunk)
+            yield chunk
+        # Pedaço que não é texto deixa o conteúdo inválido para a validação
+        result.content = "".join(parts) if all(isinstance(p, str) for p in parts) else parts
+        self._validate_action_result(result, expected_origin="llm")
+
+    def _clear_execution_memory(self) -> None:
+        # Limpamos a memória de execução se ela existir (injeção pelo Context).
+        if self.execution_memory:
+            try:
+                self.execution_memory.clear()
+            except Exception:
+                # Não deixamos falhas de limpeza interromperem o fluxo principal.
+                pass
+
     # -------------------------
     # Execução LLM (simples)
     # -------------------------
@@ -117,10 +187,17 @@ class Executor:
         Executa plugin. Se payload.temporal == True, aplica RAG (Web -> LLM).
         Caso contrário, retorna resultado do plugin diretamente.
         """
+        raw_result = self._run_plugin(decision)
+
+        # Se consulta temporal: sintetizar com LLM (RAG)
+        if decision.payload.get("temporal"):
+            return self._synthesize_web_with_llm(user_query=user_input, web_result=raw_result)
+
+        return self._plugin_answer(raw_result)
 
+    def _run_plugin(self, decision) -> ActionResult:
         intent = decision.payload.get("intent")
         plugins = decision.payload.get("plugins", []) or []
-        is_temporal = bool(decision.payload.get("temporal"))
 
         if not plugins:
             raise WebRequiredButUnavailable("Nenhum plugin disponível para a intenção.")
@@ -138,11 +215,9 @@ class Executor:
 
         if not isinstance(raw_result, ActionResult):
             raise InvalidActionResult(f"Plugin {getattr(plugin, 'name', '?')} retornou tipo inválido.")
+        return raw_result
 
-        # Se consulta temporal: sintetizar com LLM (RAG)
-        if is_temporal:
-            return self._synthesize_web_with_llm(user_query=user_input, web_result=raw_result)
-
+    def _plugin_answer(self, raw_result: ActionResult) -> str:
         # Validate as response from plugin (web/plugin)
         expected_origin = "web" if getattr(raw_result, "origin", None) == "web" else "plugin"
         self._validate_action_result(raw_result, expected_origin=expected_origin)
@@ -171,7 +246,27 @@ class Executor:
         Monta um prompt composto (user_query + web_result + fontes) e chama o LLM.
         A responsabilidade de garantir voz institucional está no LLMManager (system prompt).
         """
+        rag_prompt, sources_list = self._build_rag_prompt(user_query, web_result)
+
+        # Marca origem (ciclo)
+        if self.execution_memory:
+            self.execution_memory.set("origin", "llm")
+
+        # Chama LLM com mode "rag" (LLMManager irá aplicar system prompt)
+        response_text = self.llm.generate(prompt=rag_prompt, mode="rag")
+
+        # Monta ActionResult sintetizado
+        result = ActionResult(content=response_text, origin="llm", confidence=getattr(web_result, "confidence", 0.6) or 0.6)
 
+        # Anexa fontes para AnswerPipeline exibir
+        result.data = {"sources": sources_list or []}
+
+        # Valida e retorna
+        self._validate_action_result(result, expected_origin="llm")
+        return self.answer_pipeline.build_from_result(result)
+
+    def _build_rag_prompt(self, user_query: str, web_result: ActionResult):
+        """Prompt de RAG (pergunta + resultado web + instruções) e a lista de fontes."""
         # Assegura que web_result.content é string
         web_content = web_result.content if isinstance(web_result.content, str) else str(web_result.content)
 
@@ -203,24 +298,7 @@ class Executor:
         prompt_parts.append("4. NÃO sugira que o usuário pesquise novamente; você já pesquisou.")
         prompt_parts.append("Com base nisso, resuma e responda de forma clara e prática:")
 
-        rag_prompt = "\n".join(prompt_parts)
-
-        # Marca origem (ciclo)
-        if self.execution_memory:
-            self.execution_memory.set("origin", "llm")
-
-        # Chama LLM com mode "rag" (LLMManager irá aplicar system prompt)
-        response_text = self.llm.generate(prompt=rag_prompt, mode="rag")
-
-        # Monta ActionResult sintetizado
-        result = ActionResult(content=response_text, origin="llm", confidence=getattr(web_result, "confidence", 0.6) or 0.6)
-
-        # Anexa fontes para AnswerPipeline exibir
-        result.data = {"sources": sources_list or []}
-
-        # Valida e retorna
-        self._validate_action_result(result, expected_origin="llm")
-        return self.answer_pipeline.build_from_result(result)
+        return "\n".join(prompt_parts), sources_list
 
     # -------------------------
     # Validação de contrato
@@ -0,0 +1,192 @@
+# Jarvis/core/llm_cache.py
+
+import hashlib
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Iterable, Optional
+
+from Jarvis.core.config import Config
+
+
+CACHE_FILE = Path("Jarvis/data/cache/llm_responses.sqlite")
+
+# Validade padrão de uma resposta guardada
+DEFAULT_TTL_SECONDS = 24 * 3600
+
+# Orçamento total do cache (respostas comprimidas)
+MAX_CACHE_BYTES = 32 * 1024 * 1024
+
+# Modos cuja resposta depende só do prompt (RAG sobre o mesmo conteúdo
+# web, resumos do mesmo texto). Conversa livre fica de fora por padrão.
+CACHEABLE_MODES = ("rag", "summary")
+
+
+class LLMResponseCache:
+    """
+    Cache persistente de respostas do LLM.
+
+    A chave tem duas partes:
+    - escopo: provider, modelo, temperatura e system prompt
+    - prompt: o texto do usuário (já com o contexto da aplicação)
+    A chave exata é o hash das duas; o escopo fica guardado à parte,
+    então trocar de modelo ou de system prompt simplesmente erra o
+    cache, e drop_scope() descarta de uma vez tudo o que ficou velho.
+
+    Só modos determinísticos entram (cacheable): temperatura 0 ou os
+    modos em `modes`. Entradas expiram pelo TTL e o total é limitado
+    por MAX_CACHE_BYTES com despejo LRU.
+    """
+
+    def __init__(
+        self,
+        db_path: Path = CACHE_FILE,
+        ttl: int = DEFAULT_TTL_SECONDS,
+        max_bytes: int = MAX_CACHE_BYTES,
+        modes: Iterable[str] = CACHEABLE_MODES,
+    ):
+        self.db_path = Path(db_path)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.modes = {m.strip().lower() for m in modes if m.strip()}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._init_schema()
+
+    @classmethod
+    def from_config(cls, config: Config) -> "LLMResponseCache":
+        return cls(
+            ttl=config.LLM_CACHE_TTL_SECONDS,
+            modes=config.LLM_CACHE_MODES.split(","),
+        )
+
+    # -------------------------
+    # API pública
+    # -------------------------
+    def cacheable(self, mode: str, temperature: float | None) -> bool:
+        return temperature == 0 or (mode or "").lower() in self.modes
+
+    @staticmethod
+    def scope_for(provider: str, model: str, temperature: float | None, system: str) -> str:
+        raw = "\x1f".join((provider, model or "", repr(temperature), system or ""))
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def key_for(scope: str, prompt: str) -> str:
+        return hashlib.sha256(f"{scope}\x1f{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ? AND expires_at >= ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def put(self, key: str, scope: str, response: str, ttl: int | None = None) -> None:
+        if not response or not response.strip():
+            return
+        now = time.time()
+        blob = zlib.compress(response.encode("utf-8"))
+        expires_at = now + (ttl if ttl is not None else self.ttl)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, scope, response, size_bytes, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, scope, blob, len(blob), expires_at, now),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def drop_scope(self, scope: str) -> int:
+        """Remove todas as respostas de um escopo. Retorna quantas saíram."""
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM responses WHERE scope = ?", (scope,))
+            self._conn.commit()
+            return cur.rowcount
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM responses"
+            ).fetchone()
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": entries,
+                "bytes": size,
+            }
+
+    # -------------------------
+    # Internos
+    # -------------------------
+    def _init_schema(self) -> None:
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                scope TEXT NOT NULL,
+                response BLOB NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS responses_scope ON responses (scope);
+            """
+        )
+        self._conn.commit()
+
+    def _evict(self, now: float) -> None:
+        self._conn.execute("DELETE FROM responses WHERE expires_at < ?", (now,))
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size_bytes), 0) FROM responses"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        for key, size in self._conn.execute(
+            "SELECT key, size_bytes FROM responses ORDER BY last_access"
+        ).fetchall():
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+
+_cache: LLMResponseCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache(config: Config | None = None) -> LLMResponseCache | None:
+    """
+    Instância compartilhada; None quando desligada (Config.LLM_CACHE)
+    ou quando o banco não pode ser aberto — o LLM é chamado normalmente.
+    """
+    global _cache
+    config = config or Config()
+    if not config.LLM_CACHE:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            try:
+                _cache = LLMResponseCache.from_config(config)
+            except (sqlite3.Error, OSError):
+                return None
+        return _cache
@@ -1,7 +1,12 @@
+import asyncio
 from dataclasses import dataclass
 from enum import Enum
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Iterator, Optional
+
+
+# Temperatura de quem não configura outra
+DEFAULT_TEMPERATURE = 0.7
 
 
 class LLMVerbosity(Enum):
@@ -10,11 +15,26 @@ class LLMVerbosity(Enum):
     NORMAL = "normal"
     DEBUG = "debug"
 
+    @classmethod
+    def for_mode(cls, mode: str | None) -> "LLMVerbosity":
+        """Verbosidade equivalente a um modo, quando houver; senão NORMAL."""
+        try:
+            return cls((mode or "").lower())
+        except ValueError:
+            return cls.NORMAL
+
 
 @dataclass
 class LLMRequest:
+    """
+    Contrato único de requisição para todos os providers.
+    O system prompt vai separado; cada provider decide como
+    combiná-lo (mensagem de sistema, prefixo do prompt...).
+    """
     prompt: str
-    system_rules: str
+    mode: str = "default"
+    system: Optional[str] = None
+    temperature: float = DEFAULT_TEMPERATURE
     verbosity: LLMVerbosity = LLMVerbosity.NORMAL
     max_tokens: int | None = None
     context_data: dict[str, Any] | None = None
@@ -31,3 +51,61 @@ class LLMInterface(ABC):
     @abstractmethod
     def generate(self, request: LLMRequest) -> LLMResponse:
         pass
+
+    def stream(self, request: LLMRequest) -> Iterator[str]:
+        """
+        Gera a resposta em pedaços, à medida que chegam do provider.
+        Padrão para providers sem streaming: um único pedaço.
+        """
+        yield self.generate(request).text
+
+    async def agenerate(self, request: LLMRequest) -> LLMResponse:
+        """
+        Versão assíncrona de generate(). Padrão para providers sem
+        cliente async: roda generate() numa thread.
+        """
+        return await asyncio.to_thread(self.generate, request)
+
+
+class PromptLLMAdapter(LLMInterface):
+    """
+    Adapta providers no formato antigo, `generate(prompt: str, mode=...)`
+    devolvendo texto (ou objeto com `.text`), ao contrato LLMRequest /
+    LLMResponse. O system prompt vira prefixo do prompt.
+    """
+
+    def __init__(self, provider):
+        self.provider = provider
+        self.name = type(provider).__name__
+        self.model = getattr(provider, "model", "")
+        # Providers antigos não recebem temperatura: a deles é desconhecida
+        self.temperature = getattr(provider, "temperature", None)
+
+    def generate(self, request: LLMRequest) -> LLMResponse:
+        prompt = f"{request.system}\n\n{request.prompt}" if request.system else request.prompt
+        return as_response(self.provider.generate(prompt, mode=request.mode))
+
+
+def as_llm(provider) -> LLMInterface:
+    """
+    Resolve, uma única vez (no registro do provider), como falar com
+    ele: quem implementa LLMInterface é usado direto; o resto passa
+    pelo PromptLLMAdapter.
+    """
+    if isinstance(provider, LLMInterface):
+        return provider
+    if not callable(getattr(provider, "generate", None)):
+        raise TypeError(f"Provider {type(provider).__name__} não implementa generate().")
+    return PromptLLMAdapter(provider)
+
+
+def as_response(value) -> LLMResponse:
+    """Normaliza o retorno de um provider (LLMResponse, texto ou objeto com .text)."""
+    if isinstance(value, LLMResponse):
+        return value
+    if isinstance(value, str):
+        return LLMResponse(text=value)
+    text = getattr(value, "text", None)
+    if text is not None:
+        return LLMResponse(text=str(text() if callable(text) else text))
+    raise TypeError(f"Formato de resposta inesperado: {type(value).__name__}")
@@ -0,0 +1,181 @@
+# Jarvis/core/llm_health.py
+
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, Tuple
+
+from Jarvis.core.config import Config
+
+
+# Chamadas recentes consideradas por provider (latência e erros)
+HEALTH_WINDOW = 20
+
+# O circuito abre com N falhas seguidas, ou com taxa de erro alta
+# na janela (desde que haja chamadas suficientes para julgar)
+MAX_CONSECUTIVE_FAILURES = 3
+MAX_ERROR_RATE = 0.5
+MIN_CALLS_FOR_RATE = 5
+
+# Tempo com o circuito aberto antes da chamada de teste (half-open)
+COOLDOWN_SECONDS = 30.0
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class ProviderHealth:
+    """
+    Saúde de um provider de LLM: janela das últimas chamadas
+    (latência, sucesso) e um circuit breaker.
+
+    closed     → chamadas normais
+    open       → provider pulado até passar o cooldown
+    half_open  → uma única chamada de teste; sucesso fecha o
+                 circuito, falha o reabre por mais um cooldown
+    """
+
+    def __init__(self, name: str, cooldown: float = COOLDOWN_SECONDS, window: int = HEALTH_WINDOW):
+        self.name = name
+        self.cooldown = cooldown
+        self.samples: Deque[Tuple[float, bool]] = deque(maxlen=window)
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.consecutive_failures = 0
+        self.trips = 0
+        self._probing = False
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self, now: float | None = None) -> bool:
+        """
+        Se o provider pode ser chamado agora. No half-open, só a
+        primeira chamada passa (é ela que testa o provider); se o teste
+        não reportar resultado dentro de um cooldown, outro é liberado.
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if self.state == OPEN and now - self.opened_at >= self.cooldown:
+                self.state = HALF_OPEN
+                self._probing = False
+            if self.state == CLOSED:
+                return True
+            if self.state == HALF_OPEN and (
+                not self._probing or now - self._probe_started >= self.cooldown
+            ):
+                self._probing = True
+                self._probe_started = now
+                return True
+            return False
+
+    def available(self, now: float | None = None) -> bool:
+        """
+        Se o provider está (ou pode voltar a estar) em uso: falso só
+        com o circuito aberto dentro do cooldown. Não reserva a chamada
+        de teste.
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if self.state == OPEN:
+                return now - self.opened_at >= self.cooldown
+            return True
+
+    def record(self, elapsed: float, ok: bool, now: float | None = None) -> None:
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self.samples.append((elapsed, ok))
+
+            if ok:
+                self.consecutive_failures = 0
+                if self.state != CLOSED:
+                    # Recuperado: a janela antiga não deve reabrir o circuito
+                    self.state = CLOSED
+                    self.samples.clear()
+                    self.samples.append((elapsed, ok))
+                self._probing = False
+                return
+
+            self.consecutive_failures += 1
+            if self.state == HALF_OPEN or self._should_trip():
+                self._trip(now)
+
+    def error_rate(self) -> float:
+        with self._lock:
+            return self._error_rate()
+
+    def successes(self) -> int:
+        with self._lock:
+            return sum(1 for _, ok in self.samples if ok)
+
+    def percentile(self, p: float) -> float | None:
+        with self._lock:
+            latencies = sorted(elapsed for elapsed, ok in self.samples if ok)
+        if not latencies:
+            return None
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))]
+
+    def snapshot(self) -> dict:
+        return {
+            "state": self.state,
+            "calls": len(self.samples),
+            "error_rate": self.error_rate(),
+            "consecutive_failures": self.consecutive_failures,
+            "trips": self.trips,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+        }
+
+    # -------------------------
+    # Internos
+    # -------------------------
+    def _error_rate(self) -> float:
+        if not self.samples:
+            return 0.0
+        return sum(1 for _, ok in self.samples if not ok) / len(self.samples)
+
+    def _should_trip(self) -> bool:
+        if self.consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+            return True
+        return len(self.samples) >= MIN_CALLS_FOR_RATE and self._error_rate() >= MAX_ERROR_RATE
+
+    def _trip(self, now: float) -> None:
+        self.state = OPEN
+        self.opened_at = now
+        self.trips += 1
+        self._probing = False
+
+
+class LLMHealth:
+    """Registro de ProviderHealth por nome de provider."""
+
+    def __init__(self, cooldown: float = COOLDOWN_SECONDS, window: int = HEALTH_WINDOW):
+        self.cooldown = cooldown
+        self.window = window
+        self._providers: Dict[str, ProviderHealth] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Config) -> "LLMHealth":
+        return cls(cooldown=config.LLM_BREAKER_COOLDOWN_SECONDS)
+
+    def provider(self, name: str) -> ProviderHealth:
+        with self._lock:
+            health = self._providers.get(name)
+            if health is None:
+                health = self._providers[name] = ProviderHealth(name, self.cooldown, self.window)
+            return health
+
+    def allow(self, name: str) -> bool:
+        return self.provider(name).allow()
+
+    def record(self, name: str, elapsed: float, ok: bool) -> None:
+        self.provider(name).record(elapsed, ok)
+
+    def any_available(self, names: Iterable[str]) -> bool:
+        return any(self.provider(name).available() for name in names)
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            providers = dict(self._providers)
+        return {name: health.snapshot() for name, health in providers.items()}
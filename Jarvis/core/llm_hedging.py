@@ -0,0 +1,181 @@
+# Jarvis/core/llm_hedging.py
+
+import asyncio
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, FrozenSet, Iterator, Tuple, TypeVar
+
+from Jarvis.core.config import Config
+
+
+T = TypeVar("T")
+
+# Sucessos mínimos do primário para confiar no p95 dele
+MIN_SAMPLES = 5
+
+# Nunca disparar a cópia antes disso (evita dobrar toda chamada rápida)
+MIN_DELAY_SECONDS = 0.05
+
+
+class HedgeFailed(Exception):
+    """Todas as tentativas falharam; `errors` na ordem primário, fallback."""
+
+    def __init__(self, errors: list):
+        super().__init__("; ".join(map(str, errors)))
+        self.errors = errors
+
+
+@dataclass
+class HedgePolicy:
+    """
+    Quando e quanto esperar antes de duplicar uma chamada ao LLM.
+
+    - modes: modos que aceitam hedging (conversa interativa). RAG e
+      resumos ficam de fora por padrão: são longos, cacheáveis e não
+      compensam pagar duas vezes.
+    - a espera é o p95 recente do primário (ProviderHealth); sem
+      amostras suficientes, default_delay.
+    """
+
+    enabled: bool = False
+    modes: FrozenSet[str] = field(default_factory=lambda: frozenset({"default"}))
+    default_delay: float = 2.0
+
+    @classmethod
+    def from_config(cls, config: Config) -> "HedgePolicy":
+        return cls(
+            enabled=config.LLM_HEDGING,
+            modes=frozenset(
+                m.strip().lower() for m in config.LLM_HEDGE_MODES.split(",") if m.strip()
+            ),
+            default_delay=config.LLM_HEDGE_DELAY_SECONDS,
+        )
+
+    def applies(self, mode: str) -> bool:
+        return self.enabled and (mode or "default").lower() in self.modes
+
+    def delay(self, health=None) -> float:
+        """Espera antes da cópia, a partir do p95 do primário."""
+        p95 = None
+        if health is not None and health.successes() >= MIN_SAMPLES:
+            p95 = health.percentile(0.95)
+        return max(MIN_DELAY_SECONDS, p95 if p95 is not None else self.default_delay)
+
+
+async def ahedged_call(
+    first: Callable[[], Awaitable[T]],
+    second: Callable[[], Awaitable[T]],
+    delay: float,
+) -> Tuple[int, T]:
+    """
+    Roda `first`; se não terminar em `delay` segundos (ou falhar antes),
+    roda `second` em paralelo. Retorna (índice de quem venceu, resultado)
+    do primeiro sucesso. A outra chamada é cancelada (com clientes
+    async, a requisição HTTP em curso é abortada).
+    """
+    tasks = [asyncio.ensure_future(first())]
+    done, _ = await asyncio.wait(tasks, timeout=delay)
+    if not done or tasks[0].exception() is not None:
+        tasks.append(asyncio.ensure_future(second()))
+
+    errors: Dict[int, BaseException] = {}
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index = tasks.index(task)
+                if task.exception() is None:
+                    return index, task.result()
+                errors[index] = task.exception()
+    finally:
+        for task in pending:
+            task.cancel()
+
+    raise HedgeFailed([errors[i] for i in sorted(errors)])
+
+
+def hedged_stream(
+    first: Callable[[], Iterator[str]],
+    second: Callable[[], Iterator[str]],
+    delay: float,
+) -> Iterator[Tuple[int, str]]:
+    """
+    Versão de ahedged_call para streams síncronos: o vencedor é quem entrega o
+    primeiro token. Produz (índice do vencedor, token). O perdedor é
+    cancelado entre tokens (o iterador dele é fechado), o que encerra
+    a resposta em curso nos providers que suportam streaming.
+    """
+    events: "queue.Queue[tuple]" = queue.Queue()
+    cancel = [threading.Event(), threading.Event()]
+    sources = [first, second]
+    started = [False, False]
+    errors: Dict[int, BaseException] = {}
+
+    def launch(index: int) -> None:
+        started[index] = True
+        threading.Thread(
+            target=_pump,
+            args=(index, sources[index], events, cancel[index]),
+            name=f"llm-hedge-{index}",
+            daemon=True,
+        ).start()
+
+    launch(0)
+    deadline = time.monotonic() + delay
+    winner = None
+    try:
+        while True:
+            timeout = None
+            if winner is None and not started[1]:
+                timeout = max(0.0, deadline - time.monotonic())
+            try:
+                index, kind, value = events.get(timeout=timeout)
+            except queue.Empty:
+                launch(1)
+                continue
+
+            if winner is None:
+                if kind == "error":
+                    errors[index] = value
+                    if not started[1]:
+                        launch(1)
+                    elif len(errors) == 2:
+                        raise HedgeFailed([errors[0], errors[1]])
+                    continue
+                winner = index
+                cancel[1 - index].set()
+
+            if index != winner:
+                continue
+            if kind == "token":
+                yield index, value
+            elif kind == "end":
+                return
+            else:
+                raise value
+    finally:
+        for event in cancel:
+            event.set()
+
+
+def _pump(index: int, source: Callable[[], Iterator[str]], events: queue.Queue, cancel: threading.Event) -> None:
+    iterator = None
+    try:
+        iterator = iter(source())
+        for token in iterator:
+            if cancel.is_set():
+                return
+            events.put((index, "token", token))
+        events.put((index, "end", None))
+    except Exception as e:
+        events.put((index, "error", e))
+    finally:
+        close = getattr(iterator, "close", None)
+        if cancel.is_set() and callable(close):
+            try:
+                close()
+            except Exception:
+                pass
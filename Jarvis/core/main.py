@@ -70,6 +70,16 @@ class Jarvis:
                     break
 
                 decision = self.router.route(user_input)
+
+                if getattr(self.config, "STREAM_OUTPUT", False):
+                    # Pedaços já formatados pelo AnswerPipeline
+                    try:
+                        for chunk in self.executor.execute_stream(decision, user_input):
+                            print(chunk, end="", flush=True)
+                    finally:
+                        print()
+                    continue
+
                 raw_response = self.executor.execute(decision, user_input)
 
                 # Executor/AnswerPipeline já retornam string final
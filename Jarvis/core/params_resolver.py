@@ -2,6 +2,17 @@ import re
 from Jarvis.core.intent import IntentType
 
 
+# Pedido de leitura do fim do arquivo, no começo da frase:
+# 'final de app.log', 'mostre as últimas linhas do app.log', 'tail app.log'
+TAIL_PHRASE = re.compile(
+    r"^\s*(?:(?:ler|leia|leio|mostr\w*|exib\w*|ver|veja|abr\w*)\s+)?"
+    r"(?:(?:o|a|os|as)\s+)?"
+    r"(?:(?:final|fim|(?:últim[oa]s?|ultim[oa]s?)(?:\s+\d+)?\s+(?:linhas|bytes))\s+(?:de|do|da|dos|das)\b"
+    r"|tail(?=\s))",
+    re.IGNORECASE,
+)
+
+
 class ParamsResolver:
     """
     V6 — Extrai parâmetros de forma humanizada e tolerante.
@@ -13,7 +24,10 @@ class ParamsResolver:
 
         match intent_type:
 
-            case IntentType.CONTENT_READ | IntentType.CONTENT_DELETE:
+            case IntentType.CONTENT_READ:
+                return self._resolve_read(text)
+
+            case IntentType.CONTENT_DELETE:
                 return self._resolve_single_file(text)
 
             case IntentType.CONTENT_CREATE:
@@ -109,6 +123,28 @@ class ParamsResolver:
     def _resolve_single_file(self, text: str) -> dict:
         return {"filename": self._extract_filename(text)}
 
+    def _resolve_read(self, text: str) -> dict:
+        """
+        Além do arquivo, detecta leitura parcial:
+        'bytes 100 a 500 de app.log' → range; 'final de app.log' → tail.
+        """
+        params = self._resolve_single_file(text)
+
+        byte_range = re.search(r"\bbytes?\s+(\d+)\s*(?:a|até|-)\s*(\d+)", text, re.IGNORECASE)
+        if byte_range:
+            start, end = int(byte_range.group(1)), int(byte_range.group(2))
+            if end > start:
+                params.update(mode="range", offset=start, length=end - start)
+                return params
+
+        tail = TAIL_PHRASE.match(text)
+        filename = params.get("filename")
+        # Só a frase inicial conta: 'relatório final.txt' não é tail
+        if tail and (not filename or text.find(filename) >= tail.end()):
+            params["mode"] = "tail"
+
+        return params
+
     def _resolve_write(self, text: str) -> dict:
         return {
             "filename": self._extract_filename(text),
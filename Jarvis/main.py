@@ -4,6 +4,9 @@ from Jarvis.core.bootstrap import bootstrap_env
 from Jarvis.core.config import Config
 from Jarvis.core.context import ExecutionContext
 from Jarvis.core.LLMManager import LLMManager
+from Jarvis.core.llm_cache import get_llm_cache
+from Jarvis.core.llm_health import LLMHealth
+from Jarvis.core.llm_hedging import HedgePolicy
 from Jarvis.core.router import Router
 from Jarvis.core.main import Jarvis
 from Jarvis.modules.llm.groq import GroqLLM
@@ -26,6 +29,7 @@ def main():
     context = ExecutionContext()
     context.dev_mode = config.dev_mode
     context.offline = config.offline
+    context.config = config
 
     # --- carregar plugins (registro global)
     load_plugins()
@@ -38,7 +42,9 @@ def main():
     ollama_instance = None
     if config.allow_llm:
         try:
-            ollama_instance = OllamaLLM(config={"model": config.OLLAMA_MODEL})
+            ollama_instance = OllamaLLM(
+                config={"model": config.OLLAMA_MODEL, "temperature": config.LLM_TEMPERATURE}
+            )
         except Exception as e:
             print(f"[main] ⚠️ Falha crítica ao iniciar Ollama (Baseline): {e}")
 
@@ -46,7 +52,13 @@ def main():
     groq_instance = None
     if config.GROQ_API_KEY and config.allow_llm:
         try:
-            groq_instance = GroqLLM(config={"api_key": config.GROQ_API_KEY, "model": config.GROQ_MODEL})
+            groq_instance = GroqLLM(
+                config={
+                    "api_key": config.GROQ_API_KEY,
+                    "model": config.GROQ_MODEL,
+                    "temperature": config.LLM_TEMPERATURE,
+                }
+            )
         except Exception as e:
             print(f"[main] ⚠️ Groq indisponível (continuando com fallback): {e}")
 
@@ -62,7 +74,20 @@ def main():
     else:
         print("[main] ❌ ERRO: Nenhum LLM disponível. O sistema funcionará apenas com comandos locais.")
 
-    llm_manager = LLMManager(primary_llm=primary_llm, fallback_llm=fallback_llm, context=context)
+    llm_manager = LLMManager(
+        primary_llm=primary_llm,
+        fallback_llm=fallback_llm,
+        context=context,
+        cache=get_llm_cache(config),
+        health=LLMHealth.from_config(config),
+        hedge=HedgePolicy.from_config(config),
+        max_concurrency=config.LLM_MAX_CONCURRENCY,
+    )
+    context.llm = llm_manager if llm_manager.available() else None
+    # Sem provider nenhum o LLM fica indisponível de vez; com providers,
+    # context.llm_available acompanha a saúde deles (circuit breaker)
+    if context.llm is None:
+        context.llm_available = False
 
     # --- Router / Executor / AnswerPipeline
     router = Router(context)
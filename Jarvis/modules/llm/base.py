@@ -1,22 +1,32 @@
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Optional
+import asyncio
+import weakref
+from typing import Callable, Generic, TypeVar
 
+# O contrato é único e mora no core; reexportado aqui para os providers
+from Jarvis.core.llm_contract import (  # noqa: F401
+    DEFAULT_TEMPERATURE,
+    LLMInterface,
+    LLMRequest,
+    LLMResponse,
+    LLMVerbosity,
+)
 
-@dataclass
-class LLMRequest:
-    prompt: str
-    mode: str = "default"
-    system: Optional[str] = None
-    temperature: float = 0.7
+T = TypeVar("T")
 
 
-@dataclass
-class LLMResponse:
-    text: str
+class LoopLocal(Generic[T]):
+    """
+    Um objeto por event loop, criado sob demanda. Clientes HTTP
+    assíncronos (httpx) ficam presos ao loop em que foram usados.
+    """
 
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._items: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, T]" = weakref.WeakKeyDictionary()
 
-class LLMInterface(ABC):
-    @abstractmethod
-    def generate(self, request: LLMRequest) -> LLMResponse:
-        pass
+    def get(self) -> T:
+        loop = asyncio.get_running_loop()
+        item = self._items.get(loop)
+        if item is None:
+            item = self._items[loop] = self._factory()
+        return item
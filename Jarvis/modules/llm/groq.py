@@ -1,9 +1,13 @@
-from groq import Groq
+from typing import Iterator
+
+from groq import AsyncGroq, Groq
 
 from Jarvis.modules.llm.base import (
+    DEFAULT_TEMPERATURE,
     LLMInterface,
     LLMRequest,
     LLMResponse,
+    LoopLocal,
 )
 from Jarvis.core.errors import JarvisError
 
@@ -28,28 +32,37 @@ class GroqLLM(LLMInterface):
             )
 
         self.client = Groq(api_key=api_key)
+        # Cliente async por event loop (usado por agenerate)
+        self.aclients = LoopLocal(lambda: AsyncGroq(api_key=api_key))
         self.model = self.config.get("model", "llama-3.3-70b-versatile")
+        self.temperature = float(self.config.get("temperature", DEFAULT_TEMPERATURE))
 
-    def generate(self, request: LLMRequest) -> LLMResponse:
-        try:
-            messages = []
-
-            if request.system:
-                messages.append({
-                    "role": "system",
-                    "content": request.system
-                })
+    def _params(self, request: LLMRequest) -> dict:
+        messages = []
 
+        if request.system:
             messages.append({
-                "role": "user",
-                "content": request.prompt
+                "role": "system",
+                "content": request.system
             })
 
-            completion = self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
-                temperature=request.temperature,
-            )
+        messages.append({
+            "role": "user",
+            "content": request.prompt
+        })
+
+        params = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": request.temperature,
+        }
+        if request.max_tokens:
+            params["max_tokens"] = request.max_tokens
+        return params
+
+    def generate(self, request: LLMRequest) -> LLMResponse:
+        try:
+            completion = self.client.chat.completions.create(**self._params(request))
 
             text = completion.choices[0].message.content
 
@@ -63,3 +76,40 @@ class GroqLLM(LLMInterface):
                 function="generate",
                 original_exception=e,
             )
+
+    async def agenerate(self, request: LLMRequest) -> LLMResponse:
+        try:
+            completion = await self.aclients.get().chat.completions.create(**self._params(request))
+
+            return LLMResponse(text=completion.choices[0].message.content)
+
+        except Exception as e:
+            raise JarvisError(
+                message="Falha ao gerar resposta via Groq (async).",
+                origin="llm",
+                module="GroqLLM",
+                function="agenerate",
+                original_exception=e,
+            )
+
+    def stream(self, request: LLMRequest) -> Iterator[str]:
+        """Tokens da resposta conforme chegam (stream=True da API)."""
+        try:
+            chunks = self.client.chat.completions.create(
+                **self._params(request), stream=True
+            )
+            for chunk in chunks:
+                if not chunk.choices:
+                    continue
+                token = chunk.choices[0].delta.content
+                if token:
+                    yield token
+
+        except Exception as e:
+            raise JarvisError(
+                message="Falha ao gerar resposta via Groq (streaming).",
+                origin="llm",
+                module="GroqLLM",
+                function="stream",
+                original_exception=e,
+            )
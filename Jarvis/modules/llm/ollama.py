@@ -1,9 +1,13 @@
+from typing import Iterator
+
 import ollama
 
 from Jarvis.modules.llm.base import (
+    DEFAULT_TEMPERATURE,
     LLMInterface,
     LLMRequest,
     LLMResponse,
+    LoopLocal,
 )
 from Jarvis.core.errors import JarvisError
 
@@ -16,65 +20,20 @@ class OllamaLLM(LLMInterface):
     def __init__(self, config: dict | None = None):
         self.config = config or {}
         self.model = self.config.get("model", "phi3:mini")
+        self.temperature = float(self.config.get("temperature", DEFAULT_TEMPERATURE))
+        # Cliente async por event loop (usado por agenerate)
+        self.aclients = LoopLocal(ollama.AsyncClient)
 
-    def generate(self, request, mode=None) -> LLMResponse:
-        """
-        Aceita diferentes formatos de `request`:
-        - `str` (prompt direto)
-        - `modules.llm.base.LLMRequest` (atributos: prompt, system, temperature)
-        - `core.llm_contract.LLMRequest` (atributos: prompt, system_rules, verbosity)
-        Também aceita ser chamada como `generate(final_prompt, mode=mode)`.
-        """
+    def generate(self, request: LLMRequest) -> LLMResponse:
         try:
-            # Caso seja string (prompt completo)
-            if isinstance(request, str):
-                prompt = request
-                system = None
-                temperature = 0.7
-
-            else:
-                # Obter prompt
-                prompt = getattr(request, "prompt", None) or getattr(request, "text", "")
-
-                # Compatibilidade com 'system' (modules.llm.base) e 'system_rules' (core.llm_contract)
-                system = getattr(request, "system", None) or getattr(request, "system_rules", None)
-
-                # Temperatura quando disponível
-                temperature = getattr(request, "temperature", None) or 0.7
-
-                # Alguns requests expõem 'mode' ou 'verbosity' — podemos ignorar para Ollama
-                if hasattr(request, "mode") and request.mode:
-                    mode = request.mode
-
-            if system:
-                prompt = f"{system}\n\n{prompt}"
-
             response = ollama.generate(
                 model=self.model,
-                prompt=prompt,
-                options={
-                    "temperature": temperature
-                }
+                prompt=self._prompt(request),
+                options=self._options(request),
             )
 
-            # Resposta pode ser dict, objeto ou string
-            text = None
-            
-            # Tenta acesso por atributo (objeto)
-            if hasattr(response, "response"):
-                text = response.response
-            elif hasattr(response, "message") and hasattr(response.message, "content"):
-                text = response.message.content
-            
-            # Tenta acesso por chave (dict)
-            elif isinstance(response, dict):
-                text = response.get("response") or response.get("text")
-                # Se for dict mas sem chaves padrão, tenta message nested
-                if not text and "message" in response:
-                    msg = response["message"]
-                    if isinstance(msg, dict):
-                        text = msg.get("content")
-            
+            text = self._text_of(response)
+
             # Fallback final: string, mas apenas se não conseguiu antes
             if text is None:
                 text = str(response)
@@ -89,3 +48,83 @@ class OllamaLLM(LLMInterface):
                 function="generate",
                 original_exception=e,
             )
+
+    async def agenerate(self, request: LLMRequest) -> LLMResponse:
+        """Versão assíncrona de generate() (ollama.AsyncClient)."""
+        try:
+            response = await self.aclients.get().generate(
+                model=self.model,
+                prompt=self._prompt(request),
+                options=self._options(request),
+            )
+
+            text = self._text_of(response)
+            return LLMResponse(text=text if text is not None else str(response))
+
+        except Exception as e:
+            raise JarvisError(
+                message="Falha ao gerar resposta via Ollama (async).",
+                origin="llm",
+                module="OllamaLLM",
+                function="agenerate",
+                original_exception=e,
+            )
+
+    def stream(self, request: LLMRequest) -> Iterator[str]:
+        """Tokens da resposta conforme chegam (generate com stream=True)."""
+        try:
+            chunks = ollama.generate(
+                model=self.model,
+                prompt=self._prompt(request),
+                options=self._options(request),
+                stream=True,
+            )
+            for chunk in chunks:
+                token = self._text_of(chunk)
+                if token:
+                    yield token
+
+        except Exception as e:
+            raise JarvisError(
+                message="Falha ao gerar resposta via Ollama (streaming).",
+                origin="llm",
+                module="OllamaLLM",
+                function="stream",
+                original_exception=e,
+            )
+
+    @staticmethod
+    def _prompt(request: LLMRequest) -> str:
+        # generate() do Ollama recebe um prompt só: o system vai na frente
+        if request.system:
+            return f"{request.system}\n\n{request.prompt}"
+        return request.prompt
+
+    @staticmethod
+    def _options(request: LLMRequest) -> dict:
+        options = {"temperature": request.temperature}
+        if request.max_tokens:
+            options["num_predict"] = request.max_tokens
+        return options
+
+    @staticmethod
+    def _text_of(response) -> str | None:
+        # Resposta pode ser dict, objeto ou string
+        text = None
+
+        # Tenta acesso por atributo (objeto)
+        if hasattr(response, "response"):
+            text = response.response
+        elif hasattr(response, "message") and hasattr(response.message, "content"):
+            text = response.message.content
+
+        # Tenta acesso por chave (dict)
+        elif isinstance(response, dict):
+            text = response.get("response") or response.get("text")
+            # Se for dict mas sem chaves padrão, tenta message nested
+            if not text and "message" in response:
+                msg = response["message"]
+                if isinstance(msg, dict):
+                    text = msg.get("content")
+
+        return text
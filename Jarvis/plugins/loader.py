@@ -5,6 +5,7 @@ import pkgutil
 
 from Jarvis.plugins_available.filesystem import __path__ as fs_path
 from Jarvis.plugins_available.web.plugin import WebPlugin
+from Jarvis.plugins_available.filesystem.utils.resolver import start_watcher
 from Jarvis.core.intent import IntentType
 
 
@@ -29,6 +30,9 @@ def _load_filesystem_plugins():
 
         PluginRegistry.register(intent, plugin_cls)
 
+    # Mantém o índice de arquivos aquecido para read/move/delete
+    start_watcher()
+
 
 def _load_web_plugins():
     PluginRegistry.register(IntentType.WEB_FETCH, WebPlugin)
\ No newline at end of file
@@ -1,9 +1,19 @@
-import PyPDF2
+import sqlite3
 from pathlib import Path
-
-from Jarvis.plugins_available.filesystem.utils.pdf_summary import summarize_text
-from Jarvis.plugins_available.filesystem.utils.pdf_ocr import extract_text_with_ocr
-from Jarvis.plugins_available.filesystem.utils.resolver import resolve_file_humanized
+from typing import Iterator, List
+
+from Jarvis.plugins_available.filesystem.utils.pdf_summary import MIN_TEXT_LENGTH, summarize_pages
+from Jarvis.plugins_available.filesystem.utils.chunked_summary import DEFAULT_CONCURRENCY
+from Jarvis.plugins_available.filesystem.utils.pdf_extract import (
+    EXTRACTOR_SETTINGS,
+    PageText,
+    iter_pdf_pages,
+    make_page,
+)
+from Jarvis.plugins_available.filesystem.utils.extraction_cache import get_extraction_cache
+from Jarvis.plugins_available.filesystem.utils.pdf_ocr import extract_text_with_ocr, ocr_pages
+from Jarvis.plugins_available.filesystem.utils.resolver import resolve_file_ranked, pick_confident
+from Jarvis.plugins_available.filesystem.utils.ui import format_candidates
 
 from Jarvis.plugins.base import Plugin
 from Jarvis.core.action_request import ActionRequest
@@ -11,6 +21,11 @@ from Jarvis.core.action_result import ActionResult
 from Jarvis.core.intent import IntentType
 
 
+# Páginas ilegíveis por lote de OCR: cada lote sobe um pool de
+# processos, então lotes pequenos demais pagam a partida várias vezes
+OCR_BATCH_PAGES = 32
+
+
 class FilesystemPDFReadPlugin(Plugin):
     """
     Plugin responsável por leitura segura de PDFs locais,
@@ -21,7 +36,7 @@ class FilesystemPDFReadPlugin(Plugin):
 
     metadata = {
         "name": "filesystem_pdf_read",
-        "version": "3.3",
+        "version": "3.4",
         "description": "Leitura segura de PDFs locais (com OCR fallback)",
         "capabilities": ["filesystem.read.pdf"],
         "risk_level": "medium",
@@ -34,69 +49,60 @@ class FilesystemPDFReadPlugin(Plugin):
         if not filename:
             return ActionResult(False, "Arquivo não informado.")
 
-        paths = resolve_file_humanized(filename)
+        ranked = resolve_file_ranked(filename)
 
-        if not paths:
+        if not ranked:
             return ActionResult(False, "Arquivo não encontrado.")
 
-        if len(paths) > 1:
+        path: Path | None = pick_confident(ranked)
+
+        if path is None:
             return ActionResult(
                 False,
-                "Encontrei múltiplos PDFs com esse nome:\n"
-                + "\n".join(f"- {p}" for p in paths)
+                "Encontrei múltiplos PDFs possíveis:\n"
+                + format_candidates(ranked)
                 + "\nSeja mais específico."
             )
 
-        path: Path = paths[0]
-
         if not path.exists() or not path.is_file():
             return ActionResult(False, "Arquivo inválido ou não encontrado.")
 
-        
-        # 1) Tentativa padrão (PyPDF2)
-      
-        text = ""
-        try:
-            reader = PyPDF2.PdfReader(str(path))
-            text = "\n".join(
-                page.extract_text() or ""
-                for page in reader.pages
-            ).strip()
-        except Exception:
-            text = ""
-
-        
-        # 2) Heurística de legibilidade
-       
-        needs_ocr = (
-            not text
-            or len(text) < 200
-            or sum(c.isalnum() for c in text) / max(len(text), 1) < 0.4
+        # 0) Cache por conteúdo: o mesmo PDF (mesmo sob outro nome)
+        #    não é extraído de novo
+        cache = get_extraction_cache()
+        file_hash = None
+        cached: dict[int, str] = {}
+        if cache is not None:
+            try:
+                file_hash = cache.file_hash(path)
+                cached = cache.get_pages(file_hash, EXTRACTOR_SETTINGS)
+            except (sqlite3.Error, OSError):
+                file_hash = None
+
+        # 1) Extração página a página (PyPDF2, em paralelo para PDFs grandes)
+        # 2) OCR só das páginas ilegíveis, no meio do fluxo
+        # 3) Resumo map-reduce consumindo as páginas conforme chegam:
+        #    começa antes do fim da extração, sem montar o texto do
+        #    documento inteiro
+        stats = {"pages": 0, "chars": 0, "ocr_error": None}
+        config = getattr(action.context, "config", None)
+        summary = summarize_pages(
+            self._readable_pages(path, cache, file_hash, cached, stats),
+            llm=getattr(action.context, "llm", None),
+            concurrency=getattr(config, "SUMMARY_CONCURRENCY", DEFAULT_CONCURRENCY),
         )
 
-        # 3) OCR fallback
-      
-        if needs_ocr:
-            try:
-                text = extract_text_with_ocr(path)
-            except Exception as e:
+        if not summary:
+            if stats["ocr_error"] is not None and stats["chars"] < MIN_TEXT_LENGTH:
                 return ActionResult(
                     False,
-                    f"Falha ao aplicar OCR no PDF: {e}"
+                    f"Falha ao aplicar OCR no PDF: {stats['ocr_error']}"
+                )
+            if stats["chars"] < MIN_TEXT_LENGTH:
+                return ActionResult(
+                    False,
+                    "Este PDF não contém texto legível, mesmo após OCR."
                 )
-
-        if not text or len(text) < 100:
-            return ActionResult(
-                False,
-                "Este PDF não contém texto legível, mesmo após OCR."
-            )
-
-        # 4) Resumo
-       
-        summary = summarize_text(text, llm=action.context.llm if hasattr(action.context, "llm") else None)
-
-
-        if not summary:
             return ActionResult(
                 False,
                 "Não consegui gerar um resumo legível deste PDF."
@@ -108,11 +114,83 @@ class FilesystemPDFReadPlugin(Plugin):
             "(Peça o texto completo se quiser ler tudo.)",
             data={
                 "summary": summary,
-                "full_text": text,
                 "path": str(path),
                 "type": "pdf"
             }
         )
 
+    def _readable_pages(
+        self,
+        path: Path,
+        cache,
+        file_hash: str | None,
+        cached: dict[int, str],
+        stats: dict,
+    ) -> Iterator[str]:
+        """
+        Texto legível de cada página, em ordem, à medida que é extraído.
+        Páginas ilegíveis são acumuladas em pequenos lotes e passam
+        pelo OCR (em paralelo) antes das páginas seguintes.
+
+        Se a extração quebrar no meio, as páginas já lidas seguem para
+        o resumo; só uma extração completa vai para o cache (que, num
+        PDF ainda fora dele, é o único lugar onde as páginas ficam
+        guardadas até o fim).
+        """
+        extracted = (
+            (make_page(n, cached[n]) for n in sorted(cached))
+            if cached else iter_pdf_pages(path)
+        )
+        to_cache: dict[int, str] | None = {} if file_hash and not cached else None
+        illegible: List[PageText] = []
+        try:
+            for page in extracted:
+                stats["pages"] += 1
+                if to_cache is not None:
+                    to_cache[page.number] = page.text
+                if page.needs_ocr:
+                    illegible.append(page)
+                    if len(illegible) < OCR_BATCH_PAGES:
+                        continue
+                yield from self._ocr_batch(path, illegible, cache, stats)
+                illegible = []
+                if not page.needs_ocr:
+                    yield self._counted(page.text, stats)
+        except Exception:
+            # Extração interrompida: segue com o que já foi lido
+            to_cache = None
+
+        yield from self._ocr_batch(path, illegible, cache, stats)
+
+        if to_cache:
+            try:
+                cache.put_pages(file_hash, EXTRACTOR_SETTINGS, to_cache)
+            except sqlite3.Error:
+                pass
+
+        if stats["pages"] == 0:
+            # PyPDF2 nem abriu o arquivo: OCR das primeiras páginas
+            try:
+                yield self._counted(extract_text_with_ocr(path), stats)
+            except Exception as e:
+                stats["ocr_error"] = e
+
+    def _ocr_batch(self, path: Path, pages: List[PageText], cache, stats: dict) -> Iterator[str]:
+        if not pages:
+            return
+        try:
+            recognized = dict(ocr_pages(path, [p.number for p in pages], cache=cache))
+        except Exception as e:
+            # Sem OCR, fica o texto embutido (mesmo que fraco)
+            stats["ocr_error"] = e
+            recognized = {}
+        for page in pages:
+            yield self._counted(recognized.get(page.number) or page.text, stats)
+
+    @staticmethod
+    def _counted(text: str, stats: dict) -> str:
+        stats["chars"] += len(text.strip())
+        return text
+
 
 PLUGIN_CLASS = FilesystemPDFReadPlugin
\ No newline at end of file
@@ -1,22 +1,41 @@
 from pathlib import Path
-from Jarvis.plugins_available.filesystem.utils.text_summary import summarize_text
+from Jarvis.plugins_available.filesystem.utils.text_summary import (
+    MAX_LLM_INPUT_CHARS,
+    MAX_SUMMARY_CHARS,
+    summarize_text,
+)
+from Jarvis.plugins_available.filesystem.utils.text_reader import read_head, read_range, read_tail
+from Jarvis.plugins_available.filesystem.utils.chunked_summary import DEFAULT_CONCURRENCY
 from Jarvis.plugins.base import Plugin
 from Jarvis.core.action_request import ActionRequest
 from Jarvis.core.action_result import ActionResult
-from Jarvis.plugins_available.filesystem.utils.resolver import resolve_file_humanized
+from Jarvis.plugins_available.filesystem.utils.resolver import resolve_file_ranked, pick_confident
+from Jarvis.plugins_available.filesystem.utils.ui import format_candidates
 from Jarvis.core.intent import IntentType
 
 
+# Trechos devolvidos sem resumo (modos 'tail' e 'range')
+DEFAULT_EXCERPT_BYTES = 8 * 1024
+MAX_EXCERPT_BYTES = 64 * 1024
+
+
 class FilesystemReadPlugin(Plugin):
     """
     Plugin responsável por leitura de arquivos locais.
+
+    Parâmetros opcionais:
+    - mode: 'head' (padrão, resumo do início), 'tail' ou 'range'
+    - offset / length: bytes, para 'range' (length também vale para 'tail')
+
+    O arquivo é lido em blocos até o orçamento do modo: a memória
+    não cresce com o tamanho do arquivo.
     """
 
     intents = {IntentType.CONTENT_READ}
 
     metadata = {
         "name": "filesystem_read",
-        "version": "3.1",
+        "version": "3.2",
         "description": "Leitura segura de arquivos locais",
         "capabilities": ["filesystem.read"],
         "risk_level": "low",
@@ -29,29 +48,41 @@ class FilesystemReadPlugin(Plugin):
         if not filename:
             return ActionResult(False, "Arquivo não informado.")
 
-        paths = resolve_file_humanized(filename)
+        ranked = resolve_file_ranked(filename)
 
-        if not paths:
+        if not ranked:
             return ActionResult(False, "Nenhum arquivo correspondente encontrado.")
 
-        if len(paths) > 1:
+        path = pick_confident(ranked)
+
+        if path is None:
             return ActionResult(
                 False,
-                "Encontrei múltiplos arquivos com esse nome:\n"
-                + "\n".join(f"- {p}" for p in paths)
+                "Encontrei múltiplos arquivos possíveis:\n"
+                + format_candidates(ranked)
             )
 
-        path = paths[0]
-
         if not path.exists() or not path.is_file():
             return ActionResult(False, "Arquivo inválido ou não encontrado.")
 
+        mode = action.params.get("mode") or "head"
+        if mode in ("tail", "range"):
+            return self._read_excerpt(path, mode, action.params)
+
+        llm = getattr(action.context, "llm", None)
+        budget = MAX_LLM_INPUT_CHARS if llm else MAX_SUMMARY_CHARS + 1
+
         try:
-            content = path.read_text(encoding="utf-8", errors="ignore")
+            excerpt = read_head(path, budget, collapse_whitespace=True)
         except Exception as e:
             return ActionResult(False, f"Erro ao ler arquivo: {e}")
 
-        summary = summarize_text(content)
+        config = getattr(action.context, "config", None)
+        summary = summarize_text(
+            excerpt.text,
+            llm=llm,
+            concurrency=getattr(config, "SUMMARY_CONCURRENCY", DEFAULT_CONCURRENCY),
+        )
 
         if not summary:
             return ActionResult(
@@ -59,10 +90,45 @@ class FilesystemReadPlugin(Plugin):
                 "Não consegui gerar um resumo legível deste arquivo."
             )
 
+        note = ""
+        if llm and excerpt.truncated:
+            note = f"(Resumo dos primeiros {excerpt.end // 1024} KB de {excerpt.size // 1024} KB.)\n"
+
         return ActionResult(
             True,
             f"Resumo do arquivo '{path.name}':\n\n{summary}\n\n"
-            "(Peça o texto completo se quiser ler tudo.)"
+            f"{note}(Peça o texto completo se quiser ler tudo.)"
+        )
+
+    def _read_excerpt(self, path: Path, mode: str, params: dict) -> ActionResult:
+        try:
+            length = min(int(params.get("length") or DEFAULT_EXCERPT_BYTES), MAX_EXCERPT_BYTES)
+            offset = int(params.get("offset") or 0)
+        except (TypeError, ValueError):
+            return ActionResult(False, "Parâmetros de leitura inválidos (offset/length).")
+
+        try:
+            if mode == "tail":
+                excerpt = read_tail(path, length)
+            else:
+                excerpt = read_range(path, offset, length)
+        except Exception as e:
+            return ActionResult(False, f"Erro ao ler arquivo: {e}")
+
+        if not excerpt.text.strip():
+            return ActionResult(False, "O trecho pedido está vazio.")
+
+        return ActionResult(
+            True,
+            f"Trecho de '{path.name}' (bytes {excerpt.start}–{excerpt.end} de {excerpt.size}):\n\n"
+            f"{excerpt.text}",
+            data={
+                "path": str(path),
+                "start": excerpt.start,
+                "end": excerpt.end,
+                "size": excerpt.size,
+                "encoding": excerpt.encoding,
+            }
         )
 
 PLUGIN_CLASS = FilesystemReadPlugin
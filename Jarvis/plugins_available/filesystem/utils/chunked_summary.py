@@ -0,0 +1,324 @@
+import functools
+import itertools
+import re
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence
+
+from Jarvis.core.llm_contract import as_response
+
+
+# Tamanho alvo de cada trecho enviado ao LLM (caracteres)
+CHUNK_CHARS = 6000
+
+# Chamadas simultâneas ao LLM quando a configuração não informa
+DEFAULT_CONCURRENCY = 4
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+MAP_PROMPT = (
+    "Resuma o trecho abaixo (parte {index} de {total} de um documento) "
+    "em tópicos curtos, preservando fatos, números e nomes:\n\n{text}"
+)
+
+# Para documentos ainda em extração, quando o total de partes não é conhecido
+MAP_STREAM_PROMPT = (
+    "Resuma o trecho abaixo (parte {index} de um documento) "
+    "em tópicos curtos, preservando fatos, números e nomes:\n\n{text}"
+)
+
+COMBINE_PROMPT = (
+    "Combine os resumos parciais abaixo, de partes consecutivas do mesmo "
+    "documento, em um único resumo em tópicos, sem repetir informações:\n\n{text}"
+)
+
+FINAL_PROMPT = (
+    "Resuma o texto abaixo de forma clara e objetiva, "
+    "em até {max_lines} tópicos curtos:\n\n{text}"
+)
+
+
+def split_chunks(
+    text: str,
+    pages: Optional[Sequence[str]] = None,
+    chunk_chars: int = CHUNK_CHARS,
+) -> List[str]:
+    """
+    Divide o documento em trechos de até `chunk_chars`.
+
+    Usa as páginas como unidade quando disponíveis; senão, frases.
+    Só uma unidade maior que o limite é cortada no meio (em espaço).
+    """
+    if pages:
+        units = pages
+    else:
+        units = _SENTENCE_END.split(re.sub(r"\s+", " ", text).strip())
+    return list(iter_chunks(units, chunk_chars))
+
+
+def iter_chunks(units: Iterable[str], chunk_chars: int = CHUNK_CHARS) -> Iterator[str]:
+    """
+    Versão incremental de split_chunks: consome as unidades (páginas,
+    frases) sob demanda e entrega cada trecho assim que ele enche.
+    """
+    current: List[str] = []
+    size = 0
+
+    for unit in units:
+        unit = (unit or "").strip()
+        if not unit:
+            continue
+        for piece in _hard_split(unit, chunk_chars):
+            if current and size + len(piece) + 1 > chunk_chars:
+                yield " ".join(current)
+                current, size = [], 0
+            current.append(piece)
+            size += len(piece) + 1
+
+    if current:
+        yield " ".join(current)
+
+
+def map_reduce_summary(
+    text: str,
+    generate: Callable[[str], str],
+    pages: Optional[Sequence[str]] = None,
+    max_lines: int = 6,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    chunk_chars: int = CHUNK_CHARS,
+    generate_many: Optional[Callable[[List[str]], list]] = None,
+) -> str:
+    """
+    Resumo map-reduce:
+    - map: cada trecho é resumido em paralelo
+    - reduce: resumos parciais são combinados em grupos que cabem num
+      trecho, nível a nível, até sobrar um; a última chamada produz
+      o resumo final em até `max_lines` tópicos.
+
+    `generate` recebe o prompt e devolve texto. Com `generate_many`
+    (ver llm_batch_generator), cada nível vai ao LLM como um lote e a
+    concorrência é a do LLMManager; sem ele, um pool próprio de até
+    `concurrency` threads. Falhas pontuais numa parte não derrubam o
+    resumo; se todas falharem, a exceção sobe.
+    """
+    chunks = split_chunks(text, pages, chunk_chars)
+    if not chunks:
+        return ""
+
+    if len(chunks) == 1:
+        return generate(FINAL_PROMPT.format(max_lines=max_lines, text=chunks[0])).strip()
+
+    if generate_many is None:
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            runner = _submit_runner(functools.partial(pool.submit, generate))
+            return _map_reduce(chunks, generate, runner, max_lines, chunk_chars)
+    return _map_reduce(chunks, generate, generate_many, max_lines, chunk_chars)
+
+
+def map_reduce_pages(
+    pages: Iterable[str],
+    generate: Callable[[str], str],
+    max_lines: int = 6,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    chunk_chars: int = CHUNK_CHARS,
+    generate_many: Optional[Callable[[List[str]], list]] = None,
+    submit: Optional[Callable[[str], Future]] = None,
+    min_chars: int = 0,
+) -> str:
+    """
+    map_reduce_summary sobre páginas que ainda estão chegando (ex.:
+    extração de um PDF em curso): cada trecho vai para o map assim que
+    enche, enquanto as páginas seguintes são extraídas. Só o primeiro
+    trecho espera o segundo, porque um documento de um trecho só vai
+    direto para o resumo final (se tiver ao menos `min_chars`).
+
+    `submit` (ver llm_submitter) envia um prompt sem bloquear e devolve
+    um Future; sem ele, um pool próprio de `concurrency` threads. No
+    máximo 2 × `concurrency` trechos ficam em voo: se o LLM é mais
+    lento que a extração, a leitura das páginas espera.
+    """
+    chunks = iter_chunks(pages, chunk_chars)
+    first = next(chunks, None)
+    if first is None:
+        return ""
+    second = next(chunks, None)
+    if second is None:
+        if len(first) < min_chars:
+            return ""
+        return generate(FINAL_PROMPT.format(max_lines=max_lines, text=first)).strip()
+
+    pool = None
+    if submit is None:
+        pool = ThreadPoolExecutor(max_workers=max(1, concurrency))
+        submit = functools.partial(pool.submit, generate)
+
+    window = 2 * max(1, concurrency)
+    in_flight: "deque[Future]" = deque()
+    outcomes: list = []
+    try:
+        for index, chunk in enumerate(itertools.chain((first, second), chunks), 1):
+            if len(in_flight) >= window:
+                outcomes.append(_outcome(in_flight.popleft()))
+            in_flight.append(submit(MAP_STREAM_PROMPT.format(index=index, text=chunk)))
+        while in_flight:
+            outcomes.append(_outcome(in_flight.popleft()))
+
+        partials = _partials(outcomes)
+        return _reduce(partials, generate, generate_many or _submit_runner(submit), max_lines, chunk_chars)
+    finally:
+        for future in in_flight:
+            future.cancel()
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def llm_generator(llm):
+    """
+    Adapta o LLMManager (ou provider) a uma função prompt → texto,
+    no modo 'summary'.
+    """
+    def generate(prompt: str) -> str:
+        return as_response(llm.generate(prompt, mode="summary")).text
+
+    return generate
+
+
+def llm_batch_generator(llm):
+    """
+    Função lista de prompts → respostas (ou a exceção de cada falha),
+    via LLMManager.generate_many no modo 'summary'. None quando o LLM
+    não oferece lotes.
+    """
+    if not callable(getattr(llm, "generate_many", None)):
+        return None
+
+    def generate_many(prompts: List[str]) -> list:
+        return llm.generate_many(prompts, mode="summary", return_exceptions=True)
+
+    return generate_many
+
+
+def llm_submitter(llm):
+    """
+    Função prompt → Future da resposta, via LLMManager.submit no modo
+    'summary' (concorrência limitada pelos semáforos dele). None
+    quando o LLM não oferece envio sem bloqueio.
+    """
+    if not callable(getattr(llm, "submit", None)):
+        return None
+
+    def submit(prompt: str) -> Future:
+        return llm.submit(prompt, mode="summary")
+
+    return submit
+
+
+def _map_reduce(
+    chunks: List[str],
+    generate: Callable[[str], str],
+    generate_many: Callable[[List[str]], list],
+    max_lines: int,
+    chunk_chars: int,
+) -> str:
+    total = len(chunks)
+    partials = _run_all(generate_many, [
+        MAP_PROMPT.format(index=i + 1, total=total, text=chunk)
+        for i, chunk in enumerate(chunks)
+    ])
+    return _reduce(partials, generate, generate_many, max_lines, chunk_chars)
+
+
+def _reduce(
+    partials: List[str],
+    generate: Callable[[str], str],
+    generate_many: Callable[[List[str]], list],
+    max_lines: int,
+    chunk_chars: int,
+) -> str:
+    while True:
+        groups = _group(partials, chunk_chars)
+        if len(groups) == 1:
+            break
+        partials = _run_all(generate_many, [
+            COMBINE_PROMPT.format(text="\n\n".join(group)) for group in groups
+        ])
+
+    return generate(
+        FINAL_PROMPT.format(max_lines=max_lines, text="\n\n".join(groups[0]))
+    ).strip()
+
+
+def _submit_runner(submit: Callable[[str], Future]) -> Callable[[List[str]], list]:
+    def generate_many(prompts: List[str]) -> list:
+        futures = [submit(prompt) for prompt in prompts]
+        return [_outcome(future) for future in futures]
+
+    return generate_many
+
+
+def _outcome(future: Future):
+    """Resultado do Future, ou a exceção dele (falha de uma parte só)."""
+    try:
+        return future.result()
+    except Exception as e:
+        return e
+
+
+def _run_all(generate_many: Callable[[List[str]], list], prompts: List[str]) -> List[str]:
+    return _partials(generate_many(prompts))
+
+
+def _partials(outcomes: list) -> List[str]:
+    results: List[str] = []
+    errors: List[Exception] = []
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            errors.append(outcome)
+            continue
+        text = (outcome or "").strip()
+        if text:
+            results.append(text)
+
+    if not results:
+        if errors:
+            raise errors[0]
+        raise ValueError("LLM não retornou nenhum resumo parcial.")
+    return results
+
+
+def _group(partials: List[str], chunk_chars: int) -> List[List[str]]:
+    # Cada grupo leva pelo menos dois resumos, garantindo que cada
+    # nível reduza a quantidade mesmo com parciais longos.
+    groups: List[List[str]] = []
+    current: List[str] = []
+    size = 0
+
+    for partial in partials:
+        if len(current) >= 2 and size + len(partial) > chunk_chars:
+            groups.append(current)
+            current, size = [], 0
+        current.append(partial)
+        size += len(partial)
+
+    if current:
+        if len(current) == 1 and groups:
+            groups[-1].extend(current)
+        else:
+            groups.append(current)
+    return groups
+
+
+def _hard_split(unit: str, limit: int) -> List[str]:
+    if len(unit) <= limit:
+        return [unit]
+
+    pieces = []
+    while len(unit) > limit:
+        cut = unit.rfind(" ", 0, limit)
+        if cut <= 0:
+            cut = limit
+        pieces.append(unit[:cut].strip())
+        unit = unit[cut:].strip()
+    if unit:
+        pieces.append(unit)
+    return pieces
@@ -0,0 +1,188 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable
+
+
+CACHE_FILE = Path("Jarvis/data/cache/pdf_text.sqlite")
+
+# Orçamento total do cache (texto comprimido)
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+_HASH_CHUNK = 1024 * 1024
+
+
+class ExtractionCache:
+    """
+    Cache persistente de texto extraído de PDFs, endereçado por conteúdo.
+
+    Chave = SHA-256 do arquivo + configuração do extrator
+    (ex.: 'pypdf2-3.0.1', 'ocr-por-200dpi'). Renomear ou mover o
+    arquivo não invalida nada; editar o conteúdo sim.
+    O texto fica por página, comprimido com zlib, e o total é limitado
+    por MAX_CACHE_BYTES com despejo LRU por documento.
+    """
+
+    def __init__(self, db_path: Path = CACHE_FILE, max_bytes: int = MAX_CACHE_BYTES):
+        self.db_path = Path(db_path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._init_schema()
+
+    # -------------------------
+    # API pública
+    # -------------------------
+    def file_hash(self, path: Path) -> str:
+        """
+        SHA-256 do arquivo. O resultado é memorizado por (caminho,
+        tamanho, mtime), então só arquivos alterados são relidos.
+        """
+        st = os.stat(path)
+        ident = (str(Path(path).resolve()), st.st_size, st.st_mtime_ns)
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT sha256 FROM fingerprints WHERE path = ? AND size = ? AND mtime_ns = ?",
+                ident,
+            ).fetchone()
+        if row:
+            return row[0]
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+                digest.update(chunk)
+        sha = digest.hexdigest()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO fingerprints (path, size, mtime_ns, sha256) VALUES (?, ?, ?, ?)",
+                (*ident, sha),
+            )
+            self._conn.commit()
+        return sha
+
+    def get_pages(
+        self,
+        file_hash: str,
+        settings: str,
+        pages: Iterable[int] | None = None,
+    ) -> Dict[int, str]:
+        """Páginas em cache (todas, ou só as pedidas). Vazio = miss."""
+        key = _doc_key(file_hash, settings)
+        query = "SELECT page, text FROM pages WHERE doc = ?"
+        params: list = [key]
+
+        if pages is not None:
+            pages = list(pages)
+            if not pages:
+                return {}
+            query += f" AND page IN ({','.join('?' * len(pages))})"
+            params.extend(pages)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+            if rows:
+                self._conn.execute(
+                    "UPDATE documents SET last_access = ? WHERE doc = ?",
+                    (time.time(), key),
+                )
+                self._conn.commit()
+
+        return {page: zlib.decompress(blob).decode("utf-8") for page, blob in rows}
+
+    def put_pages(self, file_hash: str, settings: str, pages: Dict[int, str]) -> None:
+        if not pages:
+            return
+
+        key = _doc_key(file_hash, settings)
+        rows = [
+            (key, page, zlib.compress(text.encode("utf-8")))
+            for page, text in pages.items()
+        ]
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO pages (doc, page, text) VALUES (?, ?, ?)",
+                rows,
+            )
+            size = self._conn.execute(
+                "SELECT COALESCE(SUM(LENGTH(text)), 0) FROM pages WHERE doc = ?", (key,)
+            ).fetchone()[0]
+            self._conn.execute(
+                "INSERT OR REPLACE INTO documents (doc, size_bytes, last_access) VALUES (?, ?, ?)",
+                (key, size, time.time()),
+            )
+            self._evict()
+            self._conn.commit()
+
+    # -------------------------
+    # Internos
+    # -------------------------
+    def _init_schema(self) -> None:
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS documents (
+                doc TEXT PRIMARY KEY,
+                size_bytes INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS pages (
+                doc TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                text BLOB NOT NULL,
+                PRIMARY KEY (doc, page)
+            );
+            CREATE TABLE IF NOT EXISTS fingerprints (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                sha256 TEXT NOT NULL
+            );
+            """
+        )
+        self._conn.commit()
+
+    def _evict(self) -> None:
+        total = self._conn.execute(
+            "SELECT COALESCE(SUM(size_bytes), 0) FROM documents"
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        for key, size in self._conn.execute(
+            "SELECT doc, size_bytes FROM documents ORDER BY last_access"
+        ).fetchall():
+            self._conn.execute("DELETE FROM pages WHERE doc = ?", (key,))
+            self._conn.execute("DELETE FROM documents WHERE doc = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+
+def _doc_key(file_hash: str, settings: str) -> str:
+    return f"{file_hash}:{settings}"
+
+
+_cache: ExtractionCache | None = None
+
+
+def get_extraction_cache() -> ExtractionCache | None:
+    """
+    Instância compartilhada; None quando o cache não pode ser aberto
+    (a extração segue normalmente, apenas sem reaproveitamento).
+    """
+    global _cache
+    if _cache is None:
+        try:
+            _cache = ExtractionCache()
+        except (sqlite3.Error, OSError):
+            return None
+    return _cache
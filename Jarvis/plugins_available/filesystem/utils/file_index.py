@@ -0,0 +1,291 @@
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, List, Tuple
+
+from Jarvis.plugins_available.filesystem.utils.fuzzy import TrigramIndex
+from Jarvis.plugins_available.filesystem.utils.traversal import TreeWalker, WalkStats
+
+
+INDEX_FILE = Path("Jarvis/data/cache/file_index.sqlite")
+
+# Intervalo mínimo entre dois refresh (evita rodar stat em todos os
+# diretórios a cada comando consecutivo do usuário)
+REFRESH_INTERVAL = 5.0
+
+
+class FileIndex:
+    """
+    Índice persistente de nome de arquivo → caminhos (SQLite).
+
+    Cada diretório indexado guarda seu mtime. No refresh apenas
+    diretórios cujo mtime mudou são relistados; os demais custam
+    um único stat.
+
+    Uma cópia em memória (nome → caminhos) responde às buscas em
+    tempo constante. Quando um watcher mantém o índice atualizado
+    (`live=True`), a busca nem passa pelo refresh.
+    """
+
+    def __init__(
+        self,
+        bases: Iterable[Path],
+        max_depth: int,
+        db_path: Path = INDEX_FILE,
+    ):
+        self.bases = [Path(b) for b in bases]
+        self.max_depth = max_depth
+        self.db_path = Path(db_path)
+
+        self._lock = threading.Lock()
+        self._last_refresh = 0.0
+        self.last_walk: WalkStats | None = None
+
+        # Ligado pelo watcher enquanto ele recebe eventos do kernel
+        self.live = False
+        self._by_name: dict[str, set[str]] | None = None
+        self._fuzzy = TrigramIndex()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._init_schema()
+
+    # -------------------------
+    # API pública
+    # -------------------------
+    def lookup(self, name: str) -> List[Path]:
+        """
+        Retorna todos os caminhos indexados cujo nome (case-insensitive)
+        é igual a `name`.
+        """
+        if not self.live:
+            self.refresh()
+
+        with self._lock:
+            paths = sorted(self._names().get(name.lower(), ()))
+
+        if self.live:
+            # Eventos perdidos não podem gerar alvos fantasmas
+            return [Path(p) for p in paths if os.path.exists(p)]
+        return [Path(p) for p in paths]
+
+    def suggest(self, query: str, k: int = 5, min_score: float = 0.4) -> List[Tuple[Path, float]]:
+        """
+        Busca aproximada (trigramas, sem acentos) sobre os nomes indexados.
+        Retorna até `k` pares (caminho, score), do mais parecido ao menos.
+        """
+        if not self.live:
+            self.refresh()
+
+        with self._lock:
+            self._names()
+            ranked = []
+            for name, score in self._fuzzy.search(query, k=k, min_score=min_score):
+                ranked.extend((Path(p), score) for p in sorted(self._by_name.get(name, ())))
+
+        return ranked[:k]
+
+    def directories(self) -> List[Tuple[str, int]]:
+        """Diretórios indexados e suas profundidades."""
+        with self._lock:
+            return self._conn.execute("SELECT path, depth FROM dirs").fetchall()
+
+    # -------------------------
+    # Eventos incrementais (watcher)
+    # -------------------------
+    def add_file(self, path: str) -> None:
+        with self._lock:
+            self._insert_files(os.path.dirname(path), [path])
+            self._conn.commit()
+
+    def remove_file(self, path: str) -> None:
+        with self._lock:
+            self._delete_files("path = ?", (path,))
+            self._conn.commit()
+
+    def add_tree(self, path: str, depth: int) -> List[Tuple[str, int]]:
+        """Indexa uma subárvore nova e devolve os diretórios listados."""
+        with self._lock:
+            listed = self._scan([(path, depth)])
+            self._conn.commit()
+        return listed
+
+    def remove_tree(self, path: str) -> None:
+        with self._lock:
+            self._drop_dir(path)
+            self._conn.commit()
+
+    def refresh(self, force: bool = False) -> None:
+        """
+        Sincroniza o índice com o disco.
+        - Bases nunca indexadas → varredura completa
+        - Diretórios com mtime alterado → relistados
+        - Diretórios removidos → descartados (com seus arquivos)
+        """
+        now = time.monotonic()
+        if not force and now - self._last_refresh < REFRESH_INTERVAL:
+            return
+
+        with self._lock:
+            known = {
+                path: (mtime_ns, depth)
+                for path, mtime_ns, depth in self._conn.execute(
+                    "SELECT path, mtime_ns, depth FROM dirs"
+                )
+            }
+
+            # Todas as travessias deste refresh vão para uma única fila
+            roots = [
+                (base, 0) for base in self.bases
+                if str(base) not in known and base.is_dir()
+            ]
+
+            for path, (mtime_ns, depth) in known.items():
+                try:
+                    current = os.stat(path).st_mtime_ns
+                except OSError:
+                    self._drop_dir(path)
+                    continue
+
+                if current != mtime_ns:
+                    roots.extend(self._rescan_dir(path, depth, known))
+
+            if roots:
+                self._scan(roots, skip=frozenset(known))
+
+            self._conn.commit()
+            self._last_refresh = time.monotonic()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # -------------------------
+    # Internos
+    # -------------------------
+    def _init_schema(self) -> None:
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS dirs (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                depth INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                dir TEXT NOT NULL,
+                name_lower TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_files_name ON files(name_lower);
+            CREATE INDEX IF NOT EXISTS idx_files_dir ON files(dir);
+            """
+        )
+        self._conn.commit()
+
+    def _names(self) -> dict[str, set[str]]:
+        """Cópia em memória do índice, carregada na primeira busca."""
+        if self._by_name is None:
+            by_name: dict[str, set[str]] = {}
+            for name_lower, path in self._conn.execute("SELECT name_lower, path FROM files"):
+                by_name.setdefault(name_lower, set()).add(path)
+            for name_lower in by_name:
+                self._fuzzy.add(name_lower)
+            self._by_name = by_name
+        return self._by_name
+
+    def _scan(
+        self,
+        roots: List[Tuple[Path | str, int]],
+        skip: frozenset = frozenset(),
+    ) -> List[Tuple[str, int]]:
+        walker = TreeWalker(max_depth=self.max_depth, skip_paths=skip)
+        listed = []
+        for listing in walker.iter_dirs(roots):
+            self._store_dir(
+                listing.path,
+                listing.depth,
+                listing.mtime_ns,
+                [entry.path for entry in listing.files],
+            )
+            listed.append((listing.path, listing.depth))
+        self.last_walk = walker.stats
+        return listed
+
+    def _rescan_dir(self, path: str, depth: int, known: dict) -> List[Tuple[str, int]]:
+        """
+        Relista um único diretório e devolve os subdiretórios novos,
+        que precisam de varredura completa. Os já conhecidos ficam
+        para o próprio refresh.
+        """
+        self._delete_files("dir = ?", (path,))
+
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return []
+
+        files = []
+        new_dirs = []
+        for entry in entries:
+            try:
+                if entry.is_file():
+                    files.append(entry.path)
+                elif entry.is_dir() and entry.path not in known and depth + 1 < self.max_depth:
+                    new_dirs.append((entry.path, depth + 1))
+            except OSError:
+                continue
+
+        self._store_dir(path, depth, mtime_ns, files)
+        return new_dirs
+
+    def _store_dir(self, path: str, depth: int, mtime_ns: int, files: List[str]) -> None:
+        self._conn.execute(
+            # Bases sobrepostas (~ e ~/Documents) alcançam o mesmo diretório
+            # em profundidades diferentes: vale sempre a menor.
+            "INSERT INTO dirs (path, mtime_ns, depth) VALUES (?, ?, ?) "
+            "ON CONFLICT(path) DO UPDATE SET "
+            "mtime_ns = excluded.mtime_ns, depth = MIN(depth, excluded.depth)",
+            (path, mtime_ns, depth),
+        )
+
+        self._insert_files(path, files)
+
+    def _insert_files(self, dir_path: str, files: List[str]) -> None:
+        rows = [(f, dir_path, os.path.basename(f).lower()) for f in files]
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO files (path, dir, name_lower) VALUES (?, ?, ?)",
+            rows,
+        )
+        if self._by_name is not None:
+            for path, _, name_lower in rows:
+                self._by_name.setdefault(name_lower, set()).add(path)
+                self._fuzzy.add(name_lower)
+
+    def _delete_files(self, where: str, params: tuple) -> None:
+        if self._by_name is not None:
+            for path, name_lower in self._conn.execute(
+                f"SELECT path, name_lower FROM files WHERE {where}", params
+            ):
+                paths = self._by_name.get(name_lower)
+                if paths:
+                    paths.discard(path)
+                    if not paths:
+                        del self._by_name[name_lower]
+                        self._fuzzy.remove(name_lower)
+
+        self._conn.execute(f"DELETE FROM files WHERE {where}", params)
+
+    def _drop_dir(self, path: str) -> None:
+        prefix = path.rstrip(os.sep) + os.sep
+        self._conn.execute(
+            "DELETE FROM dirs WHERE path = ? OR substr(path, 1, ?) = ?",
+            (path, len(prefix), prefix),
+        )
+        self._delete_files(
+            "dir = ? OR substr(dir, 1, ?) = ?",
+            (path, len(prefix), prefix),
+        )
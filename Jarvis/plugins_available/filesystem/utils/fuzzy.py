@@ -0,0 +1,102 @@
+import heapq
+import math
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, FrozenSet, List, Set, Tuple
+
+
+def normalize_name(text: str) -> str:
+    """
+    Forma canônica para comparação de nomes:
+    sem acentos, minúscula, separadores (_ - . etc.) viram espaço.
+    'Relatório_Final_v2.pdf' → 'relatorio final v2 pdf'
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(re.split(r"[\W_]+", stripped.lower())).strip()
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """Trigramas por palavra, com padding (estilo pg_trgm)."""
+    grams: Set[str] = set()
+    for word in normalize_name(text).split():
+        padded = f"  {word} "
+        for i in range(len(padded) - 2):
+            grams.add(padded[i:i + 3])
+    return frozenset(grams)
+
+
+class TrigramIndex:
+    """
+    Índice invertido trigrama → nomes, para busca aproximada.
+
+    A busca só toca as listas de postings dos trigramas mais raros
+    da consulta (filtro de prefixo): um nome que atinge o score mínimo
+    precisa conter ao menos um deles. O custo depende das listas
+    consultadas, não do total de nomes indexados.
+    """
+
+    # Peso da cobertura da consulta no score final; o restante é Dice
+    COVERAGE_WEIGHT = 0.8
+
+    def __init__(self):
+        self._postings: Dict[str, Set[str]] = {}
+        self._grams: Dict[str, FrozenSet[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._grams)
+
+    def add(self, name: str) -> None:
+        if name in self._grams:
+            return
+        grams = trigrams(name)
+        self._grams[name] = grams
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(name)
+
+    def remove(self, name: str) -> None:
+        grams = self._grams.pop(name, None)
+        if not grams:
+            return
+        for gram in grams:
+            names = self._postings.get(gram)
+            if names:
+                names.discard(name)
+                if not names:
+                    del self._postings[gram]
+
+    def search(self, query: str, k: int = 5, min_score: float = 0.4) -> List[Tuple[str, float]]:
+        """
+        Retorna até `k` pares (nome, score) ordenados por score.
+        score = 0.8 * cobertura da consulta + 0.2 * coeficiente de Dice
+        """
+        q_grams = trigrams(query)
+        if not q_grams:
+            return []
+
+        # Como Dice <= 2 * cobertura, score <= (2 - peso) * cobertura.
+        # Um candidato aceitável compartilha ao menos `needed` trigramas
+        # e, portanto, aparece em um dos (len - needed + 1) mais raros.
+        max_ratio = 2 - self.COVERAGE_WEIGHT
+        needed = max(1, math.ceil(min_score * len(q_grams) / max_ratio))
+        by_rarity = sorted(q_grams, key=lambda g: len(self._postings.get(g, ())))
+        probe = by_rarity[: len(q_grams) - needed + 1]
+
+        candidates: Counter = Counter()
+        for gram in probe:
+            for name in self._postings.get(gram, ()):
+                candidates[name] += 1
+
+        scored = []
+        rest = by_rarity[len(probe):]
+        for name, shared in candidates.items():
+            grams = self._grams[name]
+            shared += sum(1 for gram in rest if gram in grams)
+            coverage = shared / len(q_grams)
+            dice = 2 * shared / (len(q_grams) + len(grams))
+            score = self.COVERAGE_WEIGHT * coverage + (1 - self.COVERAGE_WEIGHT) * dice
+            if score >= min_score:
+                scored.append((name, round(score, 3)))
+
+        return heapq.nlargest(k, scored, key=lambda item: item[1])
@@ -0,0 +1,105 @@
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+import PyPDF2
+
+
+# Páginas por tarefa enviada ao pool (amortiza o custo de IPC)
+BATCH_SIZE = 8
+
+# Abaixo disso o custo de subir processos não compensa
+MIN_PAGES_FOR_POOL = 16
+
+# Identifica o extrator nas chaves do cache de extração
+EXTRACTOR_SETTINGS = f"pypdf2-{PyPDF2.__version__}"
+
+# Heurística de legibilidade por página
+MIN_PAGE_CHARS = 40
+MIN_ALNUM_RATIO = 0.4
+
+
+@dataclass
+class PageText:
+    number: int  # 1-based
+    text: str
+    needs_ocr: bool
+
+
+def page_needs_ocr(text: str) -> bool:
+    """
+    Decide se o texto embutido de UMA página é legível.
+    Páginas escaneadas costumam vir vazias ou com lixo de codificação.
+    """
+    text = text.strip()
+    if len(text) < MIN_PAGE_CHARS:
+        return True
+    return sum(c.isalnum() for c in text) / len(text) < MIN_ALNUM_RATIO
+
+
+def iter_pdf_pages(pdf_path: Path, workers: int | None = None) -> Iterator[PageText]:
+    """
+    Extrai o texto página a página, em ordem, como gerador.
+
+    PDFs grandes são divididos em lotes distribuídos num pool de
+    processos; apenas uma janela limitada de lotes fica em voo,
+    então o consumidor pode começar a trabalhar (e até parar)
+    antes do fim da extração.
+    """
+    reader = PyPDF2.PdfReader(str(pdf_path))
+    total = len(reader.pages)
+
+    if total < MIN_PAGES_FOR_POOL:
+        for index, page in enumerate(reader.pages):
+            yield make_page(index + 1, _safe_extract(page))
+        return
+
+    workers = workers or os.cpu_count() or 1
+    batches = deque(
+        (start, min(start + BATCH_SIZE, total))
+        for start in range(0, total, BATCH_SIZE)
+    )
+
+    # spawn: o processo já tem threads vivas (watcher, loop do LLM) e
+    # um fork herdaria locks delas no estado em que estiverem
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        in_flight = deque()
+        while batches or in_flight:
+            while batches and len(in_flight) < workers * 2:
+                start, end = batches.popleft()
+                in_flight.append((start, pool.submit(_extract_range, str(pdf_path), start, end)))
+
+            start, future = in_flight.popleft()
+            for offset, text in enumerate(future.result()):
+                yield make_page(start + offset + 1, text)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def make_page(number: int, text: str) -> PageText:
+    return PageText(number=number, text=text, needs_ocr=page_needs_ocr(text))
+
+
+def _safe_extract(page) -> str:
+    try:
+        return page.extract_text() or ""
+    except Exception:
+        return ""
+
+
+# Cache por processo: cada worker abre o PDF uma única vez
+_READERS: Dict[str, PyPDF2.PdfReader] = {}
+
+
+def _extract_range(pdf_path: str, start: int, end: int) -> List[str]:
+    reader = _READERS.get(pdf_path)
+    if reader is None:
+        reader = PyPDF2.PdfReader(pdf_path)
+        _READERS.clear()
+        _READERS[pdf_path] = reader
+    return [_safe_extract(reader.pages[i]) for i in range(start, end)]
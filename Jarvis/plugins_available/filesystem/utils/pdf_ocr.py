@@ -1,34 +1,158 @@
+import multiprocessing
+import os
+import sqlite3
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Iterable, Iterator, Tuple
 
 from pdf2image import convert_from_path
 import pytesseract
 
+from Jarvis.plugins_available.filesystem.utils.extraction_cache import (
+    ExtractionCache,
+    get_extraction_cache,
+)
+
 
 def extract_text_with_ocr(
     pdf_path: Path,
     max_pages: int = 5,
-    dpi: int = 200
+    dpi: int = 200,
+    pages: Iterable[int] | None = None,
 ) -> str:
     """
     Converte páginas do PDF em imagens e aplica OCR.
     Usado como fallback quando PyPDF2 falha.
 
-    - max_pages: limite para evitar PDFs gigantes
+    - pages: páginas (1-based) que precisam de OCR; quando omitido,
+      usa as primeiras `max_pages` (limite para evitar PDFs gigantes)
     - dpi: equilíbrio entre qualidade e performance
     """
 
+    if pages is None:
+        pages = range(1, max_pages + 1)
+
+    texts = [
+        text
+        for _, text in ocr_pages(pdf_path, pages, dpi=dpi, cache=get_extraction_cache())
+        if text
+    ]
+
+    return "\n\n".join(texts).strip()
+
+
+def ocr_pages(
+    pdf_path: Path,
+    pages: Iterable[int],
+    dpi: int = 200,
+    lang: str = "por",
+    workers: int | None = None,
+    cache: ExtractionCache | None = None,
+) -> Iterator[Tuple[int, str]]:
+    """
+    Aplica OCR às páginas indicadas num pool de processos
+    (um por CPU) e devolve (página, texto) na ordem pedida.
+
+    Cada worker rasteriza apenas a sua página (first_page/last_page),
+    e só uma janela limitada de páginas fica em voo: um scan de
+    300 páginas nunca tem todas as imagens em memória.
+
+    Com `cache`, páginas já reconhecidas (mesmo arquivo, mesmo
+    idioma/dpi) não voltam ao Tesseract.
+    """
+    pages = list(pages)
+    if not pages:
+        return
+
+    settings = ocr_settings(lang, dpi)
+    file_hash = None
+    cached: dict[int, str] = {}
+    if cache is not None:
+        try:
+            file_hash = cache.file_hash(pdf_path)
+            cached = cache.get_pages(file_hash, settings, pages)
+        except (sqlite3.Error, OSError):
+            file_hash = None
+
+    fresh: dict[int, str] = {}
+    stream = _ocr_stream(pdf_path, [p for p in pages if p not in cached], dpi, lang, workers)
+    try:
+        for page in pages:
+            if page in cached:
+                yield page, cached[page]
+                continue
+            _, text = next(stream)
+            fresh[page] = text
+            yield page, text
+    finally:
+        stream.close()
+        if file_hash and fresh:
+            try:
+                cache.put_pages(file_hash, settings, fresh)
+            except sqlite3.Error:
+                pass
+
+
+def ocr_settings(lang: str, dpi: int) -> str:
+    return f"ocr-{lang}-{dpi}dpi"
+
+
+def _ocr_stream(
+    pdf_path: Path,
+    pages: list[int],
+    dpi: int,
+    lang: str,
+    workers: int | None,
+) -> Iterator[Tuple[int, str]]:
+    if not pages:
+        return
+
+    workers = min(workers or os.cpu_count() or 1, len(pages))
+
+    if workers == 1:
+        for page in pages:
+            yield page, _ocr_page(str(pdf_path), page, dpi, lang)
+        return
+
+    pending = deque(pages)
+    # spawn em vez de fork: não herda threads/locks do processo principal
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    try:
+        in_flight = deque()
+        while pending or in_flight:
+            while pending and len(in_flight) < workers * 2:
+                page = pending.popleft()
+                in_flight.append((page, pool.submit(_ocr_page, str(pdf_path), page, dpi, lang)))
+
+            page, future = in_flight.popleft()
+            yield page, future.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _init_worker() -> None:
+    # O paralelismo já vem do pool; threads internas do Tesseract
+    # só disputariam as mesmas CPUs.
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+
+
+def _ocr_page(pdf_path: str, page: int, dpi: int, lang: str) -> str:
     images = convert_from_path(
         pdf_path,
         dpi=dpi,
-        first_page=1,
-        last_page=max_pages
+        first_page=page,
+        last_page=page
     )
 
     texts = []
-
     for img in images:
-        text = pytesseract.image_to_string(img, lang="por")
+        text = pytesseract.image_to_string(img, lang=lang)
         if text:
             texts.append(text.strip())
 
-    return "\n\n".join(texts).strip()
\ No newline at end of file
+    return "\n".join(texts).strip()
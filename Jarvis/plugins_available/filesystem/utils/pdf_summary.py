@@ -1,5 +1,18 @@
 import re
-from Jarvis.core.llm_contract import LLMRequest
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from Jarvis.plugins_available.filesystem.utils.chunked_summary import (
+    CHUNK_CHARS,
+    DEFAULT_CONCURRENCY,
+    llm_batch_generator,
+    llm_generator,
+    llm_submitter,
+    map_reduce_pages,
+    map_reduce_summary,
+)
+
+MIN_TEXT_LENGTH = 100
+
 
 def _deterministic_summary(text: str, max_lines: int = 6) -> str:
     text = re.sub(r"\s+", " ", text).strip()
@@ -11,38 +24,93 @@ def _deterministic_summary(text: str, max_lines: int = 6) -> str:
 def summarize_text(
     text: str,
     llm=None,
-    max_lines: int = 6
+    max_lines: int = 6,
+    pages: Optional[Sequence[str]] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
 ) -> str:
     """
     Resumo híbrido:
-    - Com LLM: resumo semântico
+    - Com LLM: resumo semântico do documento inteiro (map-reduce
+      por páginas; com LLMManager, na concorrência dele, senão até
+      `concurrency` chamadas simultâneas)
     - Sem LLM: fallback determinístico
     """
 
     # Proteção básica
-    if not text or len(text) < 100:
+    if not text or len(text) < MIN_TEXT_LENGTH:
         return ""
 
     # === CAMINHO LLM ===
     if llm:
         try:
-            prompt = (
-                "Resuma o texto abaixo de forma clara e objetiva, "
-                "em até 6 tópicos curtos:\n\n"
-                f"{text[:8000]}"  # proteção de contexto
+            summary = map_reduce_summary(
+                text,
+                llm_generator(llm),
+                pages=pages,
+                max_lines=max_lines,
+                concurrency=concurrency,
+                generate_many=llm_batch_generator(llm),
             )
+            if summary:
+                return summary
 
-            request = LLMRequest(
-                system="Você é um assistente que resume documentos.",
-                user=prompt
-            )
+        except Exception:
+            pass  # cai pro fallback
 
-            response = llm.generate(request)
-            if response and response.text:
-                return response.text.strip()
+    # === FALLBACK DETERMINÍSTICO ===
+    return _deterministic_summary(text, max_lines)
+
+
+def summarize_pages(
+    pages: Iterable[str],
+    llm=None,
+    max_lines: int = 6,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> str:
+    """
+    Como summarize_text(), mas sobre páginas que ainda estão sendo
+    extraídas: o map-reduce começa com as primeiras páginas e o
+    documento inteiro nunca fica junto em memória.
+
+    Sem LLM (ou se ele falhar), o fallback determinístico usa só o
+    início do documento, então as páginas são lidas só até ali.
+    """
+    head: List[str] = []
+    pages = _keep_head(pages, head)
+
+    # === CAMINHO LLM ===
+    if llm:
+        try:
+            summary = map_reduce_pages(
+                pages,
+                llm_generator(llm),
+                max_lines=max_lines,
+                concurrency=concurrency,
+                generate_many=llm_batch_generator(llm),
+                submit=llm_submitter(llm),
+                min_chars=MIN_TEXT_LENGTH,
+            )
+            if summary:
+                return summary
 
         except Exception:
             pass  # cai pro fallback
 
     # === FALLBACK DETERMINÍSTICO ===
-    return _deterministic_summary(text, max_lines)
\ No newline at end of file
+    while sum(map(len, head)) < CHUNK_CHARS and next(pages, None) is not None:
+        pass
+
+    text = " ".join(head)
+    if len(text) < MIN_TEXT_LENGTH:
+        return ""
+    return _deterministic_summary(text, max_lines)
+
+
+def _keep_head(pages: Iterable[str], head: List[str]) -> Iterator[str]:
+    """Repassa as páginas guardando o início do documento em `head`."""
+    size = 0
+    for page in pages:
+        if size < CHUNK_CHARS:
+            head.append(page)
+            size += len(page)
+        yield page
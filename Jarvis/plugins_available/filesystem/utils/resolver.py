@@ -1,5 +1,10 @@
+import sqlite3
 from pathlib import Path
-from typing import Iterable, List
+from typing import List, Tuple
+
+from Jarvis.plugins_available.filesystem.utils.file_index import FileIndex
+from Jarvis.plugins_available.filesystem.utils.traversal import find_by_name
+from Jarvis.plugins_available.filesystem.utils.watcher import FilesystemWatcher
 
 
 SEARCH_BASES = [
@@ -16,6 +21,46 @@ SEARCH_BASES = [
 
 MAX_DEPTH = 4
 
+# Limites da busca direta em disco (usada quando o índice está indisponível)
+MAX_MATCHES = 5
+SEARCH_TIME_BUDGET = 3.0
+
+# Busca aproximada (nomes parecidos, sem acentos)
+FUZZY_TOP_K = 5
+FUZZY_MIN_SCORE = 0.45
+# Acima deste score um candidato isolado é aceito sem perguntar
+FUZZY_ACCEPT_SCORE = 0.85
+
+_index: FileIndex | None = None
+_watcher: FilesystemWatcher | None = None
+
+
+def get_file_index() -> FileIndex:
+    """
+    Índice persistente compartilhado pelos plugins de filesystem.
+    Criado sob demanda na primeira busca.
+    """
+    global _index
+    if _index is None:
+        _index = FileIndex(SEARCH_BASES, MAX_DEPTH)
+    return _index
+
+
+def start_watcher() -> FilesystemWatcher | None:
+    """
+    Inicia (uma única vez) o watcher residente que mantém o índice
+    aquecido. Falhas aqui nunca impedem o carregamento dos plugins:
+    o resolver continua funcionando com refresh sob demanda.
+    """
+    global _watcher
+    if _watcher is None:
+        try:
+            _watcher = FilesystemWatcher(get_file_index())
+        except (sqlite3.Error, OSError):
+            return None
+    _watcher.start()
+    return _watcher
+
 
 def resolve_file_humanized(
     name: str,
@@ -46,11 +91,18 @@ def resolve_file_humanized(
     if results:
         return results
 
-    # Busca controlada (fuzzy simples)
-    for base in SEARCH_BASES:
-        found = _search_by_name(base, name, MAX_DEPTH)
-        if found and found not in results:
-            results.append(found)
+    # Busca controlada: consulta ao índice persistente
+    try:
+        results = get_file_index().lookup(name)
+    except (sqlite3.Error, OSError):
+        # Índice indisponível (disco somente leitura, arquivo corrompido...)
+        results, _ = find_by_name(
+            SEARCH_BASES,
+            name,
+            MAX_DEPTH,
+            max_matches=MAX_MATCHES,
+            time_budget=SEARCH_TIME_BUDGET,
+        )
 
     if results:
         return results
@@ -62,32 +114,40 @@ def resolve_file_humanized(
     return []
 
 
-def _search_by_name(base: Path, filename: str, max_depth: int) -> Path | None:
-    try:
-        for path in _walk(base, max_depth):
-            if path.name.lower() == filename.lower():
-                return path
-    except PermissionError:
-        return None
-    return None
-
 
-def _walk(base: Path, max_depth: int) -> Iterable[Path]:
-    stack = [(base, 0)]
-
-    while stack:
-        current, depth = stack.pop()
-
-        if depth > max_depth:
-            continue
-
-        if current.is_file():
-            yield current
-            continue
+def suggest_files(name: str, k: int = FUZZY_TOP_K) -> List[Tuple[Path, float]]:
+    """
+    Candidatos aproximados para `name` (ex.: 'relatorio final' →
+    'Relatório_Final_v2.pdf'), do mais parecido ao menos.
+    """
+    name = (name or "").strip().strip('"').strip("'")
+    if not name:
+        return []
 
-        if current.is_dir():
-            try:
-                for child in current.iterdir():
-                    stack.append((child, depth + 1))
-            except PermissionError:
-                continue
\ No newline at end of file
+    try:
+        return get_file_index().suggest(name, k=k, min_score=FUZZY_MIN_SCORE)
+    except (sqlite3.Error, OSError):
+        return []
+
+
+def resolve_file_ranked(name: str, k: int = FUZZY_TOP_K) -> List[Tuple[Path, float]]:
+    """
+    Resolução com ranking: correspondências exatas valem 1.0;
+    sem nenhuma, cai para os melhores candidatos aproximados.
+    """
+    exact = resolve_file_humanized(name, must_exist=True)
+    if exact:
+        return [(path, 1.0) for path in exact]
+    return suggest_files(name, k)
+
+
+def pick_confident(ranked: List[Tuple[Path, float]]) -> Path | None:
+    """
+    Escolhe um alvo sem perguntar quando não há ambiguidade: um único
+    candidato com score >= FUZZY_ACCEPT_SCORE (correspondência exata
+    vale 1.0). Um palpite fraco, mesmo sozinho, volta para o usuário.
+    """
+    confident = [path for path, score in ranked if score >= FUZZY_ACCEPT_SCORE]
+    if len(confident) == 1:
+        return confident[0]
+    return None
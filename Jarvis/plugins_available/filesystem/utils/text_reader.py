@@ -0,0 +1,215 @@
+import codecs
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Tuple
+
+
+# Bloco lido por vez (e usado para detectar a codificação)
+CHUNK_BYTES = 64 * 1024
+
+# (BOM, codificação) — UTF-32 antes de UTF-16: o BOM LE de um contém o do outro
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32-le"),
+    (codecs.BOM_UTF32_BE, "utf-32-be"),
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+)
+
+# Arquivos sem BOM que não são UTF-8 (comum em textos antigos em português)
+FALLBACK_ENCODING = "cp1252"
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class TextExcerpt:
+    text: str
+    encoding: str
+    start: int       # offset em bytes do início do trecho
+    end: int         # offset em bytes logo após o trecho
+    size: int        # tamanho total do arquivo
+    truncated: bool  # há conteúdo fora do trecho
+
+
+def sniff_encoding(path: Path) -> Tuple[str, int]:
+    """
+    Detecta a codificação pelo primeiro bloco do arquivo.
+    Retorna (codificação, tamanho do BOM).
+    """
+    with open(path, "rb") as f:
+        block = f.read(CHUNK_BYTES)
+    return _sniff(block)
+
+
+def read_head(
+    path: Path,
+    max_chars: int,
+    encoding: str | None = None,
+    collapse_whitespace: bool = False,
+) -> TextExcerpt:
+    """
+    Lê o início do arquivo em blocos, parando assim que `max_chars`
+    caracteres (já normalizados, se `collapse_whitespace`) foram obtidos.
+    A memória usada depende do orçamento, não do tamanho do arquivo.
+    """
+    size = os.path.getsize(path)
+
+    with open(path, "rb") as f:
+        block = f.read(CHUNK_BYTES)
+        sniffed, bom = _sniff(block)
+        encoding = encoding or sniffed
+        block = block[bom:]
+
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        parts = []
+        total = 0
+        pending_space = False
+        consumed = bom
+
+        while block and total < max_chars:
+            consumed += len(block)
+            chunk = decoder.decode(block)
+            if collapse_whitespace:
+                chunk, pending_space = _collapse(chunk, pending_space, first=total == 0)
+            parts.append(chunk)
+            total += len(chunk)
+            block = f.read(CHUNK_BYTES)
+
+        if not block:
+            tail = decoder.decode(b"", final=True)
+            if collapse_whitespace:
+                tail, _ = _collapse(tail, pending_space, first=total == 0)
+            parts.append(tail)
+
+    text = "".join(parts)
+    truncated = consumed < size or len(text) > max_chars
+    if collapse_whitespace and not truncated:
+        text = text.rstrip()
+
+    return TextExcerpt(
+        text=text[:max_chars],
+        encoding=encoding,
+        start=bom,
+        end=consumed,
+        size=size,
+        truncated=truncated,
+    )
+
+
+def read_range(
+    path: Path,
+    offset: int,
+    length: int,
+    encoding: str | None = None,
+) -> TextExcerpt:
+    """
+    Lê `length` bytes a partir de `offset`. O início é alinhado
+    ao caractere (UTF-8/16/32), então o trecho nunca começa quebrado.
+    """
+    size = os.path.getsize(path)
+    sniffed, bom = sniff_encoding(path)
+    encoding = encoding or sniffed
+
+    with open(path, "rb") as f:
+        start = _align(f, max(offset, bom), bom, encoding)
+        f.seek(start)
+        data = f.read(max(0, offset + length - start))
+
+    # final=False: um caractere cortado no fim do trecho é descartado
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    text = decoder.decode(data, final=start + len(data) >= size)
+    end = start + len(data) - len(decoder.getstate()[0])
+
+    return TextExcerpt(
+        text=text,
+        encoding=encoding,
+        start=start,
+        end=end,
+        size=size,
+        truncated=start > bom or end < size,
+    )
+
+
+def read_tail(path: Path, max_bytes: int, encoding: str | None = None) -> TextExcerpt:
+    """
+    Lê o final do arquivo (até `max_bytes`), descartando a primeira
+    linha parcial quando o trecho começa no meio do arquivo.
+    """
+    size = os.path.getsize(path)
+    excerpt = read_range(path, max(0, size - max_bytes), max_bytes, encoding)
+
+    if excerpt.truncated:
+        newline = excerpt.text.find("\n")
+        if 0 <= newline < len(excerpt.text) - 1:
+            skipped = excerpt.text[: newline + 1]
+            excerpt.start += len(skipped.encode(excerpt.encoding, errors="replace"))
+            excerpt.text = excerpt.text[newline + 1:]
+
+    return excerpt
+
+
+def _sniff(block: bytes) -> Tuple[str, int]:
+    for bom, encoding in _BOMS:
+        if block.startswith(bom):
+            return encoding, len(bom)
+
+    try:
+        # final=False: um caractere cortado no fim do bloco não é erro
+        codecs.getincrementaldecoder("utf-8")().decode(block, final=False)
+        return "utf-8", 0
+    except UnicodeDecodeError:
+        pass
+
+    # UTF-16 sem BOM: texto ASCII vira bytes nulos alternados
+    if block:
+        sample = block[:4096]
+        if sample[1::2].count(0) > len(sample) * 0.4:
+            return "utf-16-le", 0
+        if sample[0::2].count(0) > len(sample) * 0.4:
+            return "utf-16-be", 0
+
+    return FALLBACK_ENCODING, 0
+
+
+def _align(f, offset: int, bom: int, encoding: str) -> int:
+    if encoding.startswith(("utf-16", "utf-32")):
+        unit = 2 if encoding.startswith("utf-16") else 4
+        return offset - (offset - bom) % unit
+
+    if encoding == "utf-8":
+        # Pula bytes de continuação (10xxxxxx) até o início de um caractere
+        f.seek(offset)
+        lead = f.read(4)
+        skip = 0
+        while skip < len(lead) and 0x80 <= lead[skip] <= 0xBF:
+            skip += 1
+        return offset + skip
+
+    return offset
+
+
+def _collapse(chunk: str, pending_space: bool, first: bool) -> Tuple[str, bool]:
+    """
+    Colapsa espaços de um bloco preservando o estado entre blocos:
+    um espaço no fim de um bloco só é emitido se vier texto depois.
+    """
+    chunk = _WHITESPACE.sub(" ", chunk)
+    if not chunk:
+        return "", pending_space
+
+    if chunk.startswith(" "):
+        pending_space = pending_space or not first
+        chunk = chunk[1:]
+
+    if chunk and pending_space:
+        chunk = " " + chunk
+        pending_space = False
+
+    if chunk.endswith(" "):
+        chunk = chunk[:-1]
+        pending_space = True
+
+    return chunk, pending_space
@@ -1,8 +1,19 @@
 import re
 
+from Jarvis.plugins_available.filesystem.utils.chunked_summary import (
+    CHUNK_CHARS,
+    DEFAULT_CONCURRENCY,
+    llm_batch_generator,
+    llm_generator,
+    map_reduce_summary,
+)
+
 MAX_SUMMARY_CHARS = 1200
 MIN_TEXT_LENGTH = 80
 
+# Quanto de um arquivo grande é lido para o resumo via LLM
+MAX_LLM_INPUT_CHARS = 20 * CHUNK_CHARS
+
 
 def _clean_text(text: str) -> str:
     """
@@ -12,10 +23,15 @@ def _clean_text(text: str) -> str:
     return text.strip()
 
 
-def summarize_text(text: str) -> str | None:
+def summarize_text(
+    text: str,
+    llm=None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> str | None:
     """
-    Gera um resumo determinístico e seguro de um texto grande.
-    NÃO usa LLM.
+    Gera um resumo seguro de um texto grande.
+    Com LLM, resume o texto inteiro (map-reduce); sem LLM, ou se ele
+    falhar, usa o recorte determinístico do início.
     """
 
     if not text:
@@ -30,6 +46,20 @@ def summarize_text(text: str) -> str | None:
     if len(text) <= MAX_SUMMARY_CHARS:
         return text
 
+    # Texto grande → resumo semântico, quando há LLM
+    if llm:
+        try:
+            summary = map_reduce_summary(
+                text,
+                llm_generator(llm),
+                concurrency=concurrency,
+                generate_many=llm_batch_generator(llm),
+            )
+            if summary:
+                return summary
+        except Exception:
+            pass  # cai pro recorte
+
     # Texto grande → resumo simples
     head = text[:MAX_SUMMARY_CHARS]
 
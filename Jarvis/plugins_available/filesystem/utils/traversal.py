@@ -0,0 +1,166 @@
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, List, NamedTuple, Tuple
+
+
+@dataclass
+class WalkStats:
+    """
+    Contadores de uma travessia.
+    - visited: diretórios efetivamente listados
+    - pruned: subárvores descartadas por já terem sido visitadas
+    - matches: arquivos que satisfizeram a busca
+    - timed_out: o orçamento de tempo acabou antes do fim
+    """
+    visited: int = 0
+    pruned: int = 0
+    matches: int = 0
+    elapsed: float = 0.0
+    timed_out: bool = False
+
+
+class DirListing(NamedTuple):
+    path: str
+    depth: int
+    mtime_ns: int
+    files: List[os.DirEntry]
+
+
+@dataclass
+class TreeWalker:
+    """
+    Motor único de travessia (os.scandir, em largura).
+
+    Percorre várias raízes numa só passada, visitando cada inode
+    uma única vez: se ~ e ~/Documents são raízes, a subárvore
+    ~/Documents não é percorrida de novo a partir de ~.
+    Apenas diretórios entram na fila; arquivos são entregues
+    junto com o diretório que os contém.
+    """
+
+    max_depth: int
+    time_budget: float | None = None
+    # Caminhos que não devem ser descidos (ex.: já presentes num índice)
+    skip_paths: frozenset = frozenset()
+    stats: WalkStats = field(default_factory=WalkStats)
+
+    def iter_dirs(self, roots: Iterable[Tuple[Path | str, int]]) -> Iterator[DirListing]:
+        """
+        Lista os diretórios alcançáveis a partir de `roots`
+        (pares caminho/profundidade inicial), respeitando MAX_DEPTH:
+        só são listados diretórios cujos arquivos ficam dentro do limite.
+        """
+        started = time.monotonic()
+        deadline = started + self.time_budget if self.time_budget is not None else None
+
+        roots = [(str(path), depth) for path, depth in roots]
+
+        # Raízes são reservadas de antemão: sempre são percorridas
+        # como raiz (menor profundidade), nunca como subpasta de outra.
+        seen = set()
+        reserved = set()
+        for path, _ in roots:
+            key = _inode_key(path)
+            if key is not None:
+                reserved.add(key)
+
+        try:
+            for root, root_depth in roots:
+                root_key = _inode_key(root)
+                if root_key is None:
+                    continue
+                if root_key in seen:
+                    self.stats.pruned += 1
+                    continue
+                seen.add(root_key)
+
+                queue = deque([(root, root_depth)])
+                while queue:
+                    if deadline is not None and time.monotonic() > deadline:
+                        self.stats.timed_out = True
+                        return
+
+                    current, depth = queue.popleft()
+                    if depth >= self.max_depth:
+                        continue
+
+                    try:
+                        mtime_ns = os.stat(current).st_mtime_ns
+                        with os.scandir(current) as it:
+                            entries = list(it)
+                    except OSError:
+                        continue
+
+                    self.stats.visited += 1
+
+                    files = []
+                    for entry in entries:
+                        try:
+                            if entry.is_file():
+                                files.append(entry)
+                            elif entry.is_dir():
+                                if depth + 1 >= self.max_depth:
+                                    continue
+                                if entry.path in self.skip_paths:
+                                    self.stats.pruned += 1
+                                    continue
+                                key = _entry_key(entry)
+                                if key in seen or key in reserved:
+                                    self.stats.pruned += 1
+                                    continue
+                                seen.add(key)
+                                queue.append((entry.path, depth + 1))
+                        except OSError:
+                            continue
+
+                    yield DirListing(current, depth, mtime_ns, files)
+        finally:
+            self.stats.elapsed = time.monotonic() - started
+
+
+def find_by_name(
+    bases: Iterable[Path],
+    filename: str,
+    max_depth: int,
+    *,
+    max_matches: int = 1,
+    time_budget: float | None = None,
+) -> Tuple[List[Path], WalkStats]:
+    """
+    Busca por nome exato (case-insensitive) em todas as bases,
+    parando assim que `max_matches` arquivos forem encontrados
+    ou o orçamento de tempo acabar.
+    """
+    walker = TreeWalker(max_depth=max_depth, time_budget=time_budget)
+    target = filename.lower()
+    found: List[Path] = []
+
+    listings = walker.iter_dirs((base, 0) for base in bases)
+    try:
+        for listing in listings:
+            for entry in listing.files:
+                if entry.name.lower() == target:
+                    found.append(Path(entry.path))
+                    walker.stats.matches += 1
+                    if len(found) >= max_matches:
+                        return found, walker.stats
+    finally:
+        listings.close()
+
+    return found, walker.stats
+
+
+def _inode_key(path: str) -> Tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+def _entry_key(entry: os.DirEntry) -> Tuple[int, int]:
+    st = entry.stat()
+    return (st.st_dev, st.st_ino)
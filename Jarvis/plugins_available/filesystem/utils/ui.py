@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import difflib
 
 import datetime
@@ -14,6 +14,17 @@ def _human_file_info(path: Path) -> str:
         return f"{path} — (informação indisponível)"
 
 
+def format_candidates(ranked: List[Tuple[Path, float]]) -> str:
+    """Lista candidatos ranqueados, com o grau de semelhança quando aproximados."""
+    lines = []
+    for path, score in ranked:
+        if score >= 1.0:
+            lines.append(f"- {path}")
+        else:
+            lines.append(f"- {path} ({score:.0%} parecido)")
+    return "\n".join(lines)
+
+
 def select_targets_interactive(targets: List[Path]) -> Optional[List[Path]]:
     """
     Mostra uma lista numerada de targets para o usuário e permite:
@@ -0,0 +1,228 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import threading
+from typing import Dict, List, Tuple
+
+from Jarvis.plugins_available.filesystem.utils.file_index import FileIndex
+
+
+# Intervalo do modo polling (sem inotify): refresh incremental por mtime
+POLL_INTERVAL = 30.0
+
+# Constantes de <sys/inotify.h>
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_ONLYDIR
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class _Inotify:
+    """
+    Acesso mínimo ao inotify via ctypes (sem dependências externas).
+    Levanta OSError/AttributeError quando o sistema não suporta.
+    """
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._libc = libc
+        self.fd = libc.inotify_init1(IN_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+    def add_watch(self, path: str, mask: int) -> int:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), path)
+        return wd
+
+    def rm_watch(self, wd: int) -> None:
+        self._libc.inotify_rm_watch(self.fd, wd)
+
+    def read_events(self, timeout: float) -> List[Tuple[int, int, str]]:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+
+        data = os.read(self.fd, 64 * 1024)
+        events = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+            events.append((wd, mask, name))
+        return events
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class FilesystemWatcher:
+    """
+    Serviço residente que mantém o FileIndex aquecido.
+
+    - Com inotify: cada diretório indexado recebe um watch; criações,
+      renomeações e remoções são aplicadas direto no índice, que passa
+      a responder sem refresh (`index.live`).
+    - Sem inotify (ou sem watches disponíveis): polling periódico com
+      refresh incremental por mtime.
+    """
+
+    def __init__(self, index: FileIndex, poll_interval: float = POLL_INTERVAL):
+        self.index = index
+        self.poll_interval = poll_interval
+        self.mode: str | None = None
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._inotify: _Inotify | None = None
+        self._watches: Dict[int, Tuple[str, int]] = {}
+
+        # O diretório de cache (o banco do índice e os demais SQLite de
+        # cache, com seus -journal) pode estar sob uma base vigiada; cada
+        # commit neles viraria uma escrita no índice, e as do próprio
+        # índice, um ciclo infinito.
+        self._ignored_prefix = os.path.dirname(os.path.abspath(str(index.db_path))) + os.sep
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="jarvis-fs-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+        self.index.live = False
+
+    # -------------------------
+    # Loop principal
+    # -------------------------
+    def _run(self) -> None:
+        try:
+            self.index.refresh(force=True)
+        except Exception:
+            pass
+
+        try:
+            self._inotify = _Inotify()
+            for path, depth in self.index.directories():
+                self._watch(path, depth)
+        except (OSError, AttributeError):
+            # Sem suporte a inotify ou limite de watches atingido
+            self._close_inotify()
+            self._run_polling()
+            return
+
+        self.mode = "inotify"
+        self.index.live = True
+        try:
+            while not self._stop.is_set():
+                for wd, mask, name in self._inotify.read_events(timeout=1.0):
+                    self._handle(wd, mask, name)
+        except Exception:
+            # Qualquer falha no canal de eventos degrada para polling
+            self.index.live = False
+            self._close_inotify()
+            self._run_polling()
+            return
+
+        self._close_inotify()
+
+    def _run_polling(self) -> None:
+        self.mode = "polling"
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.index.refresh(force=True)
+            except Exception:
+                continue
+
+    def _close_inotify(self) -> None:
+        if self._inotify:
+            self._inotify.close()
+            self._inotify = None
+        self._watches.clear()
+
+    # -------------------------
+    # Eventos
+    # -------------------------
+    def _watch(self, path: str, depth: int) -> None:
+        wd = self._inotify.add_watch(path, WATCH_MASK)
+        self._watches[wd] = (path, depth)
+
+    def _handle(self, wd: int, mask: int, name: str) -> None:
+        if mask & IN_Q_OVERFLOW:
+            # Eventos perdidos: ressincroniza pelo mtime e vigia os
+            # diretórios criados nesse intervalo
+            self.index.refresh(force=True)
+            self._watch_missing()
+            return
+
+        if mask & IN_IGNORED:
+            self._watches.pop(wd, None)
+            return
+
+        watched = self._watches.get(wd)
+        if not watched or not name:
+            return
+
+        parent, depth = watched
+        full = os.path.join(parent, name)
+        if full.startswith(self._ignored_prefix):
+            return
+
+        created = mask & (IN_CREATE | IN_MOVED_TO)
+        removed = mask & (IN_DELETE | IN_MOVED_FROM)
+
+        if mask & IN_ISDIR:
+            if created and depth + 1 < self.index.max_depth:
+                for path, sub_depth in self.index.add_tree(full, depth + 1):
+                    try:
+                        self._watch(path, sub_depth)
+                    except OSError:
+                        continue
+            elif removed:
+                self.index.remove_tree(full)
+                self._unwatch_tree(full)
+            return
+
+        if created:
+            self.index.add_file(full)
+        elif removed:
+            self.index.remove_file(full)
+
+    def _watch_missing(self) -> None:
+        watched = {path for path, _ in self._watches.values()}
+        for path, depth in self.index.directories():
+            if path in watched:
+                continue
+            try:
+                self._watch(path, depth)
+            except OSError:
+                continue
+
+    def _unwatch_tree(self, path: str) -> None:
+        prefix = path.rstrip(os.sep) + os.sep
+        for wd, (watched, _) in list(self._watches.items()):
+            if watched == path or watched.startswith(prefix):
+                self._inotify.rm_watch(wd)
+                self._watches.pop(wd, None)
@@ -0,0 +1,136 @@
+import os
+import re
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, Optional
+
+
+BLOCKLIST_FILE = Path("Jarvis/data/web_blocklist.txt")
+
+# Intervalo mínimo entre verificações do arquivo (hot reload)
+RELOAD_INTERVAL = 2.0
+
+
+def _compile(patterns: Iterable[str]) -> Optional[re.Pattern]:
+    # Alternação única; as regras mais longas vêm antes, para que a
+    # regra reportada seja a mais específica na mesma posição
+    literals = sorted({p.lower() for p in patterns if p}, key=len, reverse=True)
+    if not literals:
+        return None
+    return re.compile("|".join(map(re.escape, literals)))
+
+
+class Blocklist:
+    """
+    Filtro de domínios e palavras-chave por substring, compilado numa
+    alternação por tipo: cada texto é varrido uma vez, independente
+    do número de regras.
+
+    Regras = padrões embutidos + arquivo opcional (BLOCKLIST_FILE),
+    uma por linha:
+        domain:exemplo.com
+        keyword:patrocinado
+        # comentário
+    O arquivo é recarregado quando muda (checado a cada
+    RELOAD_INTERVAL). hits conta quantas vezes cada regra bloqueou algo.
+    """
+
+    def __init__(
+        self,
+        domains: Iterable[str] = (),
+        keywords: Iterable[str] = (),
+        path: Path | None = BLOCKLIST_FILE,
+    ):
+        self._base_domains = set(domains)
+        self._base_keywords = set(keywords)
+        self.path = Path(path) if path else None
+
+        self.hits: Counter = Counter()
+        self._lock = threading.Lock()
+        self._mtime: float | None = None
+        self._last_check = 0.0
+        self._domains: Optional[re.Pattern] = None
+        self._keywords: Optional[re.Pattern] = None
+
+        self._rebuild(set(), set())
+        self.reload(force=True)
+
+    # -------------------------
+    # API pública
+    # -------------------------
+    def match_domain(self, domain: str) -> str | None:
+        """Regra de domínio que bloqueia `domain` (já minúsculo), se houver."""
+        self.reload()
+        return self._match(self._domains, domain, "domain")
+
+    def match_text(self, text: str) -> str | None:
+        """Palavra-chave que bloqueia `text` (já minúsculo), se houver."""
+        self.reload()
+        return self._match(self._keywords, text, "keyword")
+
+    def reload(self, force: bool = False) -> bool:
+        """Relê o arquivo se ele mudou. Retorna True se recompilou."""
+        now = time.monotonic()
+        if not force and now - self._last_check < RELOAD_INTERVAL:
+            return False
+        self._last_check = now
+
+        if self.path is None:
+            return False
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            mtime = None
+
+        if mtime == self._mtime and not force:
+            return False
+
+        domains, keywords = set(), set()
+        if mtime is not None:
+            try:
+                domains, keywords = _parse(self.path.read_text(encoding="utf-8"))
+            except OSError:
+                return False
+
+        self._mtime = mtime
+        self._rebuild(domains, keywords)
+        return True
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self.hits.most_common())
+
+    # -------------------------
+    # Internos
+    # -------------------------
+    def _match(self, pattern: Optional[re.Pattern], text: str, kind: str) -> str | None:
+        if pattern is None or not text:
+            return None
+        m = pattern.search(text)
+        if m is None:
+            return None
+        rule = f"{kind}:{m.group(0)}"
+        with self._lock:
+            self.hits[rule] += 1
+        return rule
+
+    def _rebuild(self, domains: set, keywords: set) -> None:
+        self._domains = _compile(self._base_domains | domains)
+        self._keywords = _compile(self._base_keywords | keywords)
+
+
+def _parse(content: str):
+    domains, keywords = set(), set()
+    for line in content.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        kind, _, value = line.partition(":")
+        value = value.strip()
+        if kind.strip().lower() == "domain" and value:
+            domains.add(value)
+        elif kind.strip().lower() == "keyword" and value:
+            keywords.add(value)
+    return domains, keywords
@@ -0,0 +1,162 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Tuple
+
+
+# Threads próprias do plugin web (não usamos o executor padrão do loop)
+MAX_WORKERS = 4
+
+# Amostras mantidas por backend para as estatísticas de latência
+LATENCY_WINDOW = 100
+
+# Um backend devolve seu resultado, ou None / vazio se não encontrou
+# nada qualificado (exceções contam como falha)
+Backend = Callable[[], Any]
+
+
+@dataclass
+class LatencyStats:
+    """Latências recentes (em segundos) e desfechos de um backend."""
+
+    samples: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+    calls: int = 0
+    failures: int = 0
+    wins: int = 0
+
+    def record(self, elapsed: float, ok: bool) -> None:
+        self.samples.append(elapsed)
+        self.calls += 1
+        if not ok:
+            self.failures += 1
+
+    def percentile(self, p: float) -> float | None:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+    def snapshot(self) -> dict:
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "wins": self.wins,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+        }
+
+
+class FetchEngine:
+    """
+    Executa backends de busca em paralelo: race() fica com o primeiro
+    resultado qualificado; gather() espera todos (com saída antecipada
+    opcional).
+
+    Os backends são síncronos (requests); cada um roda numa thread do
+    pool do próprio engine via run_in_executor, e o asyncio coordena a
+    corrida. Quando um vence, os demais são cancelados: o resultado
+    deles é descartado e o slot da thread se libera assim que a
+    requisição em curso termina (requests não interrompe I/O).
+    """
+
+    def __init__(self, max_workers: int = MAX_WORKERS):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="web-fetch")
+        self._stats: Dict[str, LatencyStats] = {}
+        self._lock = threading.Lock()
+
+    def race(
+        self,
+        backends: Dict[str, Backend],
+        timeout: float | None = None,
+    ) -> Tuple[str, Any] | None:
+        """
+        Retorna (nome do backend, resultado) do primeiro backend que
+        devolver um resultado, ou None se todos falharem / expirarem.
+        """
+        if not backends:
+            return None
+        done = self.gather(backends, timeout, stop_when=lambda name, result: True)
+        return next(iter(done.items()), None)
+
+    def gather(
+        self,
+        backends: Dict[str, Backend],
+        timeout: float | None = None,
+        stop_when: Callable[[str, Any], bool] | None = None,
+    ) -> Dict[str, Any]:
+        """
+        Resultados de todos os backends que responderam a tempo
+        (falhas e vazios ficam de fora). Se `stop_when(nome, resultado)`
+        for verdadeiro para algum, retorna só ele e cancela os demais.
+        """
+        if not backends:
+            return {}
+        return asyncio.run(self._gather(backends, timeout, stop_when))
+
+    def stats(self) -> Dict[str, dict]:
+        with self._lock:
+            return {name: s.snapshot() for name, s in self._stats.items()}
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    # -------------------------
+    # Internos
+    # -------------------------
+    async def _gather(
+        self,
+        backends: Dict[str, Backend],
+        timeout: float | None,
+        stop_when: Callable[[str, Any], bool] | None,
+    ) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        tasks = {
+            asyncio.ensure_future(loop.run_in_executor(self._pool, self._timed, name, fn)): name
+            for name, fn in backends.items()
+        }
+
+        deadline = None if timeout is None else loop.time() + timeout
+        pending = set(tasks)
+        results: Dict[str, Any] = {}
+        try:
+            while pending:
+                remaining = None if deadline is None else max(0.0, deadline - loop.time())
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break  # estourou o tempo
+
+                for task in done:
+                    if task.exception() is not None or not task.result():
+                        continue
+                    name = tasks[task]
+                    results[name] = task.result()
+                    with self._lock:
+                        self._stats_for(name).wins += 1
+                    if stop_when is not None and stop_when(name, task.result()):
+                        return {name: task.result()}
+            return results
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _timed(self, name: str, fn: Backend) -> Any:
+        start = time.perf_counter()
+        ok = False
+        try:
+            result = fn()
+            ok = bool(result)
+            return result
+        finally:
+            with self._lock:
+                self._stats_for(name).record(time.perf_counter() - start, ok)
+
+    def _stats_for(self, name: str) -> LatencyStats:
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = LatencyStats()
+        return stats
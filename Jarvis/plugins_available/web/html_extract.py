@@ -0,0 +1,170 @@
+import html as html_lib
+import re
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+
+@dataclass
+class SearchHit:
+    title: str
+    url: str
+    snippet: str
+
+
+# Só as tags que delimitam resultados interessam ao tokenizador
+_TAG = re.compile(r"<(/?)(a|div)\b([^>]*)>", re.IGNORECASE)
+_CLASS = re.compile(r"""\bclass\s*=\s*(["'])(.*?)\1""", re.IGNORECASE | re.DOTALL)
+_HREF = re.compile(r"""\bhref\s*=\s*(["'])(.*?)\1""", re.IGNORECASE | re.DOTALL)
+_INNER_TAG = re.compile(r"<[^>]*>")
+
+
+class _Done(Exception):
+    """Interrompe a extração quando já temos resultados suficientes."""
+
+
+class DuckDuckGoResultExtractor:
+    """
+    Extrai (título, URL, snippet) da página html.duckduckgo.com numa
+    única passada incremental: um tokenizador compilado percorre apenas
+    as tags <a>/<div>, e o texto de título/snippet é recortado entre
+    a abertura e o fechamento do link.
+
+    Estrutura esperada de cada resultado:
+      <div class="result ..."> (anúncios: class "result--ad")
+        <a class="result__a" href="...">título</a>
+        <a class="result__snippet" href="...">snippet</a>
+      </div>
+
+    Cada resultado completo passa por `accept`; a extração para assim
+    que `limit` resultados forem aceitos (ou `max_seen` examinados).
+    O HTML pode chegar em pedaços (feed); só o trecho ainda não
+    processado fica em memória.
+    """
+
+    def __init__(
+        self,
+        accept: Callable[[SearchHit], bool] | None = None,
+        limit: int = 3,
+        max_seen: int | None = None,
+    ):
+        self.accept = accept
+        self.limit = limit
+        self.max_seen = max_seen
+        self.hits: List[SearchHit] = []
+        self.seen = 0
+
+        self._buffer = ""
+        self._pos = 0
+        self._is_ad = False
+        self._current: Optional[SearchHit] = None
+        self._capture: Optional[str] = None  # "title" | "snippet"
+        self._capture_start = 0
+
+    # -------------------------
+    # API
+    # -------------------------
+    def feed_all(self, chunks: Iterable[str]) -> List[SearchHit]:
+        try:
+            for chunk in chunks:
+                self.feed(chunk)
+            self._flush()
+        except _Done:
+            pass
+        return self.hits
+
+    def feed(self, chunk: str) -> None:
+        self._buffer += chunk
+
+        for match in _TAG.finditer(self._buffer, self._pos):
+            self._pos = match.end()
+            self._handle(match)
+
+        # Descarta o que já foi processado (preservando um recorte em aberto)
+        keep = min(self._pos, self._capture_start) if self._capture else self._pos
+        if keep:
+            self._buffer = self._buffer[keep:]
+            self._pos -= keep
+            self._capture_start -= keep
+
+    # -------------------------
+    # Internos
+    # -------------------------
+    def _handle(self, match: re.Match) -> None:
+        closing, tag, attrs = match.group(1), match.group(2).lower(), match.group(3)
+
+        if closing:
+            if tag == "a" and self._capture and self._current is not None:
+                text = _clean_text(self._buffer[self._capture_start:match.start()])
+                if self._capture == "title":
+                    self._current.title = text
+                    self._capture = None
+                else:
+                    self._current.snippet = text
+                    self._capture = None
+                    self._flush()
+            return
+
+        classes = _attr(_CLASS, attrs).split()
+
+        if tag == "div":
+            if "result" in classes:
+                self._flush()
+                self._is_ad = "result--ad" in classes
+            return
+
+        if "result__a" in classes:
+            self._flush()
+            self._current = SearchHit(title="", url=unwrap_redirect(_attr(_HREF, attrs)), snippet="")
+            self._capture, self._capture_start = "title", match.end()
+        elif "result__snippet" in classes and self._current is not None:
+            self._capture, self._capture_start = "snippet", match.end()
+
+    def _flush(self) -> None:
+        hit, self._current = self._current, None
+        self._capture = None
+        if hit is None or self._is_ad or not hit.url:
+            return
+
+        self.seen += 1
+        if self.accept is None or self.accept(hit):
+            self.hits.append(hit)
+            if len(self.hits) >= self.limit:
+                raise _Done()
+        if self.max_seen is not None and self.seen >= self.max_seen:
+            raise _Done()
+
+
+def extract_results(
+    html: str | Iterable[str],
+    accept: Callable[[SearchHit], bool] | None = None,
+    limit: int = 3,
+    max_seen: int | None = None,
+) -> List[SearchHit]:
+    """
+    Resultados da página de busca, na ordem, até `limit` aceitos.
+    Aceita o HTML inteiro ou pedaços (ex.: iter_content).
+    """
+    chunks = [html] if isinstance(html, str) else html
+    extractor = DuckDuckGoResultExtractor(accept=accept, limit=limit, max_seen=max_seen)
+    return extractor.feed_all(chunks)
+
+
+def unwrap_redirect(url: str) -> str:
+    """Remove o redirecionador do DuckDuckGo (//duckduckgo.com/l/?uddg=...)."""
+    if "uddg=" not in url:
+        return url
+    try:
+        target = parse_qs(urlsplit(url).query).get("uddg")
+        return target[0] if target else url
+    except ValueError:
+        return url
+
+
+def _attr(pattern: re.Pattern, attrs: str) -> str:
+    match = pattern.search(attrs)
+    return html_lib.unescape(match.group(2)) if match else ""
+
+
+def _clean_text(fragment: str) -> str:
+    return " ".join(html_lib.unescape(_INNER_TAG.sub("", fragment)).split())
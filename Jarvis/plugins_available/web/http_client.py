@@ -0,0 +1,133 @@
+import re
+import threading
+from typing import Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from Jarvis.core.config import Config
+
+
+class HttpClient:
+    """
+    Camada HTTP do plugin web: uma requests.Session por host, com
+    pool de conexões keep-alive. Consultas seguidas ao mesmo host
+    reaproveitam DNS, TCP e TLS da conexão anterior.
+
+    - timeout: padrão de todas as chamadas (Config.WEB_TIMEOUT_SECONDS)
+    - pool_maxsize: conexões mantidas abertas por host
+    """
+
+    def __init__(self, timeout: float = 10, pool_maxsize: int = 4):
+        self.timeout = timeout
+        self.pool_maxsize = pool_maxsize
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Config) -> "HttpClient":
+        return cls(
+            timeout=config.WEB_TIMEOUT_SECONDS,
+            pool_maxsize=config.WEB_POOL_MAXSIZE,
+        )
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        return self._session(url).request(method, url, **kwargs)
+
+    def stats(self) -> Dict[str, dict]:
+        """
+        Reaproveitamento por host, a partir dos pools do urllib3:
+        requests feitas, conexões abertas e quantas requests
+        usaram uma conexão já existente.
+        """
+        with self._lock:
+            sessions = dict(self._sessions)
+
+        result = {}
+        for host, session in sessions.items():
+            requests_made = connections = 0
+            for adapter in session.adapters.values():
+                pools = adapter.poolmanager.pools
+                for key in pools.keys():
+                    pool = pools.get(key)
+                    if pool is None:
+                        continue
+                    requests_made += pool.num_requests
+                    connections += pool.num_connections
+            result[host] = {
+                "requests": requests_made,
+                "connections": connections,
+                "reused": max(0, requests_made - connections),
+            }
+        return result
+
+    def close(self) -> None:
+        with self._lock:
+            sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            session.close()
+
+    def _session(self, url: str) -> requests.Session:
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                # Um host por sessão: um pool basta, com várias conexões
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[host] = session
+            return session
+
+
+_MAX_AGE = re.compile(r"(?:^|,)\s*max-age\s*=\s*\"?(\d+)", re.IGNORECASE)
+_NO_CACHE = re.compile(r"(?:^|,)\s*(?:no-store|no-cache)\b", re.IGNORECASE)
+
+
+def parse_max_age(headers: Mapping[str, str]) -> int | None:
+    """
+    Validade da resposta segundo o Cache-Control, em segundos.
+    Somos um cache privado: vale max-age (s-maxage é para proxies);
+    no-store / no-cache valem 0 (revalidar sempre). None = servidor
+    não informou.
+    """
+    value = headers.get("Cache-Control") or ""
+    if _NO_CACHE.search(value):
+        return 0
+    m = _MAX_AGE.search(value)
+    return int(m.group(1)) if m else None
+
+
+def conditional_headers(etag: str | None, last_modified: str | None) -> Dict[str, str]:
+    """Cabeçalhos de revalidação a partir dos validadores guardados."""
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+_client: Optional[HttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client(config: Config | None = None) -> HttpClient:
+    """
+    Cliente compartilhado do plugin web. A configuração da primeira
+    chamada define timeout e tamanho dos pools.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient.from_config(config or Config())
+        return _client
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 
 @dataclass
@@ -7,6 +7,16 @@ class WebRequest:
     query: str
 
 
+@dataclass
+class WebCandidate:
+    """Resultado individual (API ou HTML) antes do ranqueamento."""
+    title: str
+    url: str
+    text: str
+    source: str
+    max_age: Optional[int] = None  # Cache-Control da resposta de origem
+
+
 @dataclass
 class WebResult:
     query: str
@@ -15,3 +25,5 @@ class WebResult:
     confidence: float
     is_summary: bool = False
     is_partial: bool = False
+    # Validade informada pelo servidor (Cache-Control), em segundos
+    max_age: Optional[int] = None
@@ -0,0 +1,136 @@
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+
+CACHE_FILE = Path("Jarvis/data/cache/web_pages.sqlite")
+
+# Validade do texto extraído quando o servidor não manda Cache-Control
+PAGE_TTL_SECONDS = 3600
+
+# Limite de páginas guardadas (as mais antigas saem primeiro)
+MAX_PAGES = 2000
+
+
+@dataclass
+class CachedPage:
+    url: str
+    text: str
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+    max_age: int | None = None  # Cache-Control: max-age da resposta
+
+    def is_fresh(self, now: float, ttl: float = PAGE_TTL_SECONDS) -> bool:
+        if self.max_age is not None:
+            ttl = self.max_age
+        return now - self.fetched_at <= ttl
+
+
+class PageCache:
+    """
+    Texto principal de páginas já baixadas, por URL, junto com o
+    ETag / Last-Modified e o max-age da resposta que o originou.
+    Uma página vencida é revalidada com requisição condicional; um
+    304 só renova a entrada (touch), sem baixar o corpo de novo.
+    """
+
+    def __init__(self, db_path: Path | None = CACHE_FILE):
+        self._lock = threading.Lock()
+        self._memory: dict[str, CachedPage] = {}
+        self._conn: sqlite3.Connection | None = None
+
+        if db_path is not None:
+            try:
+                db_path = Path(db_path)
+                db_path.parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+                self._conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS pages (
+                        url TEXT PRIMARY KEY,
+                        text TEXT NOT NULL,
+                        etag TEXT,
+                        last_modified TEXT,
+                        fetched_at REAL NOT NULL,
+                        max_age INTEGER
+                    )
+                    """
+                )
+                self._migrate()
+                self._conn.commit()
+            except (sqlite3.Error, OSError):
+                # Sem disco, o cache de páginas vive só nesta execução
+                self._conn = None
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        with self._lock:
+            page = self._memory.get(url)
+            if page is not None or self._conn is None:
+                return page
+            try:
+                row = self._conn.execute(
+                    "SELECT text, etag, last_modified, fetched_at, max_age FROM pages WHERE url = ?",
+                    (url,),
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+        if row is None:
+            return None
+        return CachedPage(url, *row)
+
+    def put(self, page: CachedPage) -> None:
+        with self._lock:
+            self._memory.pop(page.url, None)
+            self._memory[page.url] = page
+            if len(self._memory) > MAX_PAGES:
+                self._memory.pop(next(iter(self._memory)))
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO pages "
+                    "(url, text, etag, last_modified, fetched_at, max_age) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (page.url, page.text, page.etag, page.last_modified,
+                     page.fetched_at, page.max_age),
+                )
+                self._conn.execute(
+                    "DELETE FROM pages WHERE url IN ("
+                    " SELECT url FROM pages ORDER BY fetched_at DESC LIMIT -1 OFFSET ?)",
+                    (MAX_PAGES,),
+                )
+                self._conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def touch(
+        self,
+        page: CachedPage,
+        fetched_at: float,
+        max_age: int | None = None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> CachedPage:
+        """
+        Renova uma página após um 304: mesmo texto, nova data de busca.
+        Validadores / max-age enviados no 304 substituem os antigos.
+        """
+        renewed = CachedPage(
+            url=page.url,
+            text=page.text,
+            etag=etag or page.etag,
+            last_modified=last_modified or page.last_modified,
+            fetched_at=fetched_at,
+            max_age=max_age if max_age is not None else page.max_age,
+        )
+        self.put(renewed)
+        return renewed
+
+    def _migrate(self) -> None:
+        # Bancos criados antes do max-age não têm a coluna
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(pages)")}
+        if "max_age" not in columns:
+            self._conn.execute("ALTER TABLE pages ADD COLUMN max_age INTEGER")
@@ -0,0 +1,198 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+from Jarvis.core.config import Config
+from Jarvis.plugins_available.web.http_client import (
+    HttpClient,
+    conditional_headers,
+    get_http_client,
+    parse_max_age,
+)
+from Jarvis.plugins_available.web.page_cache import CachedPage, PageCache
+from Jarvis.plugins_available.web.readability import extract_main_text
+
+
+# Intervalo mínimo entre duas requisições ao mesmo host
+HOST_INTERVAL_SECONDS = 1.0
+
+# Texto principal guardado por página
+MAX_PAGE_CHARS = 4000
+
+_READ_CHUNK = 16 * 1024
+
+_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.5",
+}
+
+
+class HostRateLimiter:
+    """Espaça requisições ao mesmo host em pelo menos `interval` segundos."""
+
+    def __init__(self, interval: float = HOST_INTERVAL_SECONDS):
+        self.interval = interval
+        self._next: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, host: str) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next.get(host, 0.0))
+            self._next[host] = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class PageFetcher:
+    """
+    Baixa as páginas dos melhores resultados em paralelo (pool
+    limitado) e extrai o texto principal de cada uma.
+
+    - limite de bytes por página (o corpo é lido em streaming e cortado)
+    - limite de ritmo por host
+    - cache por URL, com a validade do Cache-Control (max-age) e
+      revalidação condicional (If-None-Match / If-Modified-Since):
+      uma página que não mudou custa um 304, sem corpo
+    """
+
+    def __init__(
+        self,
+        http: HttpClient,
+        cache: PageCache | None = None,
+        max_workers: int = 4,
+        max_bytes: int = 512 * 1024,
+        enabled: bool = False,
+        pages: int = 3,
+    ):
+        self.http = http
+        self.cache = cache if cache is not None else PageCache()
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.pages = pages
+        self.limiter = HostRateLimiter()
+        self._stats = {"cached": 0, "downloaded": 0, "not_modified": 0, "bytes": 0}
+        self._stats_lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="web-page")
+
+    @classmethod
+    def from_config(cls, config: Config) -> "PageFetcher":
+        return cls(
+            http=get_http_client(config),
+            max_bytes=config.WEB_PAGE_MAX_BYTES,
+            enabled=config.WEB_DEEP_FETCH,
+            pages=config.WEB_DEEP_FETCH_PAGES,
+        )
+
+    def fetch_many(self, urls: Iterable[str], timeout: float | None = None) -> Dict[str, str]:
+        """
+        Texto principal de cada URL (as que falharem ou vierem vazias
+        ficam de fora). Todas correm em paralelo; o tempo total é
+        limitado por `timeout` (padrão: o do cliente HTTP).
+        """
+        urls = list(dict.fromkeys(u for u in urls if u.startswith(("http://", "https://"))))
+        if not urls:
+            return {}
+
+        timeout = timeout if timeout is not None else self.http.timeout
+        deadline = time.monotonic() + timeout
+        futures = {url: self._pool.submit(self.fetch, url) for url in urls}
+
+        texts = {}
+        for url, future in futures.items():
+            try:
+                text = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except Exception:
+                future.cancel()
+                continue
+            if text:
+                texts[url] = text
+        return texts
+
+    def fetch(self, url: str) -> Optional[str]:
+        now = time.time()
+        cached = self.cache.get(url)
+        if cached is not None and cached.is_fresh(now):
+            self._count("cached")
+            return cached.text
+
+        headers = dict(_HEADERS)
+        if cached is not None:
+            headers.update(conditional_headers(cached.etag, cached.last_modified))
+
+        self.limiter.wait(urlsplit(url).netloc.lower())
+        resp = self.http.get(url, headers=headers, stream=True)
+        try:
+            if resp.status_code == 304 and cached is not None:
+                self._count("not_modified")
+                return self.cache.touch(
+                    cached,
+                    fetched_at=now,
+                    max_age=parse_max_age(resp.headers),
+                    etag=resp.headers.get("ETag"),
+                    last_modified=resp.headers.get("Last-Modified"),
+                ).text
+
+            resp.raise_for_status()
+            content_type = resp.headers.get("Content-Type", "")
+            if "html" not in content_type and "text" not in content_type:
+                return None
+            body = self._read_capped(resp, content_type)
+        finally:
+            resp.close()
+
+        text = extract_main_text(body, max_chars=MAX_PAGE_CHARS)
+        self.cache.put(CachedPage(
+            url=url,
+            text=text,
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+            fetched_at=now,
+            max_age=parse_max_age(resp.headers),
+        ))
+        return text
+
+    def stats(self) -> Dict[str, int]:
+        """
+        cached: servidas do cache sem rede; not_modified: revalidadas
+        com 304; downloaded / bytes: corpos baixados de fato.
+        """
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _count(self, key: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    def _read_capped(self, resp, content_type: str) -> str:
+        chunks = []
+        size = 0
+        for chunk in resp.iter_content(chunk_size=_READ_CHUNK):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= self.max_bytes:
+                break
+        data = b"".join(chunks)[: self.max_bytes]
+        self._count("downloaded")
+        self._count("bytes", len(data))
+        # Sem charset explícito, requests assume ISO-8859-1; a web é UTF-8
+        encoding = resp.encoding if "charset" in content_type.lower() else "utf-8"
+        return data.decode(encoding or "utf-8", errors="replace")
+
+
+_fetcher: Optional[PageFetcher] = None
+_fetcher_lock = threading.Lock()
+
+
+def get_page_fetcher(config: Config | None = None) -> PageFetcher:
+    """
+    Instância compartilhada. A configuração da primeira chamada define
+    se o deep fetch está ligado, quantas páginas e o limite de bytes.
+    """
+    global _fetcher
+    with _fetcher_lock:
+        if _fetcher is None:
+            _fetcher = PageFetcher.from_config(config or Config())
+        return _fetcher
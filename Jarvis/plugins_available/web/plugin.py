@@ -1,13 +1,21 @@
-import requests
-from typing import TYPE_CHECKING
+import threading
+import time
+from typing import TYPE_CHECKING, List
 from pathlib import Path
 from datetime import datetime
 from Jarvis.plugins.base import Plugin
 from Jarvis.core.action_request import ActionRequest
 from Jarvis.core.action_result import ActionResult
 from Jarvis.core.intent import IntentType
-from Jarvis.plugins_available.web.models import WebRequest, WebResult
-from Jarvis.plugins_available.web.web_cache import WebCache
+from Jarvis.plugins_available.web.models import WebCandidate, WebRequest, WebResult
+from Jarvis.plugins_available.web.web_cache import get_web_cache
+from Jarvis.plugins_available.web.fetch_engine import FetchEngine
+from Jarvis.plugins_available.web.single_flight import SingleFlight
+from Jarvis.plugins_available.web.html_extract import SearchHit, extract_results
+from Jarvis.plugins_available.web.blocklist import Blocklist
+from Jarvis.plugins_available.web.ranking import BM25Ranker
+from Jarvis.plugins_available.web.page_fetcher import get_page_fetcher
+from Jarvis.plugins_available.web.http_client import get_http_client, parse_max_age
 from Jarvis.core.errors import PluginError
 
 if TYPE_CHECKING:
@@ -31,7 +39,18 @@ class WebPlugin(Plugin):
     }
 
     INTENT = IntentType.WEB_FETCH
-    cache = WebCache()
+    engine = FetchEngine()
+
+    # Buscas idênticas simultâneas compartilham uma única requisição
+    flight = SingleFlight()
+
+    # Ranking dos candidatos (API + HTML); só os melhores vão ao RAG
+    ranker = BM25Ranker()
+    TOP_K = 3
+
+    # Consultas sendo revalidadas em segundo plano (stale-while-revalidate)
+    _refreshing: set[str] = set()
+    _refreshing_lock = threading.Lock()
 
     # Blacklist de domínios (anúncios, trackers e lixo técnico)
     BLACKLIST_DOMAINS = {
@@ -47,6 +66,10 @@ class WebPlugin(Plugin):
         "sponsored", "promoção", "oferta", "compre agora", "venda", "shopping"
     }
 
+    # Listas acima + Jarvis/data/web_blocklist.txt, compiladas uma vez
+    # (e recompiladas quando o arquivo muda)
+    blocklist = Blocklist(BLACKLIST_DOMAINS, BLACKLIST_KEYWORDS)
+
     def execute(self, action: ActionRequest, dry_run: bool = False) -> ActionResult:
         if dry_run:
             return ActionResult(
@@ -58,6 +81,13 @@ class WebPlugin(Plugin):
                 confidence=0.0,
             )
 
+        # Sessões HTTP e cache compartilhados; a primeira execução
+        # fixa timeout, pools e TTL a partir da Config do contexto
+        config = getattr(action.context, "config", None)
+        get_http_client(config)
+        get_web_cache(config)
+        get_page_fetcher(config)
+
         web_request = self._build_request(action)
         if not web_request:
             return ActionResult(
@@ -70,12 +100,20 @@ class WebPlugin(Plugin):
             )
 
         try:
-            # tenta cache primeiro
-            cached = WebPlugin.cache.get(web_request.query)
-            if cached:
+            # tenta cache primeiro; entrada vencida é servida na hora
+            # e revalidada em segundo plano
+            entry = self.cache.lookup(web_request.query)
+            if entry:
+                cached = entry.result
+                stale = not entry.is_fresh(time.time())
+                if stale:
+                    self._refresh_in_background(web_request)
                 return ActionResult(
                     success=True,
-                    message="Resultado retornado do cache.",
+                    message=(
+                        "Resultado retornado do cache (atualizando em segundo plano)."
+                        if stale else "Resultado retornado do cache."
+                    ),
                     data=cached,
                     origin="web",
                     content=getattr(cached, "content", None) or "",
@@ -83,12 +121,7 @@ class WebPlugin(Plugin):
                 )
 
             # faz a busca real
-            result = self._fetch(web_request)
-
-            # Qualificação Final: Se o resultado retornado for "Nenhum resultado", 
-            # não salvamos no cache para permitir novas tentativas se o scraper falhar temporariamente.
-            if result.content and "Nenhum resultado" not in result.content:
-                WebPlugin.cache.set(web_request.query, result)
+            result = self._fetch_and_store(web_request)
 
             return ActionResult(
                 success=True,
@@ -110,6 +143,54 @@ class WebPlugin(Plugin):
                 confidence=0.0,
             )
 
+    @property
+    def http(self):
+        return get_http_client()
+
+    @property
+    def cache(self):
+        return get_web_cache()
+
+    def _fetch_and_store(self, req: WebRequest) -> WebResult:
+        """
+        Busca coalescida pela chave de cache: se a mesma consulta
+        (na forma canônica) já está em andamento, espera o resultado dela.
+        """
+        key = self.cache.key_for(req.query)
+        return WebPlugin.flight.do(key, lambda: self._fetch_uncoalesced(req))
+
+    def _fetch_uncoalesced(self, req: WebRequest) -> WebResult:
+        result = self._fetch(req)
+
+        # Qualificação Final: "Nenhum resultado" fica só em cache negativo
+        # curto, permitindo novas tentativas se o scraper falhar
+        # temporariamente sem martelar o backend enquanto isso.
+        if result.content and "Nenhum resultado" not in result.content:
+            self.cache.set(req.query, result)
+        else:
+            self.cache.set_negative(req.query, result)
+        return result
+
+    def _refresh_in_background(self, req: WebRequest) -> None:
+        # Mesma chave do cache: variantes que leem a mesma entrada
+        # stale ('clima em SP?' / 'clima SP') dividem um único refetch
+        key = self.cache.key_for(req.query)
+        with WebPlugin._refreshing_lock:
+            if key in WebPlugin._refreshing:
+                return
+            WebPlugin._refreshing.add(key)
+
+        def refresh():
+            try:
+                self._fetch_and_store(req)
+            except Exception:
+                pass  # mantém a entrada stale; a próxima consulta tenta de novo
+            finally:
+                with WebPlugin._refreshing_lock:
+                    WebPlugin._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name="web-refresh", daemon=True).start()
+
     def _build_request(self, action: ActionRequest) -> WebRequest | None:
         query = (
             (action.params or {}).get("query")
@@ -134,10 +215,65 @@ class WebPlugin(Plugin):
 
     def _fetch(self, req: WebRequest) -> WebResult:
         """
-        Faz a requisição na API externa (DuckDuckGo por padrão)
-        e converte para WebResult de forma padronizada com filtragem.
+        Consulta a API do DuckDuckGo e o HTML de busca ao mesmo tempo.
+        Um Abstract da API encerra a busca na hora (o HTML é cancelado);
+        senão, os candidatos de ambos são ranqueados por BM25 e só os
+        TOP_K melhores seguem para o conteúdo (e para o prompt de RAG).
+        Latências por backend ficam em WebPlugin.engine.stats().
+        """
+        found = WebPlugin.engine.gather(
+            {
+                "duckduckgo-api": lambda: self._fetch_api(req),
+                "duckduckgo-html": lambda: self._scrape_html(req),
+            },
+            timeout=self.http.timeout,
+            stop_when=lambda name, result: isinstance(result, WebResult),
+        )
+
+        abstract = next((r for r in found.values() if isinstance(r, WebResult)), None)
+        if abstract:
+            return abstract
+
+        candidates = self._dedupe(
+            found.get("duckduckgo-api", []) + found.get("duckduckgo-html", [])
+        )
+        ranked = self.ranker.rank(req.query, candidates, k=self.TOP_K)
+
+        if ranked:
+            pages = self._deep_fetch([c for c, _ in ranked])
+            return WebResult(
+                query=req.query,
+                content="\n\n".join(
+                    self._format_candidate(c, pages.get(c.url)) for c, _ in ranked
+                ),
+                sources=[c.url for c, _ in ranked],
+                confidence=0.8 if len(ranked) > 1 else 0.7,
+                is_summary=False,
+                is_partial=True,
+                # vale a validade mais curta entre as respostas que
+                # informaram uma (no-cache/no-store = 0 não conta)
+                max_age=min(
+                    (c.max_age for c, _ in ranked if c.max_age),
+                    default=None,
+                ),
+            )
+
+        return WebResult(
+            query=req.query,
+            content="Nenhum resultado qualificado encontrado.",
+            sources=["duckduckgo"],
+            confidence=0.1,
+            is_summary=False,
+            is_partial=True
+        )
+
+    def _fetch_api(self, req: WebRequest) -> WebResult | List[WebCandidate]:
+        """
+        Faz a requisição na API externa (DuckDuckGo por padrão).
+        Retorna o Abstract como WebResult pronto quando existe; senão,
+        a lista (possivelmente vazia) de candidatos filtrados.
         """
-        response = requests.get(
+        response = self.http.get(
             "https://api.duckduckgo.com/",
             params={
                 "q": req.query,
@@ -147,10 +283,10 @@ class WebPlugin(Plugin):
                 "skip_disambig": 1,
                 "kl": "pt-br",
             },
-            timeout=10,
         )
         response.raise_for_status()
         data = response.json()
+        max_age = parse_max_age(response.headers)
 
         # 1) Prefer AbstractText (Geralmente alta qualidade)
         if data.get("AbstractText") and not self._is_trash(data.get("Heading", ""), data["AbstractText"], data.get("AbstractURL", "")):
@@ -160,124 +296,90 @@ class WebPlugin(Plugin):
                 sources=[data.get("AbstractSource") or "duckduckgo"],
                 confidence=0.9,
                 is_summary=True,
-                is_partial=False
+                is_partial=False,
+                max_age=max_age,
             )
 
-        # Se não tem Abstract, tentamos coletar múltiplos resultados qualificados
-        qualified_results = []
-        
-        # 2) Results
-        if data.get("Results") and isinstance(data.get("Results"), list):
-            for r in data.get("Results"):
-                if isinstance(r, dict) and r.get("Text"):
-                    url = r.get("FirstURL", "")
-                    text = r.get("Text", "")
-                    if not self._is_trash("", text, url):
-                        qualified_results.append(f"Fonte: {url}\n{text}")
-
-        # 3) RelatedTopics
-        related = data.get("RelatedTopics") or []
-        for item in related:
+        # 2) Results e 3) RelatedTopics viram candidatos para o ranking
+        items = []
+        if isinstance(data.get("Results"), list):
+            items.extend(data["Results"])
+        items.extend(data.get("RelatedTopics") or [])
+
+        candidates = []
+        for item in items:
             if isinstance(item, dict) and item.get("Text"):
                 url = item.get("FirstURL", "")
                 text = item.get("Text", "")
                 if not self._is_trash("", text, url):
-                    qualified_results.append(f"Fonte: {url}\n{text}")
-
-        if qualified_results:
-            # Retorna os top 2 qualificados
-            return WebResult(
-                query=req.query,
-                content="\n\n".join(qualified_results[:2]),
-                sources=["duckduckgo-api"],
-                confidence=0.7,
-                is_summary=False,
-                is_partial=True
-            )
-
-        # 4) Fallback: Scraping HTML simples (html.duckduckgo.com)
-        try:
-            return self._scrape_html(req)
-        except Exception:
-            pass
-
-        return WebResult(
-            query=req.query,
-            content="Nenhum resultado qualificado encontrado.",
-            sources=["duckduckgo"],
-            confidence=0.1,
-            is_summary=False,
-            is_partial=True
-        )
-
-    def _scrape_html(self, req: WebRequest) -> WebResult:
-        import re
-        from urllib.parse import unquote
+                    candidates.append(WebCandidate(
+                        title="", url=url, text=text, source="duckduckgo-api", max_age=max_age
+                    ))
+        return candidates
 
+    def _scrape_html(self, req: WebRequest) -> List[WebCandidate]:
         headers = {
             "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36"
         }
         
-        resp = requests.post(
+        resp = self.http.post(
             "https://html.duckduckgo.com/html/",
             data={"q": req.query},
             headers=headers,
-            timeout=10
         )
         resp.raise_for_status()
-        html = resp.text
-
-        # Extração agnóstica a ordem
-        matches = re.findall(r'<a[^>]+href="([^"]+)"[^]*class="[^"]*result__a[^"]*"[^]*>(.*?)</a>', html)
-        if not matches:
-             matches = re.findall(r'<a[^>]+class="[^"]*result__a[^"]*"[^]*href="([^"]+)"[^]*>(.*?)</a>', html)
-
-        links = matches
-        snippets = re.findall(r'<a[^>]+class="[^"]*result__snippet[^"]*"[^]*href="[^"]+">(.*?)</a>', html)
-        if not snippets:
-            snippets = re.findall(r'<a[^>]+href="[^"]+"[^]*class="[^"]*result__snippet[^"]*"[^]*>(.*?)</a>', html)
-
-        final_text_parts = []
-        count = 0
-        limit = 4 # Analisamos mais para filtrar ads
-
-        for i in range(min(len(links), len(snippets), 10)):
-            raw_url = links[i][0]
-            title = re.sub(r'<[^>]+>', '', links[i][1])
-            snippet = re.sub(r'<[^>]+>', '', snippets[i])
-            
-            # Unquote DDG wrapper
-            url = raw_url
-            if "uddg=" in url:
-                try:
-                    url = unquote(url.split("uddg=")[1].split("&")[0])
-                except: pass
-
-            # Limpeza e Filtragem
-            url = self._clean_url(url)
-            if self._is_trash(title, snippet, url):
-                continue
 
-            # Verificação Semântica Simples: 
-            # Se a query for longa, exige que ao menos um termo significativo esteja no resultado
-            if not self._is_relevant(req.query, title, snippet):
-                continue
+        def qualifies(hit: SearchHit) -> bool:
+            # Limpeza e Filtragem (a relevância fica com o ranking)
+            hit.url = self._clean_url(hit.url)
+            return not self._is_trash(hit.title, hit.snippet, hit.url)
 
-            final_text_parts.append(f"Título: {title}\nURL: {url}\nResumo: {snippet}")
-            count += 1
-            if count >= 3: break
+        # Passada única no HTML; os 10 primeiros resultados bastam
+        hits = extract_results(resp.text, accept=qualifies, limit=10, max_seen=10)
+        max_age = parse_max_age(resp.headers)
 
-        if final_text_parts:
-            return WebResult(
-                query=req.query,
-                content="\n\n".join(final_text_parts),
-                sources=["duckduckgo-html"],
-                confidence=0.8,
-                is_summary=False,
-                is_partial=True
+        return [
+            WebCandidate(
+                title=h.title, url=h.url, text=h.snippet, source="duckduckgo-html", max_age=max_age
             )
-        
-        raise Exception("Filtros removeram todos os resultados.")
+            for h in hits
+        ]
+
+    @staticmethod
+    def _dedupe(candidates: List[WebCandidate]) -> List[WebCandidate]:
+        seen = set()
+        unique = []
+        for c in candidates:
+            key = c.url.rstrip("/").lower()
+            if key and key in seen:
+                continue
+            seen.add(key)
+            unique.append(c)
+        return unique
+
+    def _deep_fetch(self, candidates: List[WebCandidate]) -> dict:
+        """
+        Texto principal das páginas dos melhores candidatos, baixadas
+        em paralelo (desligado por padrão: Config.WEB_DEEP_FETCH).
+        Falhas só deixam o candidato com o snippet.
+        """
+        fetcher = get_page_fetcher()
+        if not fetcher.enabled:
+            return {}
+        try:
+            return fetcher.fetch_many(c.url for c in candidates[: fetcher.pages])
+        except Exception:
+            return {}
+
+    @staticmethod
+    def _format_candidate(c: WebCandidate, page: str | None = None) -> str:
+        if c.title:
+            text = f"Título: {c.title}\nURL: {c.url}\nResumo: {c.text}"
+        else:
+            text = f"Fonte: {c.url}\n{c.text}"
+        if page:
+            text += f"\nConteúdo da página:\n{page}"
+        return text
 
     def _clean_url(self, url: str) -> str:
         from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
@@ -300,32 +402,15 @@ class WebPlugin(Plugin):
             domain = ""
         
         # 1. Blacklist de domínios
-        for black in self.BLACKLIST_DOMAINS:
-            if black in domain: return True
-        
+        if self.blocklist.match_domain(domain):
+            return True
+
         # 2. Blacklist de keywords no conteúdo
-        text = f"{title} {content}".lower()
-        for kw in self.BLACKLIST_KEYWORDS:
-            if kw in text: return True
-            
+        if self.blocklist.match_text(f"{title} {content}".lower()):
+            return True
+
         # 3. URLs técnicas óbvias
         if domain.endswith(".js") or "/ads/" in url or "ad_domain" in url:
             return True
             
         return False
-
-    def _is_relevant(self, query: str, title: str, snippet: str) -> bool:
-        """
-        Heurística de relevância semântica:
-        Verifica se termos importantes da query aparecem no resultado.
-        """
-        query_terms = [t.lower() for t in query.split() if len(t) > 3]
-        if not query_terms: return True # Query muito curta, aceita qualquer coisa qualificada
-        
-        text = f"{title} {snippet}".lower()
-        matches = [t for t in query_terms if t in text]
-        
-        # Exige que ao menos 30% dos termos significativos estejam presentes
-        return len(matches) / len(query_terms) >= 0.3
-
-
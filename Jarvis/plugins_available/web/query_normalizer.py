@@ -0,0 +1,69 @@
+import re
+import unicodedata
+
+
+# Palavras sem peso na busca (já sem acento). Inclui marcadores
+# temporais: toda consulta é respondida "agora", e a validade do
+# resultado é papel do TTL do cache. Preposições de negação e direção
+# (com/sem, de/para, por) ficam de fora: 'bolo sem açúcar' não é
+# 'bolo com açúcar', nem 'real para dólar' é 'dólar para real'.
+STOPWORDS = frozenset({
+    "a", "o", "as", "os", "um", "uma", "uns", "umas",
+    "em", "no", "na", "nos", "nas",
+    "sobre", "ao", "aos", "e", "ou", "que", "se",
+    "qual", "quais", "quem", "quanto", "quanta", "quantos", "quantas",
+    "como", "onde", "quando", "eh", "sao", "foi", "ser", "esta", "estao",
+    "me", "meu", "minha", "voce", "diga", "fale", "mostre",
+    "hoje", "agora", "atual", "atualmente",
+})
+
+# Contrações reduzidas à preposição base ('do dólar' = 'de dólar')
+_CONTRACTIONS = {
+    "do": "de", "da": "de", "dos": "de", "das": "de",
+    "pelo": "por", "pela": "por", "pelos": "por", "pelas": "por",
+    "pra": "para", "pro": "para", "pras": "para", "pros": "para",
+}
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# Sufixos de plural, do mais longo ao mais curto: (sufixo, substituto)
+_PLURALS = (
+    ("oes", "ao"), ("aes", "ao"), ("ais", "al"), ("eis", "el"),
+    ("ois", "ol"), ("res", "r"), ("zes", "z"), ("ns", "m"), ("s", ""),
+)
+
+
+def fold_accents(text: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def stem(token: str) -> str:
+    """Stemming leve: apenas plural → singular (estilo RSLP, etapa 1)."""
+    if len(token) <= 3:
+        return token
+    for suffix, replacement in _PLURALS:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 2:
+            return token[: -len(suffix)] + replacement
+    return token
+
+
+def canonical_query(query: str, stemming: bool = True) -> str:
+    """
+    Forma canônica de uma consulta, usada como chave de cache:
+    sem acentos, minúscula, sem pontuação nem stopwords, contrações
+    reduzidas e tokens opcionalmente no singular. A ordem das palavras
+    é mantida: com as preposições na chave, ela também carrega sentido.
+
+    'Qual a cotação do dólar hoje?' → 'cotacao de dolar'
+    'cotacao de dolar hoje'         → 'cotacao de dolar'
+    'converter real para dólar'     → 'converter real para dolar'
+
+    Se sobrar só stopword, cai para os tokens originais, para que
+    consultas curtas ('o que é') não colidam todas na chave vazia.
+    """
+    tokens = _TOKEN.findall(fold_accents(query).lower())
+    kept = [_CONTRACTIONS.get(t, t) for t in tokens if t not in STOPWORDS] or tokens
+    if stemming:
+        kept = [stem(t) for t in kept]
+    return " ".join(kept)
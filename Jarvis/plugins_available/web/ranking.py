@@ -0,0 +1,71 @@
+import math
+import re
+from collections import Counter
+from typing import List, Sequence, Tuple
+
+from Jarvis.plugins_available.web.models import WebCandidate
+from Jarvis.plugins_available.web.query_normalizer import STOPWORDS, fold_accents, stem
+
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Tokens sem acento, minúsculos, sem stopwords e no singular."""
+    return [
+        stem(t)
+        for t in _TOKEN.findall(fold_accents(text).lower())
+        if t not in STOPWORDS
+    ]
+
+
+class BM25Ranker:
+    """
+    BM25 sobre o pequeno conjunto de candidatos de uma busca
+    (resultados da API + HTML). O IDF é calculado sobre os próprios
+    candidatos: termos que aparecem em todos pesam pouco.
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+
+    def rank(
+        self,
+        query: str,
+        candidates: Sequence[WebCandidate],
+        k: int = 3,
+    ) -> List[Tuple[WebCandidate, float]]:
+        """
+        Top-k (candidato, score) por score decrescente. Candidatos
+        sem nenhum termo da consulta ficam de fora; se a consulta não
+        tiver termos úteis, mantém a ordem de chegada.
+        """
+        terms = set(tokenize(query))
+        if not candidates:
+            return []
+        if not terms:
+            return [(c, 0.0) for c in candidates[:k]]
+
+        docs = [Counter(tokenize(f"{c.title} {c.text}")) for c in candidates]
+        n = len(docs)
+        avg_len = sum(sum(d.values()) for d in docs) / n or 1.0
+        df = {t: sum(1 for d in docs if t in d) for t in terms}
+
+        scored = []
+        for index, (candidate, tf) in enumerate(zip(candidates, docs)):
+            length = sum(tf.values())
+            score = 0.0
+            for term in terms:
+                freq = tf.get(term, 0)
+                if not freq:
+                    continue
+                idf = math.log(1 + (n - df[term] + 0.5) / (df[term] + 0.5))
+                norm = freq + self.k1 * (1 - self.b + self.b * length / avg_len)
+                score += idf * freq * (self.k1 + 1) / norm
+            if score > 0:
+                # índice como desempate: preserva a ordem original
+                scored.append((score, -index, candidate))
+
+        scored.sort(reverse=True, key=lambda item: (item[0], item[1]))
+        return [(candidate, round(score, 4)) for score, _, candidate in scored[:k]]
@@ -0,0 +1,66 @@
+import html as html_lib
+import re
+from typing import List
+
+
+# Conteúdo que nunca é texto do artigo
+_DROP = re.compile(
+    r"<(script|style|noscript|svg|iframe|template|nav|header|footer|aside|form)\b.*?</\1\s*>"
+    r"|<!--.*?-->",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Contêineres que costumam delimitar o conteúdo principal
+_MAIN = re.compile(r"<(article|main)\b[^>]*>(.*?)</\1\s*>", re.IGNORECASE | re.DOTALL)
+
+# Fronteiras de bloco: o texto entre elas vira um parágrafo candidato
+_BLOCK = re.compile(
+    r"</?(?:p|div|section|li|ul|ol|h[1-6]|blockquote|pre|table|tr|td|dd|dt|br)\b[^>]*>",
+    re.IGNORECASE,
+)
+
+_LINK = re.compile(r"<a\b[^>]*>(.*?)</a\s*>", re.IGNORECASE | re.DOTALL)
+_TAG = re.compile(r"<[^>]+>")
+
+# Parágrafos curtos ou feitos quase só de links são menu/rodapé/listagem
+MIN_BLOCK_CHARS = 60
+MAX_LINK_DENSITY = 0.3
+
+
+def extract_main_text(page: str, max_chars: int = 4000) -> str:
+    """
+    Remove boilerplate de uma página HTML e devolve o texto principal.
+
+    Heurística de densidade (estilo readability, sem DOM):
+    1) descarta scripts, estilos, nav/header/footer/aside/form
+    2) se houver <article>/<main>, restringe-se a eles
+    3) quebra em blocos e mantém os longos o bastante e com pouca
+       proporção de texto em links
+    """
+    page = _DROP.sub(" ", page)
+
+    mains = [m.group(2) for m in _MAIN.finditer(page)]
+    if mains:
+        page = "\n".join(mains)
+
+    kept: List[str] = []
+    total = 0
+    for block in _BLOCK.split(page):
+        text = _text(block)
+        if len(text) < MIN_BLOCK_CHARS:
+            continue
+
+        link_chars = sum(len(_text(m.group(1))) for m in _LINK.finditer(block))
+        if link_chars / len(text) > MAX_LINK_DENSITY:
+            continue
+
+        kept.append(text)
+        total += len(text)
+        if total >= max_chars:
+            break
+
+    return "\n\n".join(kept)[:max_chars]
+
+
+def _text(fragment: str) -> str:
+    return " ".join(html_lib.unescape(_TAG.sub(" ", fragment)).split())
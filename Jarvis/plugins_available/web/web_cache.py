@@ -1,30 +1,181 @@
-import time
+import json
 import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
 from typing import Optional
+
+from Jarvis.core.config import Config
 from Jarvis.plugins_available.web.models import WebResult
+from Jarvis.plugins_available.web.query_normalizer import canonical_query
+
+
+CACHE_FILE = Path("Jarvis/data/cache/web_cache.sqlite")
+
+# Orçamento da camada em memória (JSON serializado)
+MAX_MEMORY_BYTES = 4 * 1024 * 1024
+
+# Limite de entradas no disco (as que expiram primeiro saem antes)
+MAX_DISK_ENTRIES = 5000
+
+# Por quanto tempo, após expirar, uma entrada ainda pode ser servida
+# enquanto é revalidada em segundo plano
+STALE_GRACE_SECONDS = 24 * 3600
+
+# Validade de respostas "Nenhum resultado" (só em memória)
+NEGATIVE_TTL_SECONDS = 30
+
+# Faixa aceita para o max-age informado pelo servidor: buscadores
+# costumam mandar no-cache, o que zeraria o cache se levado à risca
+MIN_HTTP_TTL_SECONDS = 60
+MAX_HTTP_TTL_SECONDS = 7 * 24 * 3600
+
+# Frequência da limpeza de entradas vencidas no disco
+PURGE_INTERVAL = 300
+
+
+@dataclass
+class CacheEntry:
+    result: WebResult
+    fresh_until: float
+    stale_until: float
+    size: int = 0
+    query: str = ""  # consulta original que gerou a entrada
+
+    def is_fresh(self, now: float) -> bool:
+        return now <= self.fresh_until
 
 
 class WebCache:
-    def __init__(self):
-        self._store: dict[str, tuple[float, WebResult]] = {}
+    """
+    Cache de resultados web em duas camadas:
+    - memória: LRU limitado por bytes
+    - disco: SQLite, sobrevive a reinícios
+
+    A chave é a forma canônica da consulta (canonical_query), então
+    variações de acento, pontuação e stopwords compartilham a mesma
+    entrada; stats()["collisions"] mede quanto isso rende.
+
+    O TTL de cada resultado vem do Cache-Control da origem, quando
+    houver, ou da confiança (ttl_for). Depois de expirar, a entrada
+    ainda fica disponível como "stale" por STALE_GRACE_SECONDS:
+    lookup() a devolve marcada, e o chamador decide se a revalida em
+    segundo plano.
+    """
+
+    def __init__(
+        self,
+        db_path: Path | None = CACHE_FILE,
+        default_ttl: int = 3600,
+        max_memory_bytes: int = MAX_MEMORY_BYTES,
+        stemming: bool = True,
+    ):
+        self.default_ttl = default_ttl
+        self.max_memory_bytes = max_memory_bytes
+        self._memory: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._last_purge = 0.0
+        self.stemming = stemming
+
+        # hits: encontrados; misses: não encontrados; collisions: hits
+        # cuja consulta original difere da atual (ganho da normalização)
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+
+        self._conn: sqlite3.Connection | None = None
+        if db_path is not None:
+            try:
+                db_path = Path(db_path)
+                db_path.parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+                self._init_schema()
+            except (sqlite3.Error, OSError):
+                # Sem disco o cache segue apenas em memória
+                self._conn = None
+
+    @classmethod
+    def from_config(cls, config: Config) -> "WebCache":
+        return cls(default_ttl=config.WEB_CACHE_TTL_SECONDS)
 
     def _make_key(self, query: str) -> str:
-        normalized = query.lower().strip()
+        normalized = canonical_query(query, stemming=self.stemming)
         return hashlib.sha256(normalized.encode()).hexdigest()
 
-    def get(self, query: str) -> Optional[WebResult]:
+    def key_for(self, query: str) -> str:
+        """Chave de cache da consulta (também usada para coalescer buscas)."""
+        return self._make_key(query)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "collisions": self.collisions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+            }
+
+    # -------------------------
+    # API pública
+    # -------------------------
+    def ttl_for(self, result: WebResult) -> int:
+        """
+        Se as respostas de origem trouxeram um Cache-Control: max-age
+        positivo (result.max_age), ele define o TTL, dentro da faixa
+        MIN_HTTP_TTL_SECONDS..MAX_HTTP_TTL_SECONDS. Senão (sem cabeçalho,
+        ou no-cache/no-store, que chegam como 0), resultados de alta
+        confiança (resumos/abstracts) duram o TTL configurado; parciais
+        ou fracos, uma fração dele.
+        """
+        max_age = getattr(result, "max_age", None)
+        if max_age:
+            return min(MAX_HTTP_TTL_SECONDS, max(MIN_HTTP_TTL_SECONDS, max_age))
+
+        confidence = getattr(result, "confidence", 0.0) or 0.0
+        if confidence >= 0.85:
+            return self.default_ttl
+        if confidence >= 0.6:
+            return self.default_ttl // 2
+        return max(60, self.default_ttl // 6)
+
+    def lookup(self, query: str) -> Optional[CacheEntry]:
+        """Entrada fresca ou stale (dentro da carência); None = miss."""
         key = self._make_key(query)
-        if key not in self._store:
-            return None
+        now = time.time()
 
-        expires_at, result = self._store[key]
-        if time.time() > expires_at:
-            del self._store[key]
-            return None
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if now > entry.stale_until:
+                    self._drop_memory(key)
+                    entry = None
+                else:
+                    self._memory.move_to_end(key)
+                    self._count(entry, query)
+                    return entry
 
-        return result
+        entry = self._load(key, now)
+        with self._lock:
+            if entry is not None:
+                self._remember(key, entry)
+            self._count(entry, query)
+        return entry
+
+    def get(self, query: str) -> Optional[WebResult]:
+        """Apenas resultados frescos (compatível com a API antiga)."""
+        entry = self.lookup(query)
+        if entry is None or not entry.is_fresh(time.time()):
+            return None
+        return entry.result
 
-    def set(self, query: str, result: WebResult, ttl: int = 300):
+    def set(self, query: str, result: WebResult, ttl: int | None = None):
         # Não cachear resultados sem conteúdo textual relevante
         try:
             if not getattr(result, "content", None):
@@ -33,5 +184,159 @@ class WebCache:
             return
 
         key = self._make_key(query)
-        expires_at = time.time() + ttl
-        self._store[key] = (expires_at, result)
+        now = time.time()
+        fresh_until = now + (ttl if ttl is not None else self.ttl_for(result))
+        payload = json.dumps(asdict(result), ensure_ascii=False)
+        entry = CacheEntry(
+            result=result,
+            fresh_until=fresh_until,
+            stale_until=fresh_until + STALE_GRACE_SECONDS,
+            size=len(payload.encode("utf-8")),
+            query=query,
+        )
+
+        with self._lock:
+            self._remember(key, entry)
+            self._store(key, query, payload, entry, now)
+
+    def set_negative(self, query: str, result: WebResult, ttl: int = NEGATIVE_TTL_SECONDS):
+        """
+        Guarda por pouco tempo uma resposta sem resultado, para que
+        consultas que falham não repitam a busca a cada chamada.
+        Fica só em memória e nunca é servida como stale.
+
+        Se a consulta já tem um resultado (fresco ou stale), a falha é
+        descartada: uma revalidação que falhou não pode esconder a
+        resposta stale atrás de "Nenhum resultado".
+        """
+        key = self._make_key(query)
+        now = time.time()
+        with self._lock:
+            current = self._memory.get(key)
+        if current is None:
+            current = self._load(key, now)
+        if current is not None and now <= current.stale_until and current.stale_until > current.fresh_until:
+            return
+
+        expires = now + ttl
+        entry = CacheEntry(
+            result=result,
+            fresh_until=expires,
+            stale_until=expires,
+            size=len(getattr(result, "content", "") or "") + len(query),
+            query=query,
+        )
+        with self._lock:
+            self._remember(key, entry)
+
+    def _count(self, entry: Optional[CacheEntry], query: str) -> None:
+        if entry is None:
+            self.misses += 1
+            return
+        self.hits += 1
+        if entry.query.lower().strip() != query.lower().strip():
+            self.collisions += 1
+
+    # -------------------------
+    # Memória
+    # -------------------------
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        self._drop_memory(key)
+        if entry.size > self.max_memory_bytes:
+            return
+        self._memory[key] = entry
+        self._memory_bytes += entry.size
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.size
+
+    def _drop_memory(self, key: str) -> None:
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= old.size
+
+    # -------------------------
+    # Disco
+    # -------------------------
+    def _init_schema(self) -> None:
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                query TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                fresh_until REAL NOT NULL,
+                stale_until REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS entries_stale ON entries (stale_until);
+            """
+        )
+        self._conn.commit()
+
+    def _load(self, key: str, now: float) -> Optional[CacheEntry]:
+        if self._conn is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT payload, fresh_until, stale_until, query FROM entries "
+                    "WHERE key = ? AND stale_until >= ?",
+                    (key, now),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None:
+            return None
+
+        payload, fresh_until, stale_until, query = row
+        try:
+            result = _result_from_json(payload)
+        except (ValueError, TypeError):
+            return None
+        return CacheEntry(result, fresh_until, stale_until, len(payload.encode("utf-8")), query)
+
+    def _store(self, key: str, query: str, payload: str, entry: CacheEntry, now: float) -> None:
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, query, payload, fresh_until, stale_until) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, query, payload, entry.fresh_until, entry.stale_until),
+            )
+            if now - self._last_purge > PURGE_INTERVAL:
+                self._purge(now)
+            self._conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def _purge(self, now: float) -> None:
+        self._last_purge = now
+        self._conn.execute("DELETE FROM entries WHERE stale_until < ?", (now,))
+        self._conn.execute(
+            "DELETE FROM entries WHERE key IN ("
+            " SELECT key FROM entries ORDER BY stale_until DESC LIMIT -1 OFFSET ?)",
+            (MAX_DISK_ENTRIES,),
+        )
+
+
+def _result_from_json(payload: str) -> WebResult:
+    data = json.loads(payload)
+    known = {f.name for f in fields(WebResult)}
+    return WebResult(**{k: v for k, v in data.items() if k in known})
+
+
+_cache: Optional[WebCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_web_cache(config: Config | None = None) -> WebCache:
+    """
+    Cache compartilhado do plugin web. A configuração da primeira
+    chamada define o TTL base (Config.WEB_CACHE_TTL_SECONDS).
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = WebCache.from_config(config or Config())
+        return _cache
@@ -0,0 +1,84 @@
+"""
+Micro-benchmark do extrator de resultados do DuckDuckGo HTML.
+
+Compara o extrator de passada única (html_extract) com a abordagem
+antiga por regex (findall no documento inteiro + limpeza de tags por
+item, como em diagnose_llm.py).
+
+Uso:
+    python bench_html_extract.py [pagina.html ...]
+
+Sem argumentos, usa duck_debug.html e uma página sintética com 30
+resultados (incluindo anúncios) no layout do html.duckduckgo.com.
+"""
+import re
+import sys
+import timeit
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+from Jarvis.plugins_available.web.html_extract import extract_results
+
+
+RESULT_TEMPLATE = """
+<div class="result results_links results_links_deep web-result {extra}">
+  <div class="links_main links_deep result__body">
+    <h2 class="result__title">
+      <a rel="nofollow" class="result__a" href="//duckduckgo.com/l/?uddg={url}&amp;rut=abc">Resultado <b>{i}</b> sobre cota&ccedil;&atilde;o</a>
+    </h2>
+    <div class="result__extras"><a class="result__url" href="{url}">site{i}.com.br</a></div>
+    <a class="result__snippet" href="{url}">Trecho {i} com a <b>cotação</b> do dólar e outras informações relevantes.</a>
+  </div>
+</div>
+"""
+
+
+def synthetic_page(results: int = 30) -> str:
+    body = "".join(
+        RESULT_TEMPLATE.format(
+            i=i,
+            url=quote(f"https://site{i}.com.br/cotacao?utm_source=ddg", safe=""),
+            extra="result--ad" if i % 10 == 0 else "",
+        )
+        for i in range(results)
+    )
+    return f"<html><head><title>DDG</title></head><body><div id='links'>{body}</div></body></html>"
+
+
+def legacy_extract(html: str, limit: int = 3):
+    links = re.findall(r'<a[^>]+class="result__a"[^>]+href="([^"]+)"[^>]*>(.*?)</a>', html, re.S)
+    snippets = re.findall(r'<a[^>]+class="result__snippet"[^>]+href="[^"]+"[^>]*>(.*?)</a>', html, re.S)
+
+    hits = []
+    for i in range(min(len(links), len(snippets), 10)):
+        url = links[i][0]
+        if "uddg=" in url:
+            url = unquote(url.split("uddg=")[1].split("&")[0])
+        title = re.sub(r"<[^>]+>", "", links[i][1])
+        snippet = re.sub(r"<[^>]+>", "", snippets[i])
+        hits.append((title, url, snippet))
+        if len(hits) >= limit:
+            break
+    return hits
+
+
+def main(paths):
+    pages = {}
+    for path in paths or ["duck_debug.html"]:
+        p = Path(path)
+        if p.exists():
+            pages[p.name] = p.read_text(encoding="utf-8", errors="replace")
+    if not paths:
+        pages["synthetic-30"] = synthetic_page()
+
+    number = 2000
+    print(f"{'página':<20} {'bytes':>8} {'regex (µs)':>12} {'extrator (µs)':>12} {'hits':>5}")
+    for name, html in pages.items():
+        legacy = timeit.timeit(lambda: legacy_extract(html), number=number) / number * 1e6
+        single = timeit.timeit(lambda: extract_results(html, limit=3), number=number) / number * 1e6
+        hits = len(extract_results(html, limit=3))
+        print(f"{name:<20} {len(html):>8} {legacy:>12.1f} {single:>12.1f} {hits:>5}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])